@@ -6,22 +6,49 @@ from pokemon_legacy.main import *
 
 if __name__ == "__main__":
     import argparse
+    import atexit
     import pygame as pg
     from pokemon_legacy.game import Game, GameConfig
+    from pokemon_legacy.engine.data.save_file import SaveError, SaveFile, list_slots
+    from pokemon_legacy.engine.battle.battle_speed import BattleSpeed
     from pokemon_legacy.engine.general.utils import map_properties
+    from pokemon_legacy.engine.general.profiler import profiler, PROFILE_MODES, REGIONS
+    from pokemon_legacy.engine.graphics.surface_registry import surface_registry
     import json
-    import pickle
+    import time
 
     parser = argparse.ArgumentParser()
     parser.add_argument("-n", "--new", action="store_true")
     parser.add_argument("-o", "--overwrite", action="store_false")
 
     parser.add_argument("-e", "--explore-mode", action="store_true")
-    parser.add_argument("-l", "--lazy-load", action="store_true")
+    parser.add_argument("-l", "--lazy-load", action="store_true",
+                        help="load the images of saved Pokémon when they are first drawn")
     parser.add_argument('-r', '--render-mode', action='count', default=0)
+    parser.add_argument("-b", "--battle-speed", default="1", choices=["1", "2", "4", "instant"])
+    parser.add_argument("--benchmark-startup", action="store_true",
+                        help="start a new game, print the startup task timings and exit")
+    parser.add_argument("-t", "--telemetry", action="store_true",
+                        help="record frame timings and write their percentiles to the log directory on exit")
+    parser.add_argument("--profile", nargs="?", const="cpu", choices=PROFILE_MODES,
+                        help="profile the game: cpu writes pstats and sampled stacks, alloc traces allocations")
+    parser.add_argument("--profile-out", default=os.path.join("assets", "data", "logs", "profile"),
+                        help="the path of the profile files, without extension")
+    parser.add_argument("--profile-region", action="append", choices=REGIONS,
+                        help="only profile these regions of the game, can be given more than once")
+    parser.add_argument("--surface-report", action="store_true",
+                        help="print the memory held by surfaces by subsystem on exit, and write it to the log directory")
+    parser.add_argument("-s", "--slot", type=int, default=1, help="the save slot to load and save")
+    parser.add_argument("--list-slots", action="store_true", help="print the save slots and exit")
 
     args = parser.parse_args()
 
+    if args.list_slots:
+        for slot, header in list_slots().items():
+            print(f"{slot:>3}  {header.player_name or '-':<10} {header.play_time_str:>6}  {header.game_state:<24} "
+                  f"{header.map_name or '-':<20} party {header.party}  saved {header.saved_at}")
+        sys.exit(0)
+
     pg.init()
     pg.event.pump()
     pg.display.set_mode((800, 600))
@@ -31,29 +58,61 @@ if __name__ == "__main__":
     cfg = GameConfig(
         graphics_scale=2.0,
         text_speed=3.0,
+        battle_speed=BattleSpeed.from_string(args.battle_speed),
         render_mode=args.render_mode,
         explore_mode=args.explore_mode,
-        save_slot=1
+        lazy_load=args.lazy_load,
+        telemetry=args.telemetry,
+        save_slot=args.slot
     )
 
-    if args.new:
-        game = Game(
-            overwrite=args.overwrite,
-            save_slot=1,
-            new=args.new,
-            cfg=cfg,
-        )
-    else:
-        save_dir = f"assets/data/save_states/save_state_{cfg.save_slot}/"
-        try:
-            with open(save_dir + "game_temp.pickle", "rb") as f:
-                game = pickle.load(f)
-        except (FileNotFoundError, EOFError):
-             # Fallback if save corrupted or missing, start new game logic might be needed or just fail
-             print("Save file not found or corrupted, starting new game")
-             game = Game(overwrite=args.overwrite, save_slot=1, new=True, cfg=cfg)
-
-    game.loop()
+    profiler.configure(args.profile, out=args.profile_out, regions=args.profile_region)
+    def write_profile():
+        for path in profiler.stop():
+            print(f"profile written to {path}")
+
+    if profiler.enabled:
+        # the game can exit from inside the loop, so the profile is written on exit
+        atexit.register(write_profile)
+        profiler.start()
+
+    def write_surface_report():
+        print(surface_registry.report())
+        path = os.path.join("assets", "data", "logs", f"surfaces_{time.strftime('%Y-%m-%d_%H-%M-%S')}.json")
+        print(f"surface report written to {surface_registry.write(path)}")
+
+    if args.surface_report:
+        atexit.register(write_surface_report)
+
+    with profiler.region("startup"):
+        if args.benchmark_startup:
+            game = Game(overwrite=False, save_slot=1, new=True, cfg=cfg)
+            print(game.startup.report())
+            sys.exit(0)
+
+        if args.new:
+            game = Game(
+                overwrite=args.overwrite,
+                save_slot=cfg.save_slot,
+                new=args.new,
+                cfg=cfg,
+            )
+        else:
+            try:
+                # loads the save slot, or starts a new game if it is empty
+                game = Game(overwrite=args.overwrite, save_slot=cfg.save_slot, cfg=cfg)
+            except SaveError as e:
+                # keep the unreadable slot, the new game would otherwise save over it
+                moved = SaveFile.for_slot(cfg.save_slot).move_aside()
+                print(f"Save file could not be read ({e}), it was moved to {moved}, starting new game")
+                game = Game(overwrite=args.overwrite, save_slot=cfg.save_slot, new=True, cfg=cfg)
+
+    try:
+        game.loop()
+    except Exception:
+        crash_log = game.log.dump(os.path.join(game.log_dir, f"crash_{time.strftime('%Y-%m-%d_%H-%M-%S')}.jsonl"))
+        print(f"The game crashed, its most recent events were written to {crash_log}")
+        raise
 
     object_map = map_properties(game.rival, filter_types=[pg.Surface])
     print("writing file")
@@ -0,0 +1,4 @@
+import os
+
+ASSET_PATH = os.path.join(os.path.dirname(__file__), '../../assets')
+DATA_PATH = os.path.join(ASSET_PATH, 'data')
@@ -6,8 +6,9 @@ import pygame as pg
 import numpy as np
 from pokemon_legacy.engine.general.image_editor import ImageEditor
 
+from pokemon_legacy.engine.battle.battle_speed import BattleSpeed
 from pokemon_legacy.engine.general.Environment import Environment
-from pokemon_legacy.engine.general.utils import Colours, create_display_bar, BlitLocation
+from pokemon_legacy.engine.general.utils import Colours, BlitLocation, BAR_WIDTHS, get_bar_surface
 from pokemon_legacy.engine.graphics.screen_V2 import Screen, FontOption
 from pokemon_legacy.engine.graphics.sprite_screen import SpriteScreen, PokeballCatchAnimation
 from pokemon_legacy.engine.pokemon.pokemon import Pokemon
@@ -45,6 +46,11 @@ class StatContainer(pg.sprite.Sprite, Screen):
         # ======= Add base features =========
         self.add_text_2(self.pokemon.name, pg.Vector2((16, 5) if self.friendly else (5, 5)) * self.scale, base=True)
 
+        self.hp_bar_pos = pg.Vector2(62 if self.friendly else 50, 20) * self.scale
+        self.exp_bar_pos = pg.Vector2(30, 38) * self.scale
+        self.hp_text_pos = pg.Vector2(115, 36) * self.scale
+        self.hp_text_rect: None | pg.Rect = None
+
         self.update()
 
         self.pos_update = time.monotonic()
@@ -53,29 +59,60 @@ class StatContainer(pg.sprite.Sprite, Screen):
     def update(self):
         """ Refresh the information shown on the container """
         self.refresh()
+        self.hp_text_rect = None
 
         # pokemon level
         self.addText(f"Lv{self.pokemon.level}", pg.Vector2(70, 8) * self.scale, fontOption=FontOption.level)
 
-        # pokemon health
-        hp_bar = create_display_bar(self.pokemon.health, self.pokemon.stats.health, "HP")
-        self.add_image(hp_bar, pg.Vector2(62 if self.pokemon.friendly else 50, 20) * self.scale, scale=self.scale)
+        self.draw_bars()
+
+        self.image = self.get_surface()
+
+    def update_bars(self):
+        """ Redraw only the health/exp bars (and health text) on the container image, e.g. while they animate """
+        for rect in self.draw_bars():
+            self.image.fill((0, 0, 0, 0), rect)
+            self.image.blit(self.base_surface, rect, rect)
+            self.image.blit(self.surface, rect, rect)
+
+    def draw_bars(self) -> list[pg.Rect]:
+        """
+        Draw the health and exp bars (and health text) onto the container surface.
+
+        :return: the regions of the container that were redrawn
+        """
+        dirty = [self._draw_bar("HP", self.pokemon.health, self.pokemon.stats.health, self.hp_bar_pos)]
 
         if self.pokemon.friendly:
             current_exp = self.pokemon.exp - self.pokemon.level_exp
             max_exp = self.pokemon.level_up_exp - self.pokemon.level_exp
+            dirty.append(self._draw_bar("XP", current_exp, max_exp, self.exp_bar_pos))
 
-            exp_bar = create_display_bar(current_exp, max_exp, "XP")
-            self.add_image(exp_bar, pg.Vector2(30, 38) * self.scale, scale=self.scale)
-
-            self.addText(
-                text=f"{floor(self.pokemon.health)}/{self.pokemon.stats.health}",
-                pos=pg.Vector2(115, 36) * self.scale,
-                location=BlitLocation.bottomRight,
-                fontOption=FontOption.level
+            text_surf = FontOption.level.value.render_text(
+                f"{floor(self.pokemon.health)}/{self.pokemon.stats.health}", lineCount=1
             )
+            text_rect = text_surf.get_rect(bottomright=self.hp_text_pos)
+            dirty_rect = text_rect.union(self.hp_text_rect) if self.hp_text_rect else text_rect
 
-        self.image = self.get_surface()
+            self.surface.fill((0, 0, 0, 0), dirty_rect)
+            self.surface.blit(text_surf, text_rect)
+            self.hp_text_rect = text_rect
+            dirty.append(dirty_rect)
+
+        return dirty
+
+    def _draw_bar(self, bar_type: str, val: float, max_val: float, pos: pg.Vector2) -> pg.Rect:
+        ratio = min(1, max(0, val / max_val))
+        bar_surf = get_bar_surface(bar_type, ratio)
+
+        region = pg.Rect(pos, (BAR_WIDTHS[bar_type] * self.scale, bar_surf.get_height() * self.scale))
+        self.surface.fill((0, 0, 0, 0), region)
+
+        width = int(region.width * ratio)
+        if width:
+            self.surface.blit(pg.transform.scale(bar_surf, (width, region.height)), region.topleft)
+
+        return region
 
     def update_pos(self):
         now = time.monotonic()
@@ -155,16 +192,18 @@ class LevelUpBox(pg.sprite.Sprite, Screen):
 
 
 class BattleDisplayMain(SpriteScreen):
-    def __init__(self, window, size, time, environment: Environment, scale=2):
+    def __init__(self, window, size, time, environment: Environment, scale=2, speed=BattleSpeed.normal):
         """
         This is the menu battle display. The native screen size is 256x192 px
         :param window: The pygame surface to blit the display onto
         :param size: the size of the display
         :param time: the time of day, used to configure the battle background option
         :param environment:
+        :param speed: the battle speed, which scales (or skips) the display animations
         """
         super().__init__(size, colour=Colours.black)
         self.scale = scale
+        self.speed = speed
 
         self.layer_names = ["background", "stats", "animations", "text"]
 
@@ -242,9 +281,16 @@ class BattleDisplayMain(SpriteScreen):
             # draw the health onto the screen
             self.screens["stats"].get_object("friendly_stats").update()
 
+    def update_stat_bars(self):
+        """ Redraw just the health/exp bars of the visible Pokémon """
+        for pokemon, sprite_id in [(self.foe, "foe_stats"), (self.friendly, "friendly_stats")]:
+            if pokemon.visible:
+                self.screens["stats"].get_object(sprite_id).update_bars()
+
     def intro_animations(self, window: pg.Surface, duration):
         self.render_pokemon_details()
-        if self.foe.animation:
+        duration = self.speed.scale(duration)
+        if self.foe.animation and not self.speed.is_instant:
             frames = len(self.foe.animation)
             for frame in self.foe.animation:
                 self.foe.image = frame
@@ -262,8 +308,13 @@ class BattleDisplayMain(SpriteScreen):
         pg.display.flip()
 
     def catch_animation(self, duration, checks):
+        if self.speed.is_instant:
+            # the pokemon is hidden inside the ball until the result is known
+            self.foe.set_opacity(0)
+            return
+
         frames = 100
-        timePerFrame = duration / frames
+        timePerFrame = self.speed.scale(duration) / frames
         images = 22
 
         # the proportion of frames for each of the 21 images!
@@ -295,7 +346,7 @@ class BattleDisplayMain(SpriteScreen):
             animation.update(frame)
 
             if animation.image_idx == 10:
-                self.foe.image.set_alpha(0)
+                self.foe.set_opacity(0)
 
             self.refresh()
             # self.render_pokemon_details()
@@ -317,7 +368,7 @@ class BattleDisplayMain(SpriteScreen):
                 self.window.blit(self.get_surface(), (0, 0))
                 pg.display.flip()
                 pg.time.delay(int(timePerFrame))
-            pg.time.delay(500)
+            pg.time.delay(self.speed.scale(500))
 
         if checks != 3:
             # break free!
@@ -355,7 +406,8 @@ class BattleDisplayMain(SpriteScreen):
 
     def render_pokemon_animation(self, window, target: Pokemon, animation_type: str, duration=2000):
         self.render_pokemon_details()
-        if target.sprite.animations[animation_type]:
+        duration = self.speed.scale(duration)
+        if target.sprite.animations[animation_type] and not self.speed.is_instant:
             frames = len(target.sprite.animations[animation_type])
             for frame in target.sprite.animations[animation_type]:
                 target.image = frame
@@ -7,7 +7,7 @@ from pokemon_legacy.engine.pokemon.pokemon import PokemonSpriteSmall
 import pygame as pg
 from enum import Enum
 
-from pokemon_legacy.engine.general.utils import create_display_bar
+from pokemon_legacy.engine.general.utils import create_display_bar, get_bar_surface
 from pokemon_legacy.engine.general.item import Pokeball, MedicineItem, BattleItemType
 from pokemon_legacy.engine.general.Move import Move2
 # from bag import BagV2
@@ -144,15 +144,7 @@ class PokemonContainerTeam(DisplayContainer):
 
         bar_rect = pg.Rect(pg.Vector2(63, 24), pg.Vector2(48 * health_ratio, 4))
 
-        if health_ratio > 0.5:
-            colour = "high"
-        elif health_ratio > 0.25:
-            colour = "medium"
-        else:
-            colour = "low"
-
-        health_bar = pg.image.load(f"assets/battle/main_display/health_bar/health_{colour}.png")
-        health_bar = pg.transform.scale(health_bar, bar_rect.size)
+        health_bar = pg.transform.scale(get_bar_surface("HP", health_ratio), bar_rect.size)
         bar_pos = pg.Vector2(63, 23) if self.primary else pg.Vector2(63, 24)
         self.add_image(health_bar, pos=bar_pos * self.scale, scale=pg.Vector2(self.scale, self.scale))
         self.addText(f"{self.pokemon.health}/{self.pokemon.stats.health}", pg.Vector2(72, 32) * self.scale,
@@ -16,6 +16,10 @@ from pokemon_legacy.displays.menu.menu_display_popup import MenuDisplayPopup
 from pokemon_legacy.engine.game_world.route_orchestrator import RouteOrchestrator
 from pokemon_legacy.engine.game_world.tiled_map import TiledMap2, MapLinkTile, WallTile
 from pokemon_legacy.engine.game_world.tiled_building import TiledBuilding
+from pokemon_legacy.engine.game_world.game_obejct import PokeballTile
+from pokemon_legacy.engine.characters.trainer import Trainer
+from pokemon_legacy.engine.general.profiler import profiler
+from pokemon_legacy.engine.general.telemetry import telemetry
 
 from pokemon_legacy.engine.errors import MapError
 
@@ -80,6 +84,9 @@ class GameDisplay(SpriteScreen):
 
         self.last_refresh_time = time.monotonic()
 
+        # ids of the items picked up on each map, see collect_item
+        self.collected_items: dict[str, list[int | str]] = {}
+
     @property
     def map(self):
         active_map = self._active_map_collection.map
@@ -100,6 +107,7 @@ class GameDisplay(SpriteScreen):
         else:
             self._active_map_collection = new_map.parent_collection
 
+    @telemetry.timed("game_display.get_surface")
     def get_surface(
             self,
             show_sprites: bool = True,
@@ -124,6 +132,7 @@ class GameDisplay(SpriteScreen):
 
         return display_surf
 
+    @telemetry.timed("game_display.update")
     def update(
             self,
             force_refresh: bool = False
@@ -315,57 +324,63 @@ class GameDisplay(SpriteScreen):
 
             edges = self.map.detect_map_edge()
             joint_maps = self._active_map_collection._get_adjoining_maps(edges)
+            # walking along the edge of a map renders its neighbours, and may cross into them
+            with profiler.region("map_transition", when=joint_maps is not None):
+                self._step(direction, window, joint_maps, frames, duration)
 
-            render_maps = [self.map]
+        trainer = self.map.check_trainer_collision()
 
-            if joint_maps is not None:
-                render_maps += [_map.active_floor if isinstance(_map, TiledBuilding) else _map for _map in joint_maps]
+        map_obj = trainer if trainer is not None else map_obj
+        
+        # Move follower to player's previous position if player moved
+        if moved and self.player.has_follower:
+            self.move_follower(self.player, window)
 
-                new_map, map_link = list(joint_maps.items())[0]
+        return map_obj, moved, edge
 
-                player_diff = self.player.map_positions[self.map] - map_link[self.map.map_name]
-                new_map_pos = map_link[new_map.map_name] + player_diff
-                self.player.map_positions[new_map] = new_map_pos
+    def _step(self, direction: Direction, window, joint_maps, frames: int, duration: int):
+        """ Animate one step of the player, crossing into the adjoining map if the step leaves the active map """
+        render_maps = [self.map]
 
-            start_positions = {_map: self.player.map_positions[_map] for _map in render_maps}
+        if joint_maps is not None:
+            render_maps += [_map.active_floor if isinstance(_map, TiledBuilding) else _map for _map in joint_maps]
 
-            for frame in range(frames):
-                frame_start = pg.time.get_ticks()
+            new_map, map_link = list(joint_maps.items())[0]
 
-                for _map, map_start in start_positions.items():
-                    self.player.map_positions[_map] = map_start + direction.value * frame / frames
-                    _map.render(start_pos=map_start, camera_offset=self.camera_offset)
+            player_diff = self.player.map_positions[self.map] - map_link[self.map.map_name]
+            new_map_pos = map_link[new_map.map_name] + player_diff
+            self.player.map_positions[new_map] = new_map_pos
 
-                window.blit(self.get_surface(), (0, 0))
-                pg.display.flip()
-                frame_dur = pg.time.get_ticks() - frame_start
-                pg.time.delay(int(duration / frames) - frame_dur)
+        start_positions = {_map: self.player.map_positions[_map] for _map in render_maps}
 
-            self.player._leg = not self.player._leg
+        for frame in range(frames):
+            frame_start = pg.time.get_ticks()
 
             for _map, map_start in start_positions.items():
-                self.player.map_positions[_map] = map_start + direction.value
-                _map.render(camera_offset=self.camera_offset)
+                self.player.map_positions[_map] = map_start + direction.value * frame / frames
+                _map.render(start_pos=map_start, camera_offset=self.camera_offset)
 
-            player_pos = self.player.map_positions[self.map]
-            if not self.map.border_rect.collidepoint(player_pos):
-                if joint_maps is not None:
-                    new_map, map_link = list(joint_maps.items())[0]
+            window.blit(self.get_surface(), (0, 0))
+            pg.display.flip()
+            telemetry.frame()
+            frame_dur = pg.time.get_ticks() - frame_start
+            pg.time.delay(int(duration / frames) - frame_dur)
 
-                    self.map = new_map
+        self.player._leg = not self.player._leg
 
-                    route_popup = RoutePopup(self.map.map_name, scale=self.scale)
-                    self.sprites.add(route_popup)
+        for _map, map_start in start_positions.items():
+            self.player.map_positions[_map] = map_start + direction.value
+            _map.render(camera_offset=self.camera_offset)
 
-        trainer = self.map.check_trainer_collision()
+        player_pos = self.player.map_positions[self.map]
+        if not self.map.border_rect.collidepoint(player_pos):
+            if joint_maps is not None:
+                new_map, map_link = list(joint_maps.items())[0]
 
-        map_obj = trainer if trainer is not None else map_obj
-        
-        # Move follower to player's previous position if player moved
-        if moved and self.player.has_follower:
-            self.move_follower(self.player, window)
+                self.map = new_map
 
-        return map_obj, moved, edge
+                route_popup = RoutePopup(self.map.map_name, scale=self.scale)
+                self.sprites.add(route_popup)
 
     def get_map_collections(self):
         cols = [self.route_orchestrator]
@@ -399,6 +414,47 @@ class GameDisplay(SpriteScreen):
             "collection_name": self.map.parent_collection.collection_name,
         }
 
+    @staticmethod
+    def _map_key(_map: TiledMap2) -> str:
+        return f"{_map.parent_collection.collection_name}/{_map.map_name}"
+
+    def collect_item(self, item: PokeballTile) -> None:
+        """ Remove an item from the active map, remembering it so it stays collected when the game is loaded """
+        self.collected_items.setdefault(self._map_key(self.map), []).append(item.obj_id)
+        item.kill()
+
+    def get_map_state(self) -> dict[str, dict]:
+        """ Return the state of each map that has changed during the game: battled trainers and collected items """
+        state = {}
+        for collection in self.get_map_collections():
+            for _map in collection.maps:
+                key = self._map_key(_map)
+                battled = [trainer.trainer_id for trainer in _map.get_sprite_types(Trainer) if trainer.battled]
+                collected = self.collected_items.get(key, [])
+                if battled or collected:
+                    state[key] = {"battled_trainers": battled, "collected_items": collected}
+
+        return state
+
+    def load_map_state(self, state: dict[str, dict]) -> None:
+        """ Apply the saved state of each map """
+        for key, map_state in state.items():
+            collection_name, map_name = key.split("/", 1)
+            _map = self.get_map(map_name, collection_name)
+            if _map is None:
+                continue
+
+            battled = set(map_state.get("battled_trainers", []))
+            for trainer in _map.get_sprite_types(Trainer):
+                if trainer.trainer_id in battled:
+                    trainer.battled = True
+
+            collected = set(map_state.get("collected_items", []))
+            for item in _map.get_sprite_types(PokeballTile):
+                if item.obj_id in collected:
+                    item.kill()
+            self.collected_items[key] = list(collected)
+
     def load_from_state(
             self,
             state: dict
@@ -2,6 +2,7 @@ from math import ceil
 
 import pygame as pg
 
+from pokemon_legacy.engine.general.utils import Colours
 from pokemon_legacy.engine.graphics.screen_V2 import Screen, BlitLocation
 
 
@@ -17,6 +18,8 @@ class LoadDisplay:
         self.topScreen.refresh()
         self.bottomScreen.refresh()
 
+        self.progress = 0.0
+
     def updateAnimationLocation(self, directory):
         self.bottomScreen.refresh()
         self.bottomScreen.addText("Loading Animations", pos=(256, 50), location=BlitLocation.centre)
@@ -34,6 +37,27 @@ class LoadDisplay:
         self.bottomScreen.addText("Loading Foe Animations", pos=(256, 50), location=BlitLocation.centre)
         self.bottomScreen.addText(name.title(), pos=(256, 100), location=BlitLocation.centre)
 
+    def update_progress(self, progress: float, task_name: None | str = None):
+        """
+        Show the loading progress bar.
+
+        :param progress: the fraction of loading completed, between 0 and 1
+        :param task_name: the loading step that just finished
+        """
+        self.progress = min(1.0, max(0.0, progress))
+
+        self.bottomScreen.refresh()
+        self.bottomScreen.addText("Loading", pos=(256, 50), location=BlitLocation.centre)
+        if task_name:
+            self.bottomScreen.addText(task_name.title(), pos=(256, 100), location=BlitLocation.centre)
+
+        bar_rect = pg.Rect(56, 160, 400, 24)
+        fill_rect = bar_rect.inflate(-8, -8)
+        fill_rect.width = round(fill_rect.width * self.progress)
+
+        pg.draw.rect(self.bottomScreen.surface, Colours.black.value, bar_rect, width=2)
+        pg.draw.rect(self.bottomScreen.surface, Colours.green.value, fill_rect)
+
     def finish(self):
         self.bottomScreen.refresh()
         self.bottomScreen.addText("Finished Setup", pos=(256, 50), location=BlitLocation.centre)
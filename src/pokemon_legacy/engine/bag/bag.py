@@ -61,12 +61,8 @@ class BagV2:
         return json_data
 
     def add_item(self, item: Item, item_count: int = 1):
-        # check to identify if there is already an instance of the object
-        matching_item = next(
-            (bag_item for bag_item in self.data[item.item_type] if bag_item.name == item.name),
-            item
-        )
-        self.data[item.item_type][matching_item] += item_count
+        # items are equal by name, so this adds to an existing stack of the item when there is one
+        self.data.setdefault(item.item_type, Counter())[item] += item_count
 
 
 class BagV3(dict):
@@ -1,7 +1,6 @@
 import os
 import re
 
-import pandas as pd
 import pygame as pg
 from enum import Enum
 
@@ -9,6 +8,7 @@ from pokemon_legacy.engine.graphics.screen_V2 import BlitLocation, FontOption
 from pokemon_legacy.engine.bag.bag import BagV2
 from pokemon_legacy.engine.general.utils import Colours
 from pokemon_legacy.engine.general.item import ItemType, Item
+from pokemon_legacy.engine.data.records import ItemRecord
 from pokemon_legacy.engine.graphics.sprite_screen import SpriteScreen, DisplayContainer
 
 
@@ -99,11 +99,7 @@ class ItemSetContainer(DisplayContainer):
 
         bag_items = list(self.bag.get_items(item_type=item_type).items())
 
-        bag_items += [(Item(
-            pd.Series({"name": "Close","buy_price": None, "sell_price": None,
-                       "name_item_type": None, "name_battle_item_type":None}, name=100),
-            item_type
-        ), 0)]
+        bag_items += [(Item(ItemRecord(item_id=100, name="Close"), item_type), 0)]
 
         offset = max(0, item_idx-4)
 
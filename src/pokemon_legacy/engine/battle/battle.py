@@ -7,6 +7,10 @@ from math import floor
 from random import randint, choice
 
 from pokemon_legacy.game_logic.battle_action import BattleAttack, BattleTagIn
+from pokemon_legacy.engine.battle.battle_animation import animation_cache
+from pokemon_legacy.engine.battle.battle_speed import BattleSpeed
+from pokemon_legacy.engine.graphics.main_screen import CHAR_DELAY
+from pokemon_legacy.engine.graphics.tween import Tween
 from pokemon_legacy.displays.battle.battle_display_main import BattleDisplayMain, LevelUpBox
 from pokemon_legacy.displays.battle.battle_display_touch import *
 from pokemon_legacy.displays.battle.learn_move_display import LearnMoveDisplay
@@ -22,6 +26,7 @@ from pokemon_legacy.engine.pokemon.pokemon import Pokemon
 from pokemon_legacy.engine.pokemon.team import Team
 
 from pokemon_legacy.engine.characters.trainer import Trainer
+from pokemon_legacy.engine.general.telemetry import telemetry
 
 MODULE_PATH = resources.files(__package__)
 
@@ -78,6 +83,9 @@ class Battle:
         self.environment = pickle_data.environment if pickle_data else environment
         self.state = pickle_data.state if pickle_data else State.home
 
+        self.speed: BattleSpeed = BattleSpeed.normal
+        self.text_speed: float = 3.0
+
         self.battle_display: None | BattleDisplayMain = None
         self.touch_displays = None
         self.active_touch_display = None
@@ -99,13 +107,32 @@ class Battle:
     def active_pokemon(self):
         return [self.friendly, self.foe]
 
+    def preload_animations(self, pokemon: None | list[Pokemon] = None):
+        """
+        Start decoding the move animations of the given (default: active) pokemon on the animation
+        worker thread, so they are ready by the time the moves are used.
+
+        :param pokemon: the pokemon whose moves should be preloaded
+        """
+        pokemon = self.active_pokemon if pokemon is None else pokemon
+
+        keys = [BattleTagIn.cache_key(self.screenSize)]
+        for pk in pokemon:
+            target = self.foe if pk.friendly else self.friendly
+            keys += [BattleAttack.cache_key(move, target, self.battle_display.size) for move in pk.moves]
+
+        animation_cache.preload(keys)
+
     def load_displays(
             self,
             game
     ):
         self.game = game
 
-        self.battle_display = BattleDisplayMain(game.topSurf, self.screenSize, game.time_of_day, self.environment)
+        self.speed = game.cfg.battle_speed
+        self.text_speed = game.cfg.text_speed
+        self.battle_display = BattleDisplayMain(game.topSurf, self.screenSize, game.time_of_day, self.environment,
+                                                speed=self.speed)
         self.battle_display.add_pokemon_sprites(self.active_pokemon)
 
         self.touch_displays = {
@@ -138,6 +165,7 @@ class Battle:
         else:
             self.game.bottomSurf.blit(self.active_touch_display.get_surface(show_sprites=True), (0, 0))
 
+    @telemetry.timed("battle.update_screen")
     def update_screen(
             self,
             *,
@@ -148,6 +176,8 @@ class Battle:
         self.update_lower_screen(cover)
         if flip:
             pg.display.flip()
+            # the battle runs its own loop, each screen update is a frame
+            telemetry.frame()
 
     def learn_move(
             self,
@@ -178,13 +208,12 @@ class Battle:
 
     def wait(
             self,
-            *,
-            duration: int
+            duration: int | float
     ):
-        """ Wait for the given time in milliseconds """
+        """ Wait for the given time in milliseconds (scaled to the battle speed) """
         start = time.monotonic()
 
-        duration = duration / 1000
+        duration = self.speed.scale(duration) / 1000
         while time.monotonic() - start < duration:
             self.update_screen(cover=True)
 
@@ -198,9 +227,6 @@ class Battle:
 
         display_time, graphics_time, attack_time, effect_time = 1000, 500, 1000, 1000
 
-        frames = 100
-        attack_time_per_frame = attack_time / frames
-
         [damage, effective, inflictCondition, heal, modify, hits, crit] = attacker.use_move(move, target)
 
         damage = min([target.health, damage])
@@ -221,22 +247,10 @@ class Battle:
                 # self.battle_display.sprites.add(battle_attack)
                 self.battle_display.bounce_friendly_stat = False
 
-                if battle_attack.animation:
-                    print(battle_attack.frame_count)
-                    for frame in range(battle_attack.frame_count):
-                        battle_attack.frame_idx = frame
-                        battle_attack.update()
-                        if battle_attack.animation.frames:
-                            self.battle_display.screens["animations"].surface = battle_attack.get_animation_frame(frame)
-                        self.game.topSurf.blit(self.battle_display.get_surface(show_sprites=True), (0, 0))
-                        pg.display.flip()
-                        pg.time.delay(15)
-                        self.battle_display.refresh(text=False)
-
-                    self.battle_display.screens["animations"].refresh()
+                self.play_action_animation(battle_attack)
 
                 # Health reduction
-                self.reduce_health(target, damage, frames, attack_time_per_frame)
+                self.reduce_health(target, damage, attack_time)
                 self.battle_display.bounce_friendly_stat = True
 
         if heal:
@@ -271,7 +285,6 @@ class Battle:
 
         if not target.is_koed:
             if modify:
-                limit = False
                 if modify[3] == "Raise":
                     change = modify[0]
                     descriptor = "rose"
@@ -288,48 +301,7 @@ class Battle:
                 else:
                     modified = target
 
-                if modify[1] == "Attack":
-                    modified.stat_stages.attack += change
-                    if modified.stat_stages.attack < -6:
-                        modified.stat_stages.attack = -6
-                        limit = True
-                    elif modified.stat_stages.attack > 6:
-                        modified.stat_stages.attack = 6
-                        limit = True
-
-                elif modify[1] == "Defence":
-                    modified.stat_stages.defence += change
-                    if modified.stat_stages.defence < -6:
-                        modified.stat_stages.defence = -6
-                        limit = True
-                    elif modified.stat_stages.defence > 6:
-                        modified.stat_stages.defence = 6
-                        limit = True
-
-                elif modify[1] == "Sp Attack":
-                    modified.stat_stages.spAttack += change
-                    if modified.stat_stages.spAttack < -6:
-                        modified.stat_stages.spAttack = -6
-                        limit = True
-                    elif modified.stat_stages.spAttack > 6:
-                        modified.stat_stages.spAttack = 6
-                        limit = True
-                elif modify[1] == "Sp Defence":
-                    modified.stat_stages.spDefence += change
-                    if modified.stat_stages.spDefence < -6:
-                        modified.stat_stages.spDefence = -6
-                        limit = True
-                    elif modified.stat_stages.spDefence > 6:
-                        modified.stat_stages.spDefence = 6
-                        limit = True
-                elif modify[1] == "Speed":
-                    modified.stat_stages.speed += change
-                    if modified.stat_stages.speed < -6:
-                        modified.stat_stages.speed = -6
-                        limit = True
-                    elif modified.stat_stages.speed > 6:
-                        modified.stat_stages.speed = 6
-                        limit = True
+                limit = modified.modify_stat_stage(modify[1], change)
 
                 start = "" if modified.friendly else "The wild "
 
@@ -347,36 +319,47 @@ class Battle:
     def display_message(
             self,
             text: None | str,
-            *,
             duration: int = 1000
     ):
-        self.battle_display.update_display_text(text)
+        """
+        Type out a message in the battle text box at the game's text speed and hold it for the rest of the duration.
+        If no text is given, the current message is held instead. Both are scaled to the battle speed.
+        """
+        if text is not None:
+            self.battle_display.update_display_text(text)
         self.update_upper_screen()
         self.game.bottomSurf.blit(self.lowerScreenBase, (0, 0))
         pg.display.flip()
 
-        for char_idx in range(1, len(text)+1):
-            self.battle_display.update_display_text(text, max_chars=char_idx)
-            self.update_upper_screen()
-            self.game.bottomSurf.blit(self.lowerScreenBase, (0, 0))
-            pg.display.flip()
-            self.wait(round(duration * 0.7 / len(text)))
+        if self.speed.is_instant:
+            return
+
+        if text:
+            # type at the game's text speed, wait scales it to the battle speed
+            char_delay = CHAR_DELAY / self.text_speed
+            for char_idx in range(1, len(text)+1):
+                self.battle_display.update_display_text(text, max_chars=char_idx)
+                self.update_upper_screen()
+                self.game.bottomSurf.blit(self.lowerScreenBase, (0, 0))
+                pg.display.flip()
+                self.wait(char_delay)
 
-        self.wait(int(duration * 0.3))
+            self.wait(int(max(duration - char_delay * len(text), duration * 0.3)))
+        else:
+            self.wait(duration)
 
     def fade_out(
             self,
-            *,
             duration: int = 1000
     ):
         """ Fade the current screen to black """
         black_surf = pg.Surface(self.screenSize)
         black_surf.fill(Colours.black.value)
         black_surf.set_alpha(0)
-        count = 100
-        for t in range(0, count):
+        count = self.speed.frames(100)
+        for t in range(1, count + 1):
             black_surf.set_alpha(round(t / count * 255))
-            pg.time.delay(int(duration / count))
+            pg.time.delay(self.speed.scale(duration) // count)
             self.game.topSurf.blit(black_surf, (0, 0))
             self.game.bottomSurf.blit(black_surf, (0, 0))
             pg.display.flip()
@@ -387,24 +370,34 @@ class Battle:
         pg.display.flip()
         self.ko_animation(1500, self.foe)
 
-        frames, duration = 100, 1500
+        duration = self.speed.scale(1500)
         exp_gain = round(self.foe.get_faint_xp() / len(self.played_pokemon))
 
         for pk in self.played_pokemon:
             self.display_message(f"{pk.name} gained {exp_gain} Exp.", duration=2000)
-            for frame in range(frames):
-                pk.exp += exp_gain / frames
-                self.battle_display.render_pokemon_details()
+            target_exp = pk.exp + exp_gain
+            tween = Tween(pk.exp, target_exp, duration)
+            while True:
+                pk.exp = tween.value
+                self.battle_display.update_stat_bars()
                 self.update_upper_screen()
                 pg.display.flip()
-                pg.time.delay(int(duration / frames))
                 if pk.exp >= pk.level_up_exp:
-                    self.level_up_friendly(pk, 1000)
+                    self.level_up_friendly(pk, duration=1000)
                     new_moves = pk.get_new_moves()
                     if new_moves:
                         for move in new_moves:
                             self.learn_move(move)
 
+                    self.battle_display.render_pokemon_details()
+                    # carry on filling the bar at the same rate from the new level
+                    tween = Tween(pk.exp, target_exp, duration * (target_exp - pk.exp) / max(exp_gain, 1))
+
+                elif tween.done:
+                    break
+
+                pg.time.delay(10)
+
             pk.exp = round(pk.exp)
 
         if self.foe_team.all_koed:
@@ -415,6 +408,7 @@ class Battle:
             self.foe.visible = True
             self.battle_display.screens["stats"].sprites.empty()
             self.battle_display.add_pokemon_sprites(self.active_pokemon)
+            self.preload_animations([self.foe])
             print(f"new pokemon {repr(self.foe)}")
             return None
 
@@ -438,12 +432,15 @@ class Battle:
 
         self.display_message(f"{pokemon.name} grew to Lv. {pokemon.level}!", duration=duration)
 
+        if self.speed.is_instant:
+            return
+
         for old_stats in [prev_stats, None]:
             level_up_box = LevelUpBox("level_up", self.game.graphics_scale, new_stats=new_stats, old_stats=old_stats)
             self.battle_display.sprites.add(level_up_box)
             self.update_upper_screen()
             pg.display.flip()
-            pg.time.delay(duration)
+            pg.time.delay(self.speed.scale(duration))
             level_up_box.kill()
 
     def quit_check(self):
@@ -514,7 +511,7 @@ class Battle:
                 self.running = False
                 return BattleOutcome.catch
             else:
-                target.image.set_alpha(255)
+                target.set_opacity(255)
                 return None
 
         elif isinstance(item, MedicineItem):
@@ -528,7 +525,7 @@ class Battle:
 
                 self.display_message(str.format("{}'s health was restored by {} Points", target.name, int(heal_amount)))
 
-                self.reduce_health(target, -heal_amount, 100, 10)
+                self.reduce_health(target, -heal_amount, 1000)
 
             if item.status:
                 target.status = None
@@ -554,30 +551,51 @@ class Battle:
 
         initial_position = stat_container.rect.topleft
 
-        count = 100
-        for frame in range(0, count):
+        count = self.speed.frames(100)
+        for frame in range(1, count + 1):
             opacity = (1 - frame / count) * 255
-            pokemon.image.set_alpha(opacity)
+            pokemon.set_opacity(opacity)
 
             stat_container.rect.topleft = initial_position + pg.Vector2(move_direction * frame * (container_size / count), 0)
 
             self.update_upper_screen()
             pg.display.flip()
-            pg.time.delay(int(duration / count))
+            pg.time.delay(self.speed.scale(duration) // count)
 
         self.foe.visible = False
         stat_container.kill()
 
-    def reduce_health(self, target, damage, frames, delay):
-        start_health = target.health
-        for frame in range(frames):
-            target.health = max(0, target.health - damage / frames)
-            self.battle_display.render_pokemon_details()
-            self.update_upper_screen()
+    def play_action_animation(self, battle_action: BattleAttack | BattleTagIn):
+        """ Play the animation of a battle action, skipping frames at higher battle speeds """
+        if not battle_action.animation or self.speed.is_instant:
+            return
+
+        for frame in range(0, battle_action.frame_count, self.speed.value):
+            battle_action.frame_idx = frame
+            battle_action.update()
+            if battle_action.animation.frames:
+                self.battle_display.screens["animations"].surface = battle_action.get_animation_frame(frame)
+            self.game.topSurf.blit(self.battle_display.get_surface(show_sprites=True), (0, 0))
             pg.display.flip()
-            pg.time.delay(int(delay))
+            pg.time.delay(15)
+            self.battle_display.refresh(text=False)
+
+        self.battle_display.screens["animations"].refresh()
 
-        target.health = max([0, start_health - damage])
+    def reduce_health(self, target, damage, duration):
+        """
+        Drain (or fill, for negative damage) the target's health bar over the given duration.
+
+        :param target: the Pokémon to damage
+        :param damage: the amount of health to remove
+        :param duration: the length of the animation in ms
+        """
+        for health in Tween(target.health, max(0, target.health - damage), self.speed.scale(duration)):
+            target.health = health
+            self.battle_display.update_stat_bars()
+            self.update_upper_screen()
+            pg.display.flip()
+            pg.time.delay(10)
 
     def select_action(self):
         def process_input(res):
@@ -728,22 +746,13 @@ class Battle:
         return None
 
     def tag_in_teammate(self, teammate: Pokemon):
+        self.preload_animations([teammate])
         self.display_message(f"{self.active_pokemon[0].name} switch out", duration=1000)
         tag_in = BattleTagIn(animation_size=self.screenSize)
         self.battle_display.bounce_friendly_stat = False
         self.friendly.visible = False
 
-        if tag_in.animation:
-            for frame in range(tag_in.frame_count):
-                tag_in.frame_idx = frame
-                tag_in.update()
-                if tag_in.animation.frames:
-                    self.battle_display.screens["animations"].surface = tag_in.get_animation_frame(frame)
-                self.game.topSurf.blit(self.battle_display.get_surface(show_sprites=True), (0, 0))
-                pg.display.flip()
-                pg.time.delay(15)
-                self.battle_display.refresh(text=False)
-            self.battle_display.screens["animations"].refresh()
+        self.play_action_animation(tag_in)
 
         self.friendly_team.swap_pokemon(self.friendly, teammate)
 
@@ -812,7 +821,7 @@ class Battle:
                     if pokemon.status:
                         if type(pokemon.status) == Burn:
                             # self.battleDisplay.text = str.format("{} is hurt by its burn", pokemon.name)
-                            self.reduce_health(pokemon, pokemon.status.damage * pokemon.stats.health, 100, 10)
+                            self.reduce_health(pokemon, pokemon.status.damage * pokemon.stats.health, 1000)
                         elif type(pokemon.status) == Poison:
                             pokemon.health -= pokemon.status.damage * pokemon.stats.health
                             self.display_message(str.format("{} is hurt by its poison", pokemon.name), 1000)
@@ -828,6 +837,9 @@ class Battle:
 
     def entry_sequence(self) -> None:
         """ Pre-battle animations"""
+        # decode the move animations in the background while the intro plays
+        self.preload_animations()
+
         if self.game.player.battle_animation.frames is not None:
             player_sprite = self.game.player.battle_sprite
             self.battle_display.screens["animations"].sprites.add(player_sprite)
@@ -847,13 +859,13 @@ class Battle:
                     2000
                 )
 
-                x_dist, count = self.battle_display.size.x - battle_sprite.rect.topleft[0], 30
+                x_dist, count = self.battle_display.size.x - battle_sprite.rect.topleft[0], self.speed.frames(30)
                 for i in range(count):
                     # shift the sprite to the right
                     battle_sprite.rect = battle_sprite.rect.move(x_dist / count, 0)
                     self.update_screen(cover=True)
                     self.battle_display.screens["animations"].refresh()
-                    pg.time.delay(25)
+                    pg.time.delay(self.speed.scale(25))
 
                 battle_sprite.kill()
 
@@ -868,14 +880,14 @@ class Battle:
 
             self.display_message(f"Go! {self.friendly.name.upper()}!", duration=1000)
 
-            x_dist, frames = player_sprite.rect.right, 30
+            x_dist, frames = player_sprite.rect.right, self.speed.frames(30)
             for i in range(frames):
                 frame_count = (i * len(self.game.player.battle_animation.frames)) // frames
                 player_sprite.image = self.game.player.battle_animation.frames[frame_count]
                 player_sprite.rect = player_sprite.rect.move(-x_dist / frames, 0)
                 self.update_screen(cover=True)
                 self.battle_display.screens["animations"].refresh()
-                pg.time.delay(25)
+                pg.time.delay(self.speed.scale(25))
 
             self.battle_display.screens["animations"].sprites.remove(player_sprite)
             player_sprite.image = self.game.player.battle_animation.frames[0]
@@ -906,6 +918,7 @@ class Battle:
         self.fade_out(1000)
 
         self.friendly.visible = False
+        animation_cache.evict()
 
     def run(self):
         self.entry_sequence()
@@ -942,7 +955,7 @@ if __name__ == '__main__':
 
     demo_game.bag = BagV2(bag_data)
 
-    route = Route("Route 201")
+    route = Route.get("Route 201")
 
     wild_name, wild_level = route.encounter(demo_game.time)
     wild_pk: Pokemon = demo_game.create_pokemon(wild_name, level=wild_level)
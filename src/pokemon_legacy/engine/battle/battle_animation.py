@@ -1,9 +1,14 @@
 import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import pygame as pg
 
-ANIMATION_PATH = "../../assets/battle/move_animations"
+from pokemon_legacy.constants import ASSET_PATH
+
+ANIMATION_PATH = os.path.join(ASSET_PATH, "battle/move_animations")
 FRAME_REGEX = r".*.png"
 
 
@@ -13,8 +18,35 @@ def get_image_frame(file_name):
     return int(match.group(1)) if match else None
 
 
+def load_frames(frame_dir, size=None, scale=None, opacity=255) -> list[pg.Surface]:
+    """
+    Load, scale and set the opacity of the animation frames contained in a directory.
+
+    :param frame_dir: directory from which to load animation frames
+    :param size: scale the animation frames to this size
+    :param scale: scale the animation frames by this scale
+    :param opacity: set the opacity of the animation frames
+    :return: animation frames, in frame order
+    """
+    frame_files = sorted([f for f in os.listdir(frame_dir) if f.endswith(".png")], key=get_image_frame)
+    frames = [pg.image.load(os.path.join(frame_dir, frame)) for frame in frame_files if re.match(FRAME_REGEX, frame)]
+
+    if size:
+        frames = [pg.transform.scale(frame, size) for frame in frames]
+
+    elif scale:
+        frames = [pg.transform.scale(frame, pg.Vector2(frame.get_size())*scale) for frame in frames]
+
+    if opacity != 255:
+        for frame in frames:
+            frame.set_alpha(opacity)
+
+    return frames
+
+
 class BattleAnimation:
-    def __init__(self, frame_dir, durations: None | int | list[int]=None,size=None, scale=None, opacity=255):
+    def __init__(self, frame_dir=None, durations: None | int | list[int]=None, size=None, scale=None, opacity=255,
+                 frames: None | list[pg.Surface] = None):
         """
         Animation helper object for defining animations of multiple frames that are contained in a directory.
 
@@ -23,11 +55,12 @@ class BattleAnimation:
         :param size: scale the animation frames to this size
         :param scale: scale the animation frames by this scale
         :param opacity: set the opacity of the animation frames
+        :param frames: already loaded frames (e.g. from the animation cache), used instead of frame_dir
         """
+        if frames is None:
+            frames = load_frames(frame_dir, size=size, scale=scale, opacity=opacity)
 
-        frame_files = sorted([f for f in os.listdir(frame_dir) if f.endswith(".png")], key=get_image_frame)
-        self.frames = [pg.image.load(os.path.join(frame_dir, frame))
-                       for frame in frame_files if re.match(FRAME_REGEX, frame)]
+        self.frames = frames
 
         if isinstance(durations, int):
             self.durations = [durations] * len(self.frames)
@@ -40,16 +73,6 @@ class BattleAnimation:
         else:
             raise ValueError("durations must be a int, list or None")
 
-        if size:
-            self.frames = [pg.transform.scale(frame, size) for frame in self.frames]
-
-        elif scale:
-            self.frames = [pg.transform.scale(frame, pg.Vector2(frame.get_size())*scale) for frame in self.frames]
-
-        if opacity != 255:
-            for frame in self.frames:
-                frame.set_alpha(opacity)
-
         self.frame_pause = 15
 
         # self._data = zip(self.frames, self.durations)
@@ -68,6 +91,103 @@ class BattleAnimation:
         return f"BattleAnimation(num_frames={len(self.frames)}, durations={self.durations})"
 
 
+class BattleAnimationCache:
+    def __init__(self, max_entries: int = 16):
+        """
+        Cache of decoded battle animation frames, keyed by (animation, target side, size, opacity).
+
+        Frames can be preloaded on a background thread (e.g. while the battle intro plays) and are shared
+        between uses, so they must not be modified once loaded. Entries are evicted least recently used
+        first when ``evict`` is called between battles.
+
+        :param max_entries: number of animations to keep after eviction
+        """
+        self.max_entries = max_entries
+        self._frames: OrderedDict[tuple, None | list[pg.Surface]] = OrderedDict()
+        self._pending: dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: None | ThreadPoolExecutor = None
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __contains__(self, key):
+        return key in self._frames
+
+    @property
+    def pending(self) -> int:
+        """ The number of preloads not yet taken by ``get`` """
+        with self._lock:
+            return len(self._pending)
+
+    @staticmethod
+    def make_key(name: str, target_type: None | str = None, size=None, opacity: int = 255) -> tuple:
+        return name.lower(), target_type, tuple(int(v) for v in size) if size else None, opacity
+
+    @staticmethod
+    def _load(key: tuple) -> None | list[pg.Surface]:
+        name, target_type, size, opacity = key
+        frame_dir = os.path.join(ANIMATION_PATH, name, target_type) if target_type else os.path.join(ANIMATION_PATH, name)
+        if not os.path.isdir(frame_dir):
+            return None
+
+        return load_frames(frame_dir, size=size, opacity=opacity)
+
+    def preload(self, keys: list[tuple]) -> None:
+        """ Decode any animations that are not already cached on the worker thread """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="battle_animations")
+
+            for key in keys:
+                if key not in self._frames and key not in self._pending:
+                    self._pending[key] = self._executor.submit(self._load, key)
+
+    def get(self, name: str, target_type: None | str = None, size=None, opacity: int = 255) -> None | list[pg.Surface]:
+        """
+        Return the frames for an animation, waiting on a pending preload or loading them now if needed.
+
+        :return: animation frames, or None if the animation does not exist
+        """
+        key = self.make_key(name, target_type, size, opacity)
+        with self._lock:
+            if key in self._frames:
+                self._frames.move_to_end(key)
+                return self._frames[key]
+
+            pending = self._pending.pop(key, None)
+
+        frames = pending.result() if pending is not None else self._load(key)
+
+        with self._lock:
+            self._frames[key] = frames
+            self._frames.move_to_end(key)
+
+        return frames
+
+    def evict(self) -> None:
+        """
+        Drop the least recently used animations until the cache is back within its limit, and the preloads that
+        were never used, e.g. the moves not used in the battle
+        """
+        with self._lock:
+            while len(self._frames) > self.max_entries:
+                self._frames.popitem(last=False)
+
+            pending, self._pending = self._pending, {}
+
+        for future in pending.values():
+            future.cancel()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+            self._pending.clear()
+
+
+animation_cache = BattleAnimationCache()
+
+
 if __name__ == "__main__":
     display = pg.display.set_mode((592, 384))
     background = pg.Surface(display.get_size())
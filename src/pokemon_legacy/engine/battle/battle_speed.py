@@ -0,0 +1,40 @@
+from enum import Enum
+
+
+class BattleSpeed(Enum):
+    """ Playback speed of battle messages and animations. The battle logic itself is unaffected. """
+    normal = 1
+    double = 2
+    quadruple = 4
+    instant = 0
+
+    @property
+    def is_instant(self) -> bool:
+        return self is BattleSpeed.instant
+
+    def scale(self, duration: float) -> int:
+        """
+        Scale a duration to this speed.
+
+        :param duration: the duration at normal speed in ms
+        :return: the scaled duration in ms
+        """
+        return 0 if self.is_instant else int(duration / self.value)
+
+    def frames(self, count: int) -> int:
+        """
+        Scale the number of frames used by an animation to this speed.
+
+        :param count: the number of frames at normal speed
+        :return: the number of frames to show, always at least one
+        """
+        return 1 if self.is_instant else max(1, count // self.value)
+
+    @classmethod
+    def from_string(cls, speed: str) -> "BattleSpeed":
+        """ Parse a speed from the command line, e.g. "2", "4x" or "instant" """
+        speed = speed.lower().rstrip("x")
+        if speed == "instant":
+            return cls.instant
+
+        return cls(int(speed))
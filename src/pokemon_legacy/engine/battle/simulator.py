@@ -0,0 +1,429 @@
+"""
+simulator.py
+
+Headless batch battle simulator used to balance trainer teams and route encounters.
+
+Battles are resolved with the same stat, damage and exp formulas as ``Battle``
+(``Pokemon.use_move``, ``Stats`` and ``Pokemon.get_faint_xp``) but without any display or
+animation code, so that many battles can be run across a process pool.
+
+Run from the repository root (asset paths are relative to it)::
+
+    PYTHONPATH=src python -m pokemon_legacy.engine.battle.simulator -p parties.json -m 500
+"""
+import os
+import json
+import time
+import zlib
+import random
+import argparse
+from math import floor
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pygame as pg
+
+from pokemon_legacy.constants import DATA_PATH
+from pokemon_legacy.engine.general.Condition import StatusCondition
+from pokemon_legacy.engine.general.Move import Move2
+from pokemon_legacy.engine.general.Status_Conditions.Burn import Burn
+from pokemon_legacy.engine.general.Status_Conditions.Poison import Poison
+from pokemon_legacy.engine.pokemon.pokemon import Pokemon
+from pokemon_legacy.engine.pokemon.team import Team
+
+
+RESULT_COLUMNS: dict[str, type] = {
+    "pairing": np.uint16,
+    "won": np.bool_,
+    "turns": np.uint16,
+    "hp_remaining": np.float32,
+    "foe_hp_remaining": np.float32,
+    "exp_gained": np.uint32,
+}
+
+
+@dataclass
+class BattleResult:
+    """ Outcome of a single simulated battle, from the point of view of the player's party """
+    won: bool
+    turns: int
+    hp_remaining: float
+    foe_hp_remaining: float
+    exp_gained: int
+
+
+@dataclass
+class SimulationTask:
+    """ A chunk of battles for one player party / opponent team pairing """
+    pairing: int
+    party_name: str
+    party: list[dict]
+    opponent_name: str
+    opponent: list[dict]
+    battles: int
+    seed: int
+    max_turns: int = 200
+
+
+# ========== BATTLE RESOLUTION ==========
+def _hp_ratio(team: Team) -> float:
+    """ Return the fraction of the team's total health that remains """
+    max_health = sum(pk.stats.health for pk in team)
+    return sum(max(pk.health, 0) for pk in team) / max_health if max_health else 0.0
+
+
+def resolve_attack(attacker: Pokemon, target: Pokemon, move: Move2) -> None:
+    """
+    Apply a single attack without any graphics. Mirrors the game state changes made by ``Battle.attack``.
+
+    :param attacker: the Pokémon using the move
+    :param target: the Pokémon being targeted
+    :param move: the move being used
+    """
+    damage, _, inflict_condition, heal, modify, hits, _ = attacker.use_move(move, target)
+    damage = min([target.health, damage])
+
+    for _ in range(hits):
+        if target.is_koed:
+            break
+        target.health = max(0, target.health - damage)
+
+    if heal:
+        attacker.health = min(attacker.stats.health, attacker.health + max(floor(damage * (heal / 100)), 1))
+
+    if not target.is_koed and inflict_condition:
+        for condition in StatusCondition:
+            if condition.value.name == inflict_condition:
+                target.status = condition.value
+
+    if not target.is_koed and modify:
+        change = modify[0] if modify[3] == "Raise" else -modify[0]
+        modified = attacker if modify[2] == "Self" else target
+        modified.modify_stat_stage(modify[1], change)
+
+    target.health = round(target.health)
+
+
+def simulate_battle(friendly_team: Team, foe_team: Team, max_turns: int = 200) -> BattleResult:
+    """
+    Simulate a battle between two teams. Both sides pick a random move each turn, as the foe does in
+    ``Battle.loop``, and move order is decided by speed.
+
+    :param friendly_team: the player's party
+    :param foe_team: the opponent's team
+    :param max_turns: turn limit after which the battle is counted as a loss
+    :return: battle result
+    """
+    friendly, foe = friendly_team.alive_pokemon[0], foe_team.alive_pokemon[0]
+    exp_gained, turns = 0, 0
+
+    while turns < max_turns and not (friendly_team.all_koed or foe_team.all_koed):
+        turns += 1
+        actions = {id(friendly): random.choice(friendly.moves), id(foe): random.choice(foe.moves)}
+        order: list[Pokemon] = sorted([friendly, foe], key=lambda pk: pk.stats.speed, reverse=True)
+
+        for attacker in order:
+            target = foe if attacker is friendly else friendly
+            if not attacker.is_koed and not target.is_koed:
+                resolve_attack(attacker, target, actions[id(attacker)])
+
+        for pk in order:
+            if not pk.is_koed and isinstance(pk.status, (Burn, Poison)):
+                pk.health = max(0, pk.health - pk.status.damage * pk.stats.health)
+
+        if foe.is_koed:
+            exp_gained += round(foe.get_faint_xp())
+            if not foe_team.all_koed:
+                foe = random.choice(foe_team.alive_pokemon)
+
+        if friendly.is_koed and not friendly_team.all_koed:
+            friendly = friendly_team.alive_pokemon[0]
+
+    return BattleResult(
+        won=foe_team.all_koed and not friendly_team.all_koed,
+        turns=turns,
+        hp_remaining=_hp_ratio(friendly_team),
+        foe_hp_remaining=_hp_ratio(foe_team),
+        exp_gained=exp_gained,
+    )
+
+
+def reset_team(team: Team) -> None:
+    """ Return a team to its pre-battle state """
+    team.restore()
+    for pk in team:
+        pk.reset_stat_stages()
+
+
+# ========== WORKERS ==========
+_worker_teams: dict[tuple[str, bool, int], Team] = {}
+
+
+def _init_worker() -> None:
+    """ Pokémon surfaces need a display mode to convert against, so give each worker a headless one """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pg.display.init()
+    if pg.display.get_surface() is None:
+        pg.display.set_mode((1, 1))
+
+
+def _team_seed(seed: int, name: str, friendly: bool) -> int:
+    return seed ^ zlib.crc32(f"{name}:{friendly}".encode())
+
+
+def build_team(name: str, data: list[dict], friendly: bool, seed: int) -> Team:
+    """
+    Build (or fetch from the worker cache) the team described by the given json data. Random attributes
+    such as IVs and unspecified moves are seeded so that every worker builds an identical team.
+
+    :param name: name of the party or trainer id
+    :param data: list of Pokémon json data, as used by ``trainer_teams.json``
+    :param friendly: True if the team belongs to the player
+    :param seed: base simulation seed
+    :return: team
+    """
+    team_seed = _team_seed(seed, name, friendly)
+    key = (name, friendly, team_seed)
+    if key not in _worker_teams:
+        random.seed(team_seed)
+        _worker_teams[key] = Team([Pokemon(**dict(pk_data, friendly=friendly), lazy_load=True) for pk_data in data])
+
+    return _worker_teams[key]
+
+
+def run_task(task: SimulationTask) -> dict[str, np.ndarray]:
+    """
+    Run a chunk of battles for one pairing.
+
+    :param task: simulation task
+    :return: result columns for the chunk
+    """
+    party = build_team(task.party_name, task.party, friendly=True, seed=task.seed)
+    opponent = build_team(task.opponent_name, task.opponent, friendly=False, seed=task.seed)
+
+    random.seed(task.seed)
+    results = []
+    for _ in range(task.battles):
+        reset_team(party)
+        reset_team(opponent)
+        results.append(simulate_battle(party, opponent, max_turns=task.max_turns))
+
+    columns = {
+        name: np.array([getattr(res, name) for res in results], dtype=dtype)
+        for name, dtype in RESULT_COLUMNS.items() if name != "pairing"
+    }
+    columns["pairing"] = np.full(len(results), task.pairing, dtype=RESULT_COLUMNS["pairing"])
+
+    return columns
+
+
+# ========== RESULT STORAGE ==========
+class ColumnarResultWriter:
+    def __init__(self, path: str, columns: dict[str, type] = None):
+        """
+        Streams simulation results to disk. Each chunk is written as one block per column (``np.save``
+        format), so results can be appended as they arrive and read back a column at a time. Run
+        metadata is written next to the results in ``<path>.json`` when the writer is closed.
+
+        :param path: output file path
+        :param columns: column names and dtypes
+        """
+        self.path = path
+        self.columns = columns if columns is not None else RESULT_COLUMNS
+        self.rows = 0
+        self._file = open(path, "wb")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, chunk: dict[str, np.ndarray]) -> None:
+        """ Append a chunk of results """
+        for name, dtype in self.columns.items():
+            np.save(self._file, np.asarray(chunk[name], dtype=dtype), allow_pickle=False)
+
+        self.rows += len(chunk[next(iter(self.columns))])
+
+    def close(self, metadata: dict = None) -> None:
+        if self._file.closed:
+            return
+
+        self._file.close()
+        with open(f"{self.path}.json", "w") as f:
+            json.dump({"rows": self.rows, "columns": list(self.columns), **(metadata or {})}, f, indent=4)
+
+
+def load_results(path: str, columns: dict[str, type] = None) -> dict[str, np.ndarray]:
+    """
+    Read results written by ``ColumnarResultWriter``.
+
+    :param path: results file path
+    :param columns: column names and dtypes
+    :return: dict of column arrays
+    """
+    columns = columns if columns is not None else RESULT_COLUMNS
+    blocks: dict[str, list[np.ndarray]] = {name: [] for name in columns}
+    size = os.path.getsize(path)
+
+    with open(path, "rb") as f:
+        while f.tell() < size:
+            for name in columns:
+                blocks[name].append(np.load(f, allow_pickle=False))
+
+    return {
+        name: np.concatenate(arrays) if arrays else np.empty(0, dtype=columns[name])
+        for name, arrays in blocks.items()
+    }
+
+
+def summarise(results: dict[str, np.ndarray], pairings: list[tuple[str, str]]) -> list[dict]:
+    """ Aggregate the per-battle results into per-pairing statistics """
+    summary = []
+    for idx, (party_name, opponent_name) in enumerate(pairings):
+        mask = results["pairing"] == idx
+        if not mask.any():
+            continue
+
+        summary.append({
+            "party": party_name,
+            "opponent": opponent_name,
+            "battles": int(mask.sum()),
+            "win_rate": float(results["won"][mask].mean()),
+            "mean_turns": float(results["turns"][mask].mean()),
+            "mean_hp_remaining": float(results["hp_remaining"][mask].mean()),
+        })
+
+    return summary
+
+
+# ========== ORCHESTRATION ==========
+def make_tasks(
+        parties: dict[str, list[dict]],
+        opponents: dict[str, list[dict]],
+        battles: int,
+        seed: int = 0,
+        chunk_size: int = 50,
+        max_turns: int = 200,
+) -> tuple[list[tuple[str, str]], list[SimulationTask]]:
+    """ Split every party / opponent pairing into chunks of battles """
+    pairings, tasks = [], []
+    for party_name, party in parties.items():
+        for opponent_name, opponent in opponents.items():
+            pairing = len(pairings)
+            pairings.append((party_name, opponent_name))
+            for start in range(0, battles, chunk_size):
+                tasks.append(SimulationTask(
+                    pairing=pairing,
+                    party_name=party_name, party=party,
+                    opponent_name=opponent_name, opponent=opponent,
+                    battles=min(chunk_size, battles - start),
+                    seed=seed + pairing * battles + start,
+                    max_turns=max_turns,
+                ))
+
+    return pairings, tasks
+
+
+def run_simulation(
+        parties: dict[str, list[dict]],
+        opponents: dict[str, list[dict]],
+        battles: int,
+        out_path: str,
+        *,
+        workers: int = 0,
+        seed: int = 0,
+        chunk_size: int = 50,
+        max_turns: int = 200,
+) -> dict:
+    """
+    Simulate ``battles`` battles for every party / opponent pairing and stream the results to disk.
+
+    :param parties: player parties by name
+    :param opponents: opponent teams by name
+    :param battles: number of battles per pairing
+    :param out_path: results file path
+    :param workers: number of worker processes, 0 runs in the current process
+    :param seed: base random seed
+    :param chunk_size: number of battles per task
+    :param max_turns: turn limit per battle
+    :return: run metadata, including the per-pairing summary and throughput
+    """
+    pairings, tasks = make_tasks(parties, opponents, battles, seed, chunk_size, max_turns)
+
+    t0 = time.monotonic()
+    with ColumnarResultWriter(out_path) as writer:
+        if workers:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                for future in as_completed([pool.submit(run_task, task) for task in tasks]):
+                    writer.write(future.result())
+        else:
+            for task in tasks:
+                writer.write(run_task(task))
+
+        elapsed = time.monotonic() - t0
+        cores = max(workers, 1)
+        metadata = {
+            "battles": writer.rows,
+            "workers": cores,
+            "seconds": elapsed,
+            "battles_per_second": writer.rows / elapsed if elapsed else 0.0,
+            "battles_per_second_per_core": writer.rows / elapsed / cores if elapsed else 0.0,
+            "pairings": pairings,
+        }
+        writer.close(metadata)
+
+    metadata["summary"] = summarise(load_results(out_path), pairings)
+    return metadata
+
+
+def _load_teams(path: str) -> dict[str, list[dict]]:
+    """ Load teams from a json file. Either a list of Pokémon (one team) or a dict of named teams """
+    with open(path) as f:
+        data = json.load(f)
+
+    return data if isinstance(data, dict) else {os.path.splitext(os.path.basename(path))[0]: data}
+
+
+def main(argv: None | list[str] = None):
+    parser = argparse.ArgumentParser(description="Simulate battles between player parties and opponent teams")
+    parser.add_argument("-p", "--parties", required=True, help="json file of player parties")
+    parser.add_argument("-f", "--opponents", default=os.path.join(DATA_PATH, "game_config/trainer_teams.json"),
+                        help="json file of opponent teams")
+    parser.add_argument("-m", "--battles", type=int, default=100, help="battles per pairing")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument("-o", "--out", default="battle_results.cols")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=50)
+    parser.add_argument("--max-turns", type=int, default=200)
+
+    args = parser.parse_args(argv)
+
+    if not args.workers:
+        _init_worker()
+
+    metadata = run_simulation(
+        _load_teams(args.parties),
+        _load_teams(args.opponents),
+        args.battles,
+        args.out,
+        workers=args.workers,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+        max_turns=args.max_turns,
+    )
+
+    for row in metadata["summary"]:
+        print(f"{row['party']:>16} vs {row['opponent']:<16} win rate {row['win_rate']:6.1%}  "
+              f"turns {row['mean_turns']:5.1f}  hp remaining {row['mean_hp_remaining']:6.1%}")
+
+    print(f"{metadata['battles']} battles in {metadata['seconds']:.2f}s: "
+          f"{metadata['battles_per_second']:.1f} battles/s, "
+          f"{metadata['battles_per_second_per_core']:.1f} battles/s/core ({metadata['workers']} workers)")
+    print(f"results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
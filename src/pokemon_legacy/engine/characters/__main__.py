@@ -0,0 +1,24 @@
+"""
+Map the background colour of every character type on the NPC sheet that does not have one yet, and write the
+mapping to ``character_bg_mappings.json``. Pass ``--all`` to sample every character type again.
+
+    python -m pokemon_legacy.engine.characters [--all]
+"""
+import json
+import sys
+
+from pokemon_legacy.engine.characters.character import Character
+
+remap = "--all" in sys.argv[1:]
+
+mapping = dict(Character.character_bg_mapping)
+added = []
+for character_type in Character.character_sprite_mapping:
+    if remap or character_type.name not in mapping:
+        mapping[character_type.name] = Character.sample_bg_colour(character_type)
+        added.append(character_type.name)
+
+with Character.bg_colour_file.open("w") as f:
+    json.dump(mapping, f, indent=4)
+
+print(f"Mapped {len(added)} character types: {', '.join(added) if added else 'none'}")
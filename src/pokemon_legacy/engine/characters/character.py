@@ -1,9 +1,9 @@
 import os
 import json
+import threading
 from enum import Enum
 import importlib.resources as resources
 
-import cv2
 import pygame as pg
 
 from pokemon_legacy.engine.storyline.game_action import GameAction
@@ -12,6 +12,8 @@ from pokemon_legacy.engine.general.direction import Direction
 
 from pokemon_legacy.engine.graphics.sprite_set import SpriteSet2
 from pokemon_legacy.engine.general.image_editor import ImageEditor
+from pokemon_legacy.engine.graphics.assets import LazyAsset, load_cv2_image
+from pokemon_legacy.engine.graphics.surface_registry import surface_registry
 
 
 MODULE_PATH = resources.files(__package__)
@@ -66,7 +68,9 @@ class AttentionBubble(pg.sprite.Sprite):
 
 class Character(GameObject):
     # load in the sprite surfaces
-    npc_parent_surf_cv2 = cv2.imread(os.path.join(ASSET_PATH, 'sprites/trainers/all_npcs_2.png'), cv2.IMREAD_UNCHANGED)
+    npc_parent_surf_cv2 = LazyAsset(
+        "characters/npc_sheet", load_cv2_image, os.path.join(ASSET_PATH, 'sprites/trainers/all_npcs_2.png')
+    )
 
     character_sprite_mapping = {
         CharacterTypes.player_male: (0, 0),
@@ -99,6 +103,10 @@ class Character(GameObject):
     with bg_colour_file.open('r', encoding='utf-8') as f:
         character_bg_mapping: dict[str, list[int]] = json.load(f)
 
+    # walking frames shared by every character of the same type and scale, see npc_frames
+    _npc_frame_cache: dict[tuple[CharacterTypes, float], tuple[pg.Surface, ...]] = {}
+    _npc_frame_lock = threading.Lock()
+
     @classmethod
     def get_npc_frames(
             cls,
@@ -106,51 +114,25 @@ class Character(GameObject):
             bg_colour: None | pg.Color = None,
             order_frames: bool = True,
             scale: int | float = 1.0,
-            auto_map_bg: bool = True,
     ):
         """
         Loads each frame for an NPC walking
 
         :param character_type:
-        :param bg_colour:
+        :param bg_colour: the background colour of the sheet block, made transparent. Unmapped colours are added to
+            ``character_bg_mappings.json`` offline, with ``python -m pokemon_legacy.engine.characters``
         :param order_frames:
         :param scale: value to scale the surface by
         :return: frames
         """
-        character_block_size = pg.Vector2(96, 128)
-        frame_size = pg.Vector2(32, 32)
-        block_location = cls.character_sprite_mapping[character_type]
-        block_rect = pg.Rect((character_block_size.x * block_location[0],
-                              character_block_size.y * block_location[1]),
-                             character_block_size)
-
         frames: list[pg.Surface] = []
-        for frame_idx in range(12):
-            y, x = divmod(frame_idx, 3)
-            frame_rect = pg.Rect((x * frame_size.x, y * frame_size.y), frame_size)
-            frame_rect.topleft += pg.Vector2(block_rect.topleft)
-            frame = cls.npc_parent_surf_cv2[frame_rect.top:frame_rect.bottom, frame_rect.left:frame_rect.right, :]
-
+        for frame in cls._sheet_frames(character_type):
+            cls.editor.loadData(frame)
             if bg_colour is not None:
-                cls.editor.loadData(frame)
                 cls.editor.transparent_where_color(bg_colour[:3], overwrite=True)
                 cls.editor.crop_transparent_borders(overwrite=True)
 
-                frame = cls.editor.createSurface()
-
-            else:
-
-                if frame_idx == 0:
-                    # frame = frame.convert_alpha()
-                    print(f"consider mapping {character_type}: pg.Color({frame[0, 0, :]}),")
-                    if auto_map_bg:
-                        cls.character_bg_mapping[character_type.name] = frame[0, 0, :].tolist()
-                        # write back to json file
-                        with cls.bg_colour_file.open("w") as f:
-                            json.dump(cls.character_bg_mapping, f, indent=4)
-
-                cls.editor.loadData(frame)
-                frame = cls.editor.createSurface()
+            frame = cls.editor.createSurface()
 
             if scale != 1.0:
                 frame = pg.transform.scale(frame, pg.Vector2(frame.get_size()) * scale)
@@ -163,6 +145,56 @@ class Character(GameObject):
 
         return frames
 
+    @classmethod
+    def _sheet_frames(cls, character_type: CharacterTypes) -> list:
+        """ Return the 12 unprocessed frames of a character type, sliced from the NPC sheet """
+        character_block_size = pg.Vector2(96, 128)
+        frame_size = pg.Vector2(32, 32)
+        block_location = cls.character_sprite_mapping[character_type]
+        block_rect = pg.Rect((character_block_size.x * block_location[0],
+                              character_block_size.y * block_location[1]),
+                             character_block_size)
+
+        frames = []
+        for frame_idx in range(12):
+            y, x = divmod(frame_idx, 3)
+            frame_rect = pg.Rect((x * frame_size.x, y * frame_size.y), frame_size)
+            frame_rect.topleft += pg.Vector2(block_rect.topleft)
+            frames.append(
+                cls.npc_parent_surf_cv2[frame_rect.top:frame_rect.bottom, frame_rect.left:frame_rect.right, :]
+            )
+
+        return frames
+
+    @classmethod
+    def npc_frames(cls, character_type: CharacterTypes, scale: int | float = 1.0) -> tuple[pg.Surface, ...]:
+        """
+        Return the walking frames of a character type. The frames are cut from the sheet once per type and scale and
+        shared by every character, so they must not be modified.
+
+        :param character_type: the character type
+        :param scale: value to scale the frames by
+        """
+        key = (character_type, scale)
+        frames = cls._npc_frame_cache.get(key)
+        if frames is None:
+            with cls._npc_frame_lock:
+                frames = cls._npc_frame_cache.get(key)
+                if frames is None:
+                    bg_colour = cls.character_bg_mapping.get(character_type.name)
+                    frames = tuple(cls.get_npc_frames(character_type, bg_colour=bg_colour, scale=scale))
+                    cls._npc_frame_cache[key] = surface_registry.track_all(frames, f"npc {character_type.name}", "sprites")
+        return frames
+
+    @classmethod
+    def clear_npc_frames(cls):
+        cls._npc_frame_cache.clear()
+
+    @classmethod
+    def sample_bg_colour(cls, character_type: CharacterTypes) -> list[int]:
+        """ Return the background colour of a character type's sheet block, the top left pixel of its first frame """
+        return cls._sheet_frames(character_type)[0][0, 0, :].tolist()
+
     def __init__(self, properties: dict = None, scale: float = 1.0, map_scale: int | float = 1.0):
         self.character_id = properties.get("character_id", None)
 
@@ -183,7 +215,7 @@ class Character(GameObject):
         self.character_type: CharacterTypes = CharacterTypes[character_type]
         self.name: str = "" if not properties else properties.get("npc_name")
 
-        self._sprite_sets: dict[Movement, list[pg.Surface]]
+        self._sprite_sets: dict[Movement, tuple[pg.Surface, ...]]
         self._leg: bool = True
         self._moving: bool = False
 
@@ -240,11 +272,7 @@ class Character(GameObject):
 
     # === SERIALISATION ===
     def _load_surfaces(self):
-        bg_colour = self.char_bg_mappings.get(self.character_type, None)
-
-        self._sprite_sets = {Movement.walking: self.get_npc_frames(
-            self.character_type, bg_colour=bg_colour, scale=self.scale
-        )}
+        self._sprite_sets = {Movement.walking: self.npc_frames(self.character_type, scale=self.scale)}
 
         self.attention_bubble = AttentionBubble(self, scale=self.scale)
 
@@ -4,6 +4,8 @@ from random import choice
 
 import pygame as pg
 
+from pokemon_legacy.engine.data.bundle import game_data
+from pokemon_legacy.engine.graphics.assets import LazyAsset
 from pokemon_legacy.engine.general.direction import Direction
 from pokemon_legacy.engine.characters.character import Character
 from pokemon_legacy.engine.storyline.game_action import *
@@ -21,8 +23,7 @@ class NPC(Character):
     Returns a NPC Object.
     """
 
-    with open(os.path.join(DATA_PATH, "game_config/npc_texts.json"), "r") as file:
-        response_texts = json.load(file)
+    response_texts = LazyAsset("characters/npc_texts", game_data.table, "game_config/npc_texts.json")
 
 
     def __init__(self, properties: dict = None, scale: float = 1.0):
@@ -122,12 +122,12 @@ class Player2(Trainer):
             ]
         }
 
-    def load_from_state(self, player_state: dict):
+    def load_from_state(self, player_state: dict, lazy_load: bool = False):
         self.steps = player_state.get("steps", self.steps)
         self.money = player_state.get("money", self.money)
 
         self.bag = BagV2(player_state.get("bag", None))
-        self.team = Team(player_state.get("team", None))
+        self.team = Team(player_state.get("team", None), lazy_load=lazy_load)
 
     # === Follower Management ===
     @property
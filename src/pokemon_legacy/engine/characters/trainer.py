@@ -2,7 +2,10 @@ import os
 import pygame as pg
 import json
 
-from pokemon_legacy.engine.pokemon.team import Team
+from pokemon_legacy.engine.data.bundle import game_data
+from pokemon_legacy.engine.graphics.assets import LazyAsset, load_image
+from pokemon_legacy.engine.graphics.surface_registry import surface_registry
+from pokemon_legacy.engine.pokemon.team import Team, TeamSpec
 
 from pokemon_legacy.engine.general.direction import Direction
 
@@ -34,11 +37,16 @@ class Trainer(Character):
         CharacterTypes.riley: (0, 2),
     }
 
-    trainer_front_parent_surf = pg.image.load(os.path.join(ASSET_PATH, 'sprites/trainers/trainer_front_images.png'))
-    trainer_back_parent_surf = pg.image.load(os.path.join(ASSET_PATH, 'sprites/trainers/trainer_front_images.png'))
+    # the back frames are read from the same sheet, so it is only loaded once
+    trainer_front_parent_surf = LazyAsset(
+        "trainers/front_sheet", load_image, os.path.join(ASSET_PATH, 'sprites/trainers/trainer_front_images.png')
+    )
+    trainer_back_parent_surf = trainer_front_parent_surf
 
-    with open(os.path.join(DATA_PATH, "game_config/trainer_teams.json")) as f:
-        trainer_data = json.load(f)
+    trainer_data = LazyAsset("trainers/teams", game_data.table, "game_config/trainer_teams.json")
+
+    # battle front images shared by every trainer of the same type and scale
+    _battle_front_cache: dict[tuple[CharacterTypes, float], pg.Surface] = {}
 
     def __init__(
             self,
@@ -59,27 +67,71 @@ class Trainer(Character):
 
         self.battle_sprite = pg.sprite.Sprite()
 
-        # load team data
+        # the team is only built from its spec when it is battled, see team
         team_data = self.trainer_data.get(self.trainer_id, None)
-        self.team: Team = team if team else (Team(data=self.trainer_data[self.trainer_id]) if team_data else Team())
+        self.team_spec: None | TeamSpec = TeamSpec(team_data) if team_data and not team else None
+        self._team: None | Team = team if team else None
 
         # dict to hold trainer position and blit rect on each map
 
-        self.battled = False
+        self._battled = False
 
         self._load_surfaces()
 
     def __repr__(self):
-        return f"Trainer('{self.character_type.name.title()} {self.name.title()}',{self.team})"
+        team = self._team if self._team is not None else self.team_spec
+        return f"Trainer('{self.character_type.name.title()} {self.name.title()}',{team})"
 
     def __getstate__(self):
         self._clear_surfaces()
         return self.__dict__
 
     def __setstate__(self, state):
+        if "team" in state:
+            # saved before teams were built on demand
+            state = dict(state, _team=state["team"], _battled=state.get("battled", False), team_spec=None)
+            del state["team"]
+            state.pop("battled", None)
+
         self.__dict__.update(state)
         self._load_surfaces()
 
+    # ========== TEAM ==========
+    @property
+    def team(self) -> Team:
+        """ The trainer's team, built from the team spec on first use """
+        if self._team is None:
+            self._team = self.team_spec.build() if self.team_spec else Team()
+        return self._team
+
+    @team.setter
+    def team(self, team: Team) -> None:
+        self._team = team
+
+    @property
+    def team_loaded(self) -> bool:
+        return self._team is not None
+
+    def prepare_team(self) -> None:
+        """ Build the team ahead of the battle, e.g. when the player walks into the trainer's view """
+        if not self._battled:
+            _ = self.team
+
+    def release_team(self) -> None:
+        """ Drop a team built from the team spec. A team passed in directly is kept. """
+        if self.team_spec is not None:
+            self._team = None
+
+    @property
+    def battled(self) -> bool:
+        return self._battled
+
+    @battled.setter
+    def battled(self, battled: bool) -> None:
+        self._battled = battled
+        if battled:
+            self.release_team()
+
     def get_vision_rect(self, _map):
         return self._get_vision_rect(self.map_rects[_map], self.facing_direction)
 
@@ -130,12 +182,21 @@ class Trainer(Character):
 
         return pg.transform.scale(image, pg.Vector2(image.get_size()) * scale) if scale != 1.0 else image
 
+    @classmethod
+    def battle_front(cls, trainer_type: CharacterTypes, scale=1) -> pg.Surface:
+        """ Return the battle front image of a trainer type, shared by every trainer so it must not be modified """
+        key = (trainer_type, scale)
+        if key not in cls._battle_front_cache:
+            cls._battle_front_cache[key] = surface_registry.track(
+                cls.get_battle_front(trainer_type, bg_colour=(147, 187, 236, 255), scale=scale),
+                f"trainer front {trainer_type.name}", "battle",
+            )
+        return cls._battle_front_cache[key]
+
     def _load_surfaces(self):
         super()._load_surfaces()
         self.battle_sprite = pg.sprite.Sprite()
-        self.battle_sprite.image = self.get_battle_front(
-            self.character_type, scale=self.scale, bg_colour=(147, 187, 236, 255)
-        )
+        self.battle_sprite.image = self.battle_front(self.character_type, scale=self.scale)
         self.battle_sprite.rect = pg.Rect(pg.Vector2(152, 10) * self.scale, self.battle_sprite.image.get_size())
 
     def _clear_surfaces(self):
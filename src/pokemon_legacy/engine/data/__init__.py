@@ -0,0 +1,2 @@
+from .bundle import game_data, GameData
+from .records import records, RecordStore, SpeciesRecord, MoveRecord, ItemRecord, AbilityRecord
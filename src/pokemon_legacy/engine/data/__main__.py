@@ -0,0 +1,14 @@
+"""
+Compile the game data bundle from the source files in ``assets/data``.
+
+    python -m pokemon_legacy.engine.data
+"""
+import os
+import time
+
+from pokemon_legacy.engine.data.bundle import game_data
+
+start = time.perf_counter()
+path = game_data.build()
+print(f"Compiled {len(game_data.tables)} tables to {os.path.normpath(path)} "
+      f"({os.path.getsize(path) / 1024:.0f} KiB) in {time.perf_counter() - start:.2f}s")
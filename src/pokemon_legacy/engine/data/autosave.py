@@ -0,0 +1,156 @@
+"""
+Background autosave.
+
+Saving used to block the main loop while the game was pickled, and pickling tore down the surfaces and displays of the
+live objects. An autosave now takes a snapshot of the save components on the main thread: a detached copy of their
+JSON data, which costs well under a millisecond. Encoding, hashing and the fsynced writes of ``SaveFile.save`` run on
+a single worker thread, so the game keeps running and nothing is torn down.
+
+Saves are written in the order they were requested. A snapshot requested while another is being written replaces any
+snapshot still waiting, so a burst of triggers only writes the latest state.
+"""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, Iterable
+
+from pokemon_legacy.engine.data.save_file import SaveFile
+
+
+class AutosaveTrigger(Enum):
+    map_change = "map_change"
+    battle_end = "battle_end"
+    steps = "steps"
+
+
+DEFAULT_TRIGGERS = (AutosaveTrigger.map_change, AutosaveTrigger.battle_end, AutosaveTrigger.steps)
+
+
+def snapshot(data: Any) -> Any:
+    """ Return a copy of JSON data that shares no containers with the original """
+    if isinstance(data, dict):
+        return {key: snapshot(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [snapshot(value) for value in data]
+    return data
+
+
+class Autosave:
+    """ Writes snapshots of the save components to a save file on a worker thread """
+
+    def __init__(
+            self,
+            save_file: SaveFile,
+            triggers: Iterable[AutosaveTrigger] = DEFAULT_TRIGGERS,
+            step_interval: int = 100,
+            on_saved: None | Callable[[list[str]], None] = None,
+            on_error: None | Callable[[Exception], None] = None,
+    ):
+        """
+        :param save_file: the save slot to write
+        :param triggers: the events that start an autosave
+        :param step_interval: autosave every this many steps, with the steps trigger
+        :param on_saved: called on the worker thread with the components written by each save
+        :param on_error: called on the worker thread when a save fails
+        """
+        self.save_file = save_file
+        self.triggers = frozenset(triggers)
+        self.step_interval = step_interval
+        self.on_saved = on_saved
+        self.on_error = on_error
+
+        self._pool: None | ThreadPoolExecutor = None
+        self._lock = threading.Lock()
+        self._pending: None | dict[str, Any] = None
+        self._future: None | Future = None
+        self._writing = False
+
+    def __repr__(self):
+        return f"Autosave({self.save_file}, triggers={sorted(trigger.name for trigger in self.triggers)})"
+
+    # ========== TRIGGERS ==========
+    def trigger(self, trigger: AutosaveTrigger, components: Callable[[], dict[str, Any]]) -> None | Future:
+        """
+        Autosave if the trigger is enabled.
+
+        :param trigger: the event that happened
+        :param components: returns the save components, only called if the trigger is enabled
+        :return: the future of the save, or None if the trigger is disabled
+        """
+        if trigger not in self.triggers:
+            return None
+        return self.request(components())
+
+    def step(self, steps: int, components: Callable[[], dict[str, Any]]) -> None | Future:
+        """ Autosave every ``step_interval`` steps, see ``trigger`` """
+        if self.step_interval <= 0 or steps % self.step_interval:
+            return None
+        return self.trigger(AutosaveTrigger.steps, components)
+
+    # ========== SAVING ==========
+    def request(self, components: dict[str, Any]) -> Future:
+        """
+        Snapshot the components and write them in the background.
+
+        :param components: the JSON data of each save component
+        :return: a future resolving to the components written by the save that includes this snapshot
+        """
+        data = snapshot(components)
+        with self._lock:
+            self._pending = data
+            if not self._writing:
+                self._writing = True
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(1, thread_name_prefix="autosave")
+                self._future = self._pool.submit(self._drain)
+            return self._future
+
+    def save_now(self, components: dict[str, Any]) -> list[str]:
+        """ Write the components, waiting for the save to finish """
+        return self.request(components).result()
+
+    def _drain(self) -> list[str]:
+        """ Write the pending snapshots until none are left """
+        written = []
+        while True:
+            with self._lock:
+                data, self._pending = self._pending, None
+                if data is None:
+                    self._writing = False
+                    return written
+
+            try:
+                written = self.save_file.save(data)
+            except Exception as e:
+                if self.on_error is not None:
+                    self.on_error(e)
+                with self._lock:
+                    # every snapshot holds the whole game, so the next request saves everything this one missed
+                    self._pending = None
+                    self._writing = False
+                raise e
+
+            if self.on_saved is not None:
+                self.on_saved(written)
+
+    @property
+    def busy(self) -> bool:
+        with self._lock:
+            return self._writing
+
+    def wait(self, timeout: None | float = None) -> None:
+        """ Wait for the current save to finish, ignoring its errors """
+        with self._lock:
+            future = self._future
+        if future is not None:
+            try:
+                future.result(timeout)
+            except Exception:
+                pass
+
+    def shutdown(self) -> None:
+        """ Finish the pending save and stop the worker """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
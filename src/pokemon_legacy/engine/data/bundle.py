@@ -0,0 +1,241 @@
+"""
+Compiled game data bundle.
+
+All of the static tables in ``assets/data`` are parsed once and written to a single versioned binary file, so
+a cold start reads one file instead of parsing a dozen CSVs. Each source file is recorded in the bundle
+manifest with its size, modification time and content hash; a source whose stat has changed is re-hashed and
+the bundle is rebuilt if the content differs.
+
+Build the bundle ahead of time with::
+
+    python -m pokemon_legacy.engine.data
+"""
+import glob
+import hashlib
+import json
+import os
+import pickle
+import struct
+import sys
+from typing import Any
+
+from pokemon_legacy.constants import DATA_PATH
+
+BUNDLE_PATH = os.path.join(DATA_PATH, "compiled/game_data.bundle")
+BUNDLE_MAGIC = b"PLGD"
+BUNDLE_VERSION = 1
+
+# magic, format version, sha256 of the payload
+_HEADER = struct.Struct("<4sI32s")
+
+# source files relative to the data directory, and how each one is parsed. Patterns are expanded with glob.
+TABLES: dict[str, dict] = {
+    "Moves.tsv": {"delimiter": "\t", "index_col": 0},
+    "abilities.tsv": {"delimiter": "\t", "index_col": 0},
+    "items.tsv": {"delimiter": "\t"},
+    "item_types.tsv": {"delimiter": "\t", "index_col": 0},
+    "battle_item_types.tsv": {"delimiter": "\t", "index_col": 0},
+    "Items/pokeballs.tsv": {"delimiter": "\t", "index_col": 0},
+    "Items/medicine.tsv": {"delimiter": "\t", "index_col": 0},
+    "level_up_exp.tsv": {"delimiter": "\t", "index_col": 6},
+    "effectiveness.csv": {"index_col": 0},
+    "natures.tsv": {"delimiter": "\t", "index_col": 0},
+    "pokedex/LocalDex/LocalDex.pickle": {},
+    "pokedex/Local Dex.tsv": {"delimiter": "\t", "index_col": 1},
+    "pokedex/NationalDex/NationalDex.tsv": {"delimiter": "\t", "index_col": 0},
+    "pokedex/AttributeDex.tsv": {"delimiter": "\t", "index_col": 1},
+    "Locations/*.tsv": {"delimiter": "\t", "index_col": 0},
+    "game_config/*.json": {},
+}
+
+
+def parse_table(path: str, **kwargs) -> Any:
+    """
+    Parse a single source file.
+
+    :param path: path to the source file
+    :param kwargs: keyword arguments passed to ``pd.read_csv`` for csv/tsv files
+    :return: a DataFrame for tables, or the unpickled / decoded object for pickle and json files
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".pickle":
+        with open(path, "rb") as file:
+            return pickle.load(file)
+    if ext == ".json":
+        with open(path, "r") as file:
+            return json.load(file)
+
+    # pandas is only imported once a table needs compiling, so importing the data modules stays cheap
+    import pandas as pd
+    return pd.read_csv(path, **kwargs)
+
+
+def file_hash(path: str) -> str:
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+class GameData:
+    """
+    Shared access to the static game tables, backed by the compiled bundle.
+
+    The bundle is read the first time a table is requested. Missing or stale entries are parsed from the
+    source files and the bundle is rewritten, so the data is always consistent with ``assets/data``.
+    """
+    _instance = None
+
+    def __init__(self, data_path: str = DATA_PATH, bundle_path: str = BUNDLE_PATH, tables: None | dict = None):
+        """
+        :param data_path: the directory containing the source data
+        :param bundle_path: where the compiled bundle is stored
+        :param tables: the table specs to compile, defaults to ``TABLES``
+        """
+        self.data_path = data_path
+        self.bundle_path = bundle_path
+        self.specs = TABLES if tables is None else tables
+
+        self._tables: None | dict[str, Any] = None
+        self._manifest: dict[str, tuple] = {}
+        self._dirty = False
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = GameData()
+        return cls._instance
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.tables
+
+    @property
+    def tables(self) -> dict[str, Any]:
+        if self._tables is None:
+            self.load()
+        return self._tables
+
+    def table(self, name: str) -> Any:
+        """
+        Return a parsed table. The returned object is shared, copy it before mutating.
+
+        :param name: the source path relative to the data directory, e.g. ``"Locations/Route 202.tsv"``
+        """
+        try:
+            return self.tables[name]
+        except KeyError:
+            raise KeyError(f"{name} is not a compiled game data table") from None
+
+    # ========== SOURCES ==========
+    def sources(self) -> dict[str, dict]:
+        """ Expand the table specs into the source files they cover, with their parse arguments """
+        sources = {}
+        for pattern, kwargs in self.specs.items():
+            if glob.has_magic(pattern):
+                for path in sorted(glob.glob(os.path.join(glob.escape(self.data_path), pattern))):
+                    sources[os.path.relpath(path, self.data_path).replace(os.sep, "/")] = kwargs
+            else:
+                sources[pattern] = kwargs
+
+        return sources
+
+    def _stat(self, name: str) -> tuple[int, int]:
+        stat = os.stat(os.path.join(self.data_path, name))
+        return stat.st_size, stat.st_mtime_ns
+
+    def _is_current(self, name: str, kwargs: dict) -> bool:
+        """ Check a source against its manifest entry, only re-hashing the file if its stat has changed """
+        entry = self._manifest.get(name)
+        if entry is None or entry[3] != repr(kwargs):
+            return False
+
+        stat = self._stat(name)
+        if stat == entry[:2]:
+            return True
+
+        digest = file_hash(os.path.join(self.data_path, name))
+        if digest != entry[2]:
+            return False
+
+        # same content, new stat: refresh the entry so the file is not hashed again
+        self._manifest[name] = (*stat, digest, entry[3])
+        self._dirty = True
+        return True
+
+    # ========== BUNDLE ==========
+    def load(self):
+        """ Read the bundle, recompiling any tables whose source has changed """
+        self._tables, self._manifest = self._read_bundle()
+        self._dirty = False
+
+        sources = self.sources()
+        stale = [name for name, kwargs in sources.items() if not self._is_current(name, kwargs)]
+        removed = self._tables.keys() - sources.keys()
+
+        for name in removed:
+            self._tables.pop(name)
+            self._manifest.pop(name, None)
+        for name in stale:
+            self._compile(name, sources[name])
+
+        if stale or removed or self._dirty:
+            self.write()
+
+    def build(self) -> str:
+        """
+        Compile every table from source and write the bundle.
+
+        :return: the path of the written bundle
+        """
+        self._tables, self._manifest = {}, {}
+        for name, kwargs in self.sources().items():
+            self._compile(name, kwargs)
+
+        self.write()
+        return self.bundle_path
+
+    def _compile(self, name: str, kwargs: dict):
+        path = os.path.join(self.data_path, name)
+        self._tables[name] = parse_table(path, **kwargs)
+        self._manifest[name] = (*self._stat(name), file_hash(path), repr(kwargs))
+
+    def _read_bundle(self) -> tuple[dict, dict]:
+        """ Read the bundle in a single pass, returning empty tables if it is missing, corrupt or out of date """
+        try:
+            with open(self.bundle_path, "rb") as file:
+                data = file.read()
+        except OSError:
+            return {}, {}
+
+        if len(data) < _HEADER.size:
+            return {}, {}
+
+        magic, version, digest = _HEADER.unpack_from(data)
+        payload = memoryview(data)[_HEADER.size:]
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION or hashlib.sha256(payload).digest() != digest:
+            return {}, {}
+
+        try:
+            bundle = pickle.loads(payload)
+        except Exception:
+            return {}, {}
+
+        return bundle["tables"], bundle["manifest"]
+
+    def write(self):
+        """ Write the bundle atomically. The tables stay available in memory if the write fails. """
+        payload = pickle.dumps({"manifest": self._manifest, "tables": self._tables}, protocol=pickle.HIGHEST_PROTOCOL)
+        header = _HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, hashlib.sha256(payload).digest())
+
+        temp_path = f"{self.bundle_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.bundle_path), exist_ok=True)
+            with open(temp_path, "wb") as file:
+                file.write(header)
+                file.write(payload)
+            os.replace(temp_path, self.bundle_path)
+            self._dirty = False
+        except OSError as e:
+            print(f"Could not write game data bundle: {e}", file=sys.stderr)
+
+
+game_data = GameData.get_instance()
+
@@ -0,0 +1,323 @@
+import math
+from typing import NamedTuple
+
+from pokemon_legacy.engine.data.bundle import game_data
+
+
+# the form indexed by number for species that only have alternate forms in the pokedex
+DEFAULT_FORMS = ("Burmy (Plant Cloak)", "Wormadam (Plant Cloak)")
+
+
+class SpeciesRecord(NamedTuple):
+    """ Immutable species data, as used to construct a Pokémon """
+    name: str
+    local_id: int
+    national_id: int
+    species: str
+    type1: str
+    type2: None | str
+    growth_rate: str
+    catch_rate: None | int
+    base_exp: None | int
+    ev_yield: tuple[int, ...]
+    base_stats: tuple[int, ...]
+    abilities: tuple[str, ...]
+    gender: None | tuple[float, float]
+    learnset: tuple[tuple[str, int], ...]
+    evolve_level: None | int
+
+
+class MoveRecord(NamedTuple):
+    """ Immutable move data. The effect is the comma separated effect spec, e.g. ("Stat", "10", ...) """
+    move_id: int
+    name: str
+    type: str
+    category: str
+    power: None | int
+    accuracy: None | int
+    pp: int
+    description: None | str
+    effect: None | tuple[str, ...]
+
+
+class ItemRecord(NamedTuple):
+    """ Immutable item data, merged from the item, item type, medicine and pokeball tables """
+    item_id: int
+    name: str
+    display_name: None | str = None
+    description: None | str = None
+    buy_price: None | float = None
+    sell_price: None | float = None
+    item_type: None | str = None
+    battle_item_type: None | str = None
+    heal_amount: None | int = None
+    status: None | str = None
+    battle_type: None | str = None
+    rate_modifier: None | float = None
+    conditions: None | str = None
+
+
+class AbilityRecord(NamedTuple):
+    ability_id: int
+    name: str
+    description: None | str
+    generation: None | int
+
+
+def _value(val):
+    """ Convert missing values to None and numpy scalars to python values """
+    if isinstance(val, (list, tuple)):
+        return val
+    val = val.item() if hasattr(val, "item") else val
+    if val is None or (isinstance(val, float) and math.isnan(val)):
+        return None
+    return val
+
+
+def _int(val) -> None | int:
+    """ Convert a numeric field to an int. Missing or non-numeric values (e.g. "-" or "∞") become None """
+    val = _value(val)
+    try:
+        return int(float(val))
+    except (TypeError, ValueError):
+        return None
+
+
+class RecordStore:
+    """
+    Read-only store of the static game data (species, moves, items, abilities and lookup tables).
+
+    Each table is built from the data files the first time it is accessed and then held as plain
+    dicts of immutable records, indexed by name and by ID, so runtime lookups never touch pandas.
+    """
+    _instance = None
+
+    def __init__(self):
+        self._species: None | dict[str, SpeciesRecord] = None
+        self._species_by_id: None | dict[int, SpeciesRecord] = None
+        self._moves: None | dict[str, MoveRecord] = None
+        self._moves_by_id: None | dict[int, MoveRecord] = None
+        self._items: None | dict[str, ItemRecord] = None
+        self._items_by_id: None | dict[int, ItemRecord] = None
+        self._items_lower: None | dict[str, ItemRecord] = None
+        self._abilities: None | dict[str, AbilityRecord] = None
+        self._abilities_by_id: None | dict[int, AbilityRecord] = None
+        self._level_exp: None | dict[str, dict[int, int]] = None
+        self._effectiveness: None | dict[tuple[str, str], float] = None
+        self._natures: None | tuple[str, ...] = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = RecordStore()
+        return cls._instance
+
+    def preload(self):
+        """ Build every table now rather than on first use, e.g. on a loading thread """
+        for table in ("species", "moves", "items", "abilities", "level_exp", "effectiveness", "natures"):
+            getattr(self, table)
+
+    # ========== SPECIES ==========
+    @property
+    def species(self) -> dict[str, SpeciesRecord]:
+        if self._species is None:
+            self._load_species()
+        return self._species
+
+    @property
+    def species_by_id(self) -> dict[int, SpeciesRecord]:
+        if self._species_by_id is None:
+            self._load_species()
+        return self._species_by_id
+
+    def _load_species(self):
+        pokedex = game_data.table("pokedex/LocalDex/LocalDex.pickle")
+        old_pokedex = game_data.table("pokedex/Local Dex.tsv")
+        national_dex = game_data.table("pokedex/NationalDex/NationalDex.tsv")
+
+        species, species_by_id = {}, {}
+        for name, row in pokedex.iterrows():
+            types = (row.Type, None) if isinstance(row.Type, str) else tuple(row.Type)
+            evolve_level = _int(old_pokedex.at[name, "Evolve_Level"]) if name in old_pokedex.index else None
+
+            record = SpeciesRecord(
+                name=name,
+                local_id=int(row.Local_Num),
+                national_id=int(row.National_Num),
+                species=national_dex.at[name, "Species"],
+                type1=types[0],
+                type2=types[1],
+                growth_rate=row.Growth_Rate,
+                catch_rate=_int(row.Catch_Rate),
+                base_exp=_int(row.Base_Exp),
+                ev_yield=tuple(row.EV_Yield),
+                base_stats=tuple(row.Stats),
+                abilities=tuple(row.Abilities),
+                gender=tuple(row.Gender) if row.Gender else None,
+                learnset=tuple((move, int(level)) for move, level in row.Learnset),
+                evolve_level=evolve_level,
+            )
+            species[name] = record
+
+            # alternate forms (Mega, Alolan, cloaks) share a local number with their base form; only the base forms,
+            # named as in the old local dex, are indexed by number
+            if name in old_pokedex.index or name in DEFAULT_FORMS:
+                species_by_id[record.local_id] = record
+
+        self._species, self._species_by_id = species, species_by_id
+
+    # ========== MOVES ==========
+    @property
+    def moves(self) -> dict[str, MoveRecord]:
+        if self._moves is None:
+            self._load_moves()
+        return self._moves
+
+    @property
+    def moves_by_id(self) -> dict[int, MoveRecord]:
+        if self._moves_by_id is None:
+            self._load_moves()
+        return self._moves_by_id
+
+    def _load_moves(self):
+        moves_data = game_data.table("Moves.tsv")
+
+        moves = {}
+        for move_id, (name, row) in enumerate(moves_data.iterrows()):
+            effect = _value(row.Effect)
+            moves[name] = MoveRecord(
+                move_id=move_id,
+                name=name,
+                type=row.Type.title(),
+                category=row.Cat,
+                power=_int(row.Power),
+                accuracy=_int(row.Acc),
+                pp=_int(row.PP) or 0,
+                description=_value(row.Description),
+                effect=tuple(effect[1: len(effect) - 1].split(", ")) if effect else None,
+            )
+
+        self._moves = moves
+        self._moves_by_id = {move.move_id: move for move in moves.values()}
+
+    # ========== ITEMS ==========
+    @property
+    def items(self) -> dict[str, ItemRecord]:
+        if self._items is None:
+            self._load_items()
+        return self._items
+
+    @property
+    def items_by_id(self) -> dict[int, ItemRecord]:
+        if self._items_by_id is None:
+            self._load_items()
+        return self._items_by_id
+
+    def get_item(self, name: str) -> None | ItemRecord:
+        """ Return the item record with the given name (case-insensitive) """
+        item = self.items.get(name)
+        if item is None:
+            item = self._items_lower.get(name.lower())
+        return item
+
+    def _load_items(self):
+        item_data = game_data.table("items.tsv")
+        item_types = game_data.table("item_types.tsv")
+        battle_item_types = game_data.table("battle_item_types.tsv")
+        pokeballs = game_data.table("Items/pokeballs.tsv")
+        medicine = game_data.table("Items/medicine.tsv")
+
+        item_data = item_data.merge(item_types, on="item_type_id", how="left", suffixes=["", "_item_type"])
+        item_data = item_data.merge(battle_item_types, on="battle_item_type_id", how="left",
+                                    suffixes=["", "_battle_item_type"])
+        item_data = item_data.merge(medicine, on="item_id", how="left").merge(pokeballs, on="item_id", how="left")
+
+        items = {}
+        for row in item_data.itertuples(index=False):
+            items[row.name] = ItemRecord(
+                item_id=int(row.item_id),
+                name=row.name,
+                display_name=_value(row.display_name),
+                description=_value(row.description),
+                buy_price=_value(row.buy_price),
+                sell_price=_value(row.sell_price),
+                item_type=_value(row.name_item_type),
+                battle_item_type=_value(row.name_battle_item_type),
+                heal_amount=_int(row.heal_amount),
+                status=_value(row.status),
+                battle_type=_value(row.battle_type),
+                rate_modifier=_value(row.Rate_Modifier),
+                conditions=_value(row.Conditions),
+            )
+
+        self._items = items
+        self._items_by_id = {item.item_id: item for item in items.values()}
+        self._items_lower = {name.lower(): item for name, item in items.items()}
+
+    # ========== ABILITIES ==========
+    @property
+    def abilities(self) -> dict[str, AbilityRecord]:
+        if self._abilities is None:
+            self._load_abilities()
+        return self._abilities
+
+    @property
+    def abilities_by_id(self) -> dict[int, AbilityRecord]:
+        if self._abilities_by_id is None:
+            self._load_abilities()
+        return self._abilities_by_id
+
+    def _load_abilities(self):
+        ability_data = game_data.table("abilities.tsv")
+
+        abilities = {}
+        for ability_id, row in ability_data.iterrows():
+            abilities.setdefault(row["name"], AbilityRecord(
+                ability_id=int(ability_id),
+                name=row["name"],
+                description=_value(row["description"]),
+                generation=_int(row["generation"]),
+            ))
+
+        self._abilities = abilities
+        self._abilities_by_id = {ability.ability_id: ability for ability in abilities.values()}
+
+    # ========== LOOKUP TABLES ==========
+    @property
+    def level_exp(self) -> dict[str, dict[int, int]]:
+        """ Total exp required to reach each level, indexed by growth rate then level """
+        if self._level_exp is None:
+            level_up_values = game_data.table("level_up_exp.tsv")
+            self._level_exp = {
+                growth_rate: {int(level): int(exp) for level, exp in values.items()}
+                for growth_rate, values in level_up_values.select_dtypes("number").items()
+            }
+        return self._level_exp
+
+    @property
+    def effectiveness(self) -> dict[tuple[str, str], float]:
+        """ Damage multiplier indexed by (attacking type, defending type), e.g. ("Fire", "Grass") """
+        if self._effectiveness is None:
+            effectiveness = game_data.table("effectiveness.csv")
+            self._effectiveness = {
+                (attack_type.title(), defence_type.title()): float(multiplier)
+                for attack_type, row in effectiveness.iterrows()
+                for defence_type, multiplier in row.items()
+            }
+        return self._effectiveness
+
+    @property
+    def natures(self) -> tuple[str, ...]:
+        if self._natures is None:
+            natures = game_data.table("natures.tsv")
+            self._natures = tuple(natures.Name)
+        return self._natures
+
+    def get_effectiveness(self, move_type: str, target_type: None | str) -> float:
+        """ Return the damage multiplier of a move type against a defending type (1 for no type) """
+        if target_type is None:
+            return 1
+        return self.effectiveness[(move_type.title(), target_type.title())]
+
+
+records = RecordStore.get_instance()
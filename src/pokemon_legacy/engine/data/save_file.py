@@ -0,0 +1,365 @@
+"""
+Component-wise save files.
+
+A save slot used to be a pickle of the whole ``Game`` (over half a megabyte, with a full copy on every save), and
+loading unpickled engine objects only to rebuild every display from them. A slot is now a directory of plain JSON
+files, one per component (story, player, team, bag, pokedex and map state), plus a manifest recording the format
+version and the content hash of each component. Saving serialises every component but only rewrites the ones whose
+content has changed. Each component revision is written to a new file and the manifest is then replaced with
+``os.replace``, so a crash mid-save leaves the manifest pointing at the previous, complete version.
+
+Slots written before the component format (a single ``game_state.json``) are read and split into components, and
+are written in the new format on the next save.
+
+Each save also writes a header of a few hundred bytes (player, play time, story state, map and party) so the save
+slots can be listed without reading their components, see ``list_slots``.
+"""
+import glob
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any
+
+from pokemon_legacy.constants import DATA_PATH
+from pokemon_legacy.engine.data.records import records
+
+SAVE_DIR = os.path.join(DATA_PATH, "save_states")
+SAVE_VERSION = 2
+
+COMPONENTS = ("story", "player", "team", "bag", "pokedex", "maps")
+
+MANIFEST_FILE = "manifest.json"
+HEADER_FILE = "header.json"
+LEGACY_FILE = "game_state.json"
+
+
+class SaveError(Exception):
+    """ The save slot could not be read """
+
+
+def slot_dir(save_slot: int | str) -> str:
+    """ Return the directory of a save slot, e.g. ``save_state_1`` """
+    return os.path.join(SAVE_DIR, f"save_state_{save_slot}")
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """ Write a file by writing a temporary file next to it and moving it into place """
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+def encode(data: Any) -> bytes:
+    return json.dumps(data, indent=4, sort_keys=True).encode("utf-8")
+
+
+def migrate_legacy(state: dict) -> dict[str, Any]:
+    """
+    Split a legacy ``game_state.json`` into components.
+
+    :param state: the legacy save, with game_state, player and game_display keys
+    """
+    player = dict(state.get("player", {}))
+    display = state.get("game_display", {})
+    return {
+        "story": {"game_state": state.get("game_state", "new_game")},
+        "player": {
+            "steps": player.get("steps", 0),
+            "money": player.get("money", 0),
+            "positions": player.get("positions", []),
+            "map_name": display.get("map_name"),
+            "collection_name": display.get("collection_name"),
+        },
+        "team": player.get("team", []),
+        "bag": player.get("bag"),
+        "pokedex": {"appearances": {}, "caught": []},
+        "maps": {},
+    }
+
+
+@dataclass
+class SlotHeader:
+    """ A summary of a save slot, for listing the slots """
+    version: int = SAVE_VERSION
+    saved_at: None | str = None
+    player_name: str = ""
+    play_time: float = 0.0
+    game_state: str = "new_game"
+    map_name: None | str = None
+    collection_name: None | str = None
+    party: list[int] = field(default_factory=list)
+    # the hash of the manifest written with this header
+    checksum: None | str = None
+
+    @classmethod
+    def from_components(cls, components: dict[str, Any], **kwargs) -> "SlotHeader":
+        """
+        Summarise the save components.
+
+        :param components: the JSON data of each save component
+        :param kwargs: the saved_at and checksum of the save
+        """
+        player = components.get("player", {})
+        party = [
+            records.species[pk["name"]].national_id for pk in components.get("team", []) or []
+            if pk.get("name") in records.species
+        ]
+        return cls(
+            player_name=player.get("name", ""),
+            play_time=player.get("play_time", 0.0),
+            game_state=components.get("story", {}).get("game_state", "new_game"),
+            map_name=player.get("map_name"),
+            collection_name=player.get("collection_name"),
+            party=party,
+            **kwargs,
+        )
+
+    @classmethod
+    def from_json(cls, data: dict) -> "SlotHeader":
+        return cls(**{key: value for key, value in data.items() if key in cls.__dataclass_fields__})
+
+    def get_json_data(self) -> dict:
+        return asdict(self)
+
+    @property
+    def play_time_str(self) -> str:
+        """ The play time as hours and minutes, e.g. ``12:05`` """
+        minutes = int(self.play_time // 60)
+        return f"{minutes // 60}:{minutes % 60:02d}"
+
+
+def list_slots(save_dir: str = SAVE_DIR) -> dict[str, SlotHeader]:
+    """
+    Read the header of every save slot.
+
+    :param save_dir: the directory holding the save slots
+    :return: the header of each slot that has been saved, by slot name
+    """
+    slots = {}
+    for path in sorted(glob.glob(os.path.join(save_dir, "save_state_*"))):
+        try:
+            header = SaveFile(path).read_header()
+        except (SaveError, OSError, ValueError):
+            continue
+        if header is not None:
+            slots[os.path.basename(path).removeprefix("save_state_")] = header
+    return slots
+
+
+class SaveFile:
+    """ A save slot on disk: a manifest and one JSON file per component """
+
+    def __init__(self, save_dir: str):
+        """
+        :param save_dir: the directory of the save slot
+        """
+        self.save_dir = save_dir
+        self.manifest_path = os.path.join(save_dir, MANIFEST_FILE)
+        self.header_path = os.path.join(save_dir, HEADER_FILE)
+
+        # the file, content hash and revision of each component as last read or written
+        self._files: dict[str, str] = {}
+        self._hashes: dict[str, str] = {}
+        self._revisions: dict[str, int] = {}
+
+    @classmethod
+    def for_slot(cls, save_slot: int | str) -> "SaveFile":
+        return cls(slot_dir(save_slot))
+
+    def __repr__(self):
+        return f"SaveFile({self.save_dir})"
+
+    def exists(self) -> bool:
+        return os.path.exists(self.manifest_path) or os.path.exists(os.path.join(self.save_dir, LEGACY_FILE))
+
+    # ========== READ ==========
+    def read_manifest(self) -> None | dict:
+        """ Return the manifest, or None if the slot has not been saved in the component format """
+        try:
+            with open(self.manifest_path, "r") as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            raise SaveError(f"Corrupt save manifest {self.manifest_path}") from e
+
+        if manifest.get("version", 0) > SAVE_VERSION:
+            raise SaveError(f"Save version {manifest['version']} is newer than supported version {SAVE_VERSION}")
+        return manifest
+
+    def read_header(self) -> None | SlotHeader:
+        """
+        Read the header of the slot. Slots saved before headers were written, and headers left stale by a crash
+        between the manifest and header writes, are summarised from their components.
+
+        :return: the header, or None if the slot is empty
+        """
+        checksum = self.manifest_checksum()
+        try:
+            with open(self.header_path, "r") as file:
+                header = SlotHeader.from_json(json.load(file))
+            if header.checksum == checksum:
+                return header
+        except FileNotFoundError:
+            pass
+        except ValueError:
+            # the header is only a summary, fall back to the components
+            pass
+
+        components = self.load()
+        if components is None:
+            return None
+        manifest = self.read_manifest()
+        return SlotHeader.from_components(
+            components,
+            saved_at=manifest.get("saved_at") if manifest else None,
+            checksum=checksum,
+        )
+
+    def manifest_checksum(self) -> None | str:
+        """ Return the hash of the manifest, compare with ``SlotHeader.checksum`` to check a header is current """
+        try:
+            with open(self.manifest_path, "rb") as file:
+                return hashlib.sha1(file.read()).hexdigest()
+        except FileNotFoundError:
+            return None
+
+    def load(self) -> None | dict[str, Any]:
+        """
+        Read every component of the slot.
+
+        :return: the data of each component, or None if the slot is empty
+        """
+        manifest = self.read_manifest()
+        if manifest is None:
+            legacy_path = os.path.join(self.save_dir, LEGACY_FILE)
+            if not os.path.exists(legacy_path):
+                return None
+            try:
+                with open(legacy_path, "r") as file:
+                    return migrate_legacy(json.load(file))
+            except (OSError, ValueError, AttributeError) as e:
+                raise SaveError(f"Corrupt legacy save {legacy_path}") from e
+
+        missing = [component for component in COMPONENTS if component not in manifest.get("components", {})]
+        if missing:
+            raise SaveError(f"Save manifest {self.manifest_path} is missing components {missing}")
+
+        components = {}
+        for component, entry in manifest["components"].items():
+            try:
+                with open(os.path.join(self.save_dir, entry["file"]), "rb") as file:
+                    data = file.read()
+            except (OSError, KeyError, TypeError) as e:
+                raise SaveError(f"Save component {component} could not be read") from e
+
+            if hashlib.sha1(data).hexdigest() != entry.get("hash"):
+                raise SaveError(f"Save component {component} does not match its manifest")
+
+            try:
+                components[component] = json.loads(data)
+            except ValueError as e:
+                raise SaveError(f"Save component {component} is not valid JSON") from e
+
+        self._track(manifest)
+        return components
+
+    def _track(self, manifest: dict) -> None:
+        """ Track the components of a manifest as the current version on disk """
+        for component, entry in manifest["components"].items():
+            self._files[component] = entry["file"]
+            self._hashes[component] = entry["hash"]
+            self._revisions[component] = entry.get("revision", 0)
+
+    # ========== WRITE ==========
+    def move_aside(self) -> None | str:
+        """
+        Move an unreadable slot out of the way, keeping its files, so a new game can be saved in its place.
+
+        :return: the directory the slot was moved to, or None if the slot has no directory
+        """
+        if not os.path.exists(self.save_dir):
+            return None
+
+        stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        path = os.path.join(os.path.dirname(self.save_dir), f"unreadable_{os.path.basename(self.save_dir)}_{stamp}")
+        os.replace(self.save_dir, path)
+
+        self._files.clear()
+        self._hashes.clear()
+        self._revisions.clear()
+        return path
+
+    def dirty(self, components: dict[str, Any]) -> dict[str, bytes]:
+        """ Return the encoded components whose content differs from the slot on disk """
+        encoded = {component: encode(data) for component, data in components.items()}
+        return {
+            component: data for component, data in encoded.items()
+            if hashlib.sha1(data).hexdigest() != self._hashes.get(component)
+        }
+
+    def save(self, components: dict[str, Any]) -> list[str]:
+        """
+        Write the components that have changed, then the manifest.
+
+        :param components: the JSON data of each component
+        :return: the names of the components written
+        """
+        if not self._files:
+            # saving over a slot that was not loaded, replace its components rather than orphaning them
+            manifest = self.read_manifest()
+            if manifest is not None:
+                self._track(manifest)
+
+        dirty = self.dirty(components)
+        if not dirty and os.path.exists(self.manifest_path):
+            return []
+
+        os.makedirs(self.save_dir, exist_ok=True)
+        replaced = []
+        for component, data in dirty.items():
+            revision = self._revisions.get(component, 0) + 1
+            file_name = f"{component}.{revision}.json"
+            atomic_write(os.path.join(self.save_dir, file_name), data)
+
+            if component in self._files:
+                replaced.append(self._files[component])
+            self._files[component] = file_name
+            self._hashes[component] = hashlib.sha1(data).hexdigest()
+            self._revisions[component] = revision
+
+        saved_at = datetime.now().isoformat(timespec="seconds")
+        manifest = {
+            "version": SAVE_VERSION,
+            "saved_at": saved_at,
+            "components": {
+                component: {
+                    "file": self._files[component],
+                    "hash": self._hashes[component],
+                    "revision": self._revisions[component],
+                }
+                for component in self._files
+            },
+        }
+        # the manifest is replaced last, so it never references a component that was not fully written
+        manifest_data = encode(manifest)
+        atomic_write(self.manifest_path, manifest_data)
+
+        # the header is a summary for listing slots, its checksum ties it to this manifest
+        header = SlotHeader.from_components(
+            components, saved_at=saved_at, checksum=hashlib.sha1(manifest_data).hexdigest()
+        )
+        atomic_write(self.header_path, json.dumps(header.get_json_data(), separators=(",", ":")).encode("utf-8"))
+
+        for file_name in replaced:
+            try:
+                os.remove(os.path.join(self.save_dir, file_name))
+            except FileNotFoundError:
+                pass
+
+        return list(dirty)
@@ -1,20 +1,38 @@
 """
 game_log .py
 
+The game log streams events to a JSON lines file, one record per event, as the game runs. Events are handed to a
+background writer thread, which writes them in batches and flushes after each batch, so adding an event never waits on
+the disk and a crash loses at most the batch being written. Only the most recent events are kept in memory, in a ring
+buffer that can be dumped when the game crashes.
+
+If the log file cannot be written (e.g. the disk is full) the writer stops writing and later events are only kept in
+the ring buffer, and if the writer falls behind, events beyond ``max_queued`` are not written rather than queued.
 """
-import os
+import atexit
 import datetime
+import json
+import os
+import queue
+import threading
+import warnings
+from collections import deque
 from enum import Enum
+from typing import Iterable
+
+LOG_DIR = "assets/data/logs"
 
 
 class GameEventType(Enum):
     error = -1
     system = 0
     game = 1
-    user = 1
+    user = 2
 
 
 class GameEvent:
+    __slots__ = ("name", "timestamp", "event_type")
+
     def __init__(self, name: str, event_type: GameEventType = GameEventType.system):
         """
 
@@ -30,18 +48,147 @@ class GameEvent:
     def __repr__(self):
         return self.__str__()
 
+    def get_json_data(self) -> dict:
+        return {
+            "time": self.timestamp.isoformat(timespec="milliseconds"),
+            "type": self.event_type.name,
+            "name": self.name,
+        }
+
 
 class GameLog:
-    def __init__(self):
-        self.events: list[GameEvent] = []
+    def __init__(
+            self,
+            log_dir: None | str = LOG_DIR,
+            capacity: int = 1000,
+            event_types: None | Iterable[GameEventType] = None,
+            batch_size: int = 64,
+            max_queued: int = 10000,
+    ):
+        """
+        :param log_dir: the directory to stream the log to, or None to keep events in memory only
+        :param capacity: the number of recent events kept in memory
+        :param event_types: the event types to log, or None for every type
+        :param batch_size: the most events written at once, events queued while a batch is written form the next batch
+        :param max_queued: the most events waiting to be written, further events are only kept in memory
+        """
+        self.events: deque[GameEvent] = deque(maxlen=capacity)
+        self.event_types: None | frozenset[GameEventType] = None if event_types is None else frozenset(event_types)
+        self.batch_size = batch_size
+
+        self.log_path: None | str = None
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queued)
+        self._writer: None | threading.Thread = None
+
+        # the error that stopped the writer, and the number of events not written because the queue was full
+        self.write_error: None | OSError = None
+        self.dropped = 0
+
+        if log_dir is not None:
+            os.makedirs(log_dir, exist_ok=True)
+            file_name = f"game_log_{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.jsonl"
+            self.log_path = os.path.join(log_dir, file_name)
+
+            self._writer = threading.Thread(target=self._write_loop, name="game_log", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
+
+    def __len__(self):
+        return len(self.events)
 
     def add_event(self, event: GameEvent):
+        if self.event_types is not None and event.event_type not in self.event_types:
+            return
+
         self.events.append(event)
+        if self._writer is not None and self.write_error is None:
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                self.dropped += 1
+
+    def recent(self, event_type: None | GameEventType = None) -> list[GameEvent]:
+        """ Return the events in the ring buffer, oldest first, optionally of one type """
+        return [event for event in list(self.events) if event_type is None or event.event_type == event_type]
 
-    def write_log(self, log_dir: str):
-        if not os.path.exists(log_dir):
-            os.mkdir(log_dir)
+    # ========== WRITING ==========
+    def _write_loop(self):
+        """
+        Write queued events in batches until the log is closed. After a write error the queue is still drained, so
+        ``flush`` and ``close`` do not wait on events that will never be written.
+        """
+        try:
+            log = open(self.log_path, "a", encoding="utf-8")
+        except OSError as e:
+            log = self._write_failed(e)
+
+        try:
+            while True:
+                batch = [self._queue.get()]
+
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                closing = any(event is None for event in batch)
+                if log is not None:
+                    try:
+                        log.writelines(json.dumps(event.get_json_data()) + "\n" for event in batch if event is not None)
+                        log.flush()
+                    except OSError as e:
+                        self._close_file(log)
+                        log = self._write_failed(e)
+
+                for _ in batch:
+                    self._queue.task_done()
+
+                if closing:
+                    return
+        finally:
+            if log is not None:
+                self._close_file(log)
+
+    @staticmethod
+    def _close_file(log) -> None:
+        try:
+            log.close()
+        except OSError:
+            # closing flushes what is left in the buffer, which fails again after a write error
+            pass
 
-        with open(os.path.join(log_dir, f"game_log_{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"), "w") as log:
-            for event in self.events:
-                log.write(str(event) + "\n")
+    def _write_failed(self, error: OSError) -> None:
+        """ Stop queueing events for the writer """
+        self.write_error = error
+        warnings.warn(f"Could not write the game log {self.log_path}, later events are only kept in memory ({error})")
+
+    def flush(self):
+        """ Wait until every event added so far has been written """
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.join()
+
+    def write_log(self, log_dir: None | str = None):
+        """ Wait for the log to be written; events are streamed to the log file as they are added """
+        self.flush()
+
+    def close(self):
+        """ Write the remaining events and stop the writer, later events are only kept in memory """
+        writer, self._writer = self._writer, None
+        if writer is not None and writer.is_alive():
+            self._queue.put(None)
+            writer.join()
+        atexit.unregister(self.close)
+
+    def dump(self, path: str, event_type: None | GameEventType = None) -> str:
+        """
+        Write the events in the ring buffer to a file, e.g. after a crash.
+
+        :param path: the file to write
+        :param event_type: only dump events of this type
+        :return: the path written
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            for event in self.recent(event_type):
+                file.write(json.dumps(event.get_json_data()) + "\n")
+        return path
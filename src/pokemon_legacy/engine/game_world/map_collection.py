@@ -5,6 +5,7 @@ import pygame as pg
 
 from pokemon_legacy.engine.game_world.tiled_map import TiledMap2, LinkType, MapLinkTile
 from pokemon_legacy.engine.characters.player import Player2
+from pokemon_legacy.engine.general.telemetry import telemetry
 
 from pokemon_legacy.engine.errors import MapError
 
@@ -70,6 +71,7 @@ class MapCollection:
     def detect_map_edge(self):
         return self.map.detect_map_edge()
 
+    @telemetry.timed("map_collection.get_surface")
     def get_surface(self, camera_offset: None | pg.Vector2 = None):
         maps = self._get_active_maps()
 
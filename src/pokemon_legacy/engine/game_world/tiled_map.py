@@ -1,7 +1,9 @@
 import os
+import threading
 import time
 from importlib.resources.abc import Traversable
 from enum import Enum
+from xml.etree import ElementTree
 
 import pygame
 import pygame as pg
@@ -24,6 +26,28 @@ from pokemon_legacy.engine.characters.trainer import Trainer
 from pokemon_legacy.engine.characters.player import Player2
 
 from pokemon_legacy.engine.game_world.game_obejct import GameObject
+from pokemon_legacy.engine.general.telemetry import telemetry
+
+
+# TMX documents parsed ahead of time, e.g. on a startup worker thread, keyed by absolute path
+_tmx_documents: dict[str, ElementTree.Element] = {}
+_tmx_lock = threading.Lock()
+
+
+def preload_tmx(file_paths: list[str]) -> int:
+    """
+    Parse TMX files ahead of time. Parsing does not create any surfaces, so this is safe to run off the main thread;
+    the tile images are still loaded when the map is created.
+
+    :param file_paths: the TMX files to parse
+    :return: the number of files parsed
+    """
+    for file_path in file_paths:
+        root = ElementTree.parse(file_path).getroot()
+        with _tmx_lock:
+            _tmx_documents[os.path.abspath(file_path)] = root
+
+    return len(file_paths)
 
 
 class LinkType(Enum):
@@ -114,7 +138,15 @@ class TiledMap2(TiledMap, MainScreen):
         :param render_mode: the level of verbosity in rendering the map
 
         """
-        TiledMap.__init__(self, file_path, pixelalpha=True, image_loader=pygame_image_loader)
+        with _tmx_lock:
+            document = _tmx_documents.pop(os.path.abspath(file_path), None)
+
+        if document is None:
+            TiledMap.__init__(self, file_path, pixelalpha=True, image_loader=pygame_image_loader)
+        else:
+            TiledMap.__init__(self, None, pixelalpha=True, image_loader=pygame_image_loader)
+            self.filename = file_path
+            self.parse_xml(document)
 
         self.render_mode = render_mode
 
@@ -430,6 +462,7 @@ class TiledMap2(TiledMap, MainScreen):
         trainer = self.player.map_rects[self].collideobjects(trainers, key=lambda o: o.get_vision_rect(self))
         return trainer
 
+    @telemetry.timed("tiled_map.render")
     def render(
             self,
             grid_lines: bool = False,
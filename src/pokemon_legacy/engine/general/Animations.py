@@ -2,55 +2,72 @@ import os
 import time
 
 import numpy as np
-import pandas as pd
+import pygame as pg
 from PIL import Image
 
-from pokemon_legacy.engine.general.image_editor import ImageEditor
+from pokemon_legacy.engine.data.bundle import game_data
 
-import os
-import pandas as pd
 
-DATA_PATH = os.path.join(os.path.dirname(__file__), '../../../../assets/data/pokedex/AttributeDex.tsv')
+def animation_paths(name) -> None | dict[str, str]:
+    """ Return the front and small gif paths of a species, or None if it has no animations """
+    attributes = game_data.table("pokedex/AttributeDex.tsv")
+    folderPath = os.path.join("assets/sprites/Pokemon/Gen IV", name.title())
+    if name not in attributes.index or not os.path.isdir(folderPath):
+        return None
 
-attributes = pd.read_csv(DATA_PATH, delimiter='\t', index_col=1)
-editor = ImageEditor()
+    attributeData = attributes.loc[name]
+
+    front = "Front_Male.gif" if attributeData.Female_Form else "Front.gif"
+    paths = {"front": os.path.join(folderPath, front), "small": os.path.join(folderPath, "Small.gif")}
+    # some species only have still sprites
+    return paths if all(os.path.exists(path) for path in paths.values()) else None
 
 
 def createAnimation(name):
-    attributeData = attributes.loc[name]
+    paths = animation_paths(name)
+    if paths is None:
+        return None
 
-    folderPath = os.path.join("assets/sprites/Pokemon/Gen IV", name.title())
-    if os.path.isdir(folderPath):
-        if not attributeData.Female_Form:
-            frontPath = os.path.join(folderPath, "Front.gif")
-            frontShinyPath = os.path.join(folderPath, "Front_Shiny.gif")
-        else:
-            frontPath = os.path.join(folderPath, "Front_Male.gif")
-            frontShinyPath = os.path.join(folderPath, "Front_Shiny_Male.gif")
+    return Animations(front=getImageAnimation(paths["front"]), small=getImageAnimation(paths["small"]))
+
+
+def decode_gif(path, scale=2) -> list[np.ndarray]:
+    """
+    Decode the frames of a gif, each cropped to its opaque pixels and scaled up. Only uses PIL and numpy, so it is
+    safe to call from a worker thread.
 
-        smallPath = os.path.join(folderPath, "Small.gif")
+    :param path: the gif to decode
+    :param scale: the integer scale of the frames
+    :return: the RGBA frames
+    """
+    frames = []
+    with Image.open(path) as imageAnimation:
+        for frame in range(imageAnimation.n_frames):
+            imageAnimation.seek(frame)
+            imageData = np.asarray(imageAnimation.convert("RGBA"))
 
-        frontAnimation = getImageAnimation(frontPath)
+            rows = np.flatnonzero(imageData[:, :, 3].any(axis=1))
+            cols = np.flatnonzero(imageData[:, :, 3].any(axis=0))
+            if len(rows):
+                imageData = imageData[rows[0]: rows[-1] + 1, cols[0]: cols[-1] + 1]
 
-        smallAnimation = getImageAnimation(smallPath)
+            frames.append(np.ascontiguousarray(imageData.repeat(scale, axis=0).repeat(scale, axis=1)))
 
-        return Animations(front=frontAnimation, small=smallAnimation)
+    return frames
 
-    return None
+
+def to_surface(surface: pg.Surface) -> pg.Surface:
+    """ Convert a surface to the display format, once a display exists """
+    if pg.display.get_init() and pg.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
 
 
 def getImageAnimation(path, verbose=False):
     t1 = time.monotonic()
-    imageAnimation = Image.open(path)
-    animation = []
-    for frame in range(imageAnimation.n_frames):
-        imageAnimation.seek(frame)
-        imageData = np.asarray(imageAnimation.convert("RGBA"))
-        editor.loadData(imageData)
-        editor.crop_transparent_borders(overwrite=True)
-        editor.scaleImage((2, 2), overwrite=True)
-        surf = editor.createSurface(bgr=False)
-        animation.append(surf)
+    animation = [
+        to_surface(pg.image.frombuffer(frame.tobytes(), frame.shape[1::-1], "RGBA")) for frame in decode_gif(path)
+    ]
 
     if verbose:
         print(f"Animation: {time.monotonic() - t1}s")
@@ -62,3 +79,13 @@ class Animations:
         self.front = front
         self.frontShiny = frontShiny
         self.small = small
+
+    @property
+    def nbytes(self) -> int:
+        """ The pixel memory held by the frames. Frames cut from the same strip are counted once. """
+        surfaces = {}
+        for frames in (self.front, self.frontShiny, self.small):
+            for frame in frames or ():
+                parent = frame.get_parent() or frame
+                surfaces[id(parent)] = parent
+        return sum(surf.get_width() * surf.get_height() * surf.get_bytesize() for surf in surfaces.values())
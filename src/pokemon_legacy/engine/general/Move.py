@@ -1,11 +1,8 @@
 import random
 from enum import Enum
+from typing import NamedTuple
 
-import os
-import pandas as pd
-
-DATA_PATH = os.path.join(os.path.dirname(__file__), '../../../../assets/data/Moves.tsv')
-movesData = pd.read_csv(DATA_PATH, delimiter='\t', index_col=0)
+from pokemon_legacy.engine.data.records import records
 
 
 class EffectType(Enum):
@@ -15,114 +12,162 @@ class EffectType(Enum):
     multiple = "Multiple"
 
 
-def getMove(name, move_pp=None):
-    moveData = movesData.loc[name]
+class MoveEffect(NamedTuple):
+    """
+    Parsed secondary effect of a move, e.g. ("Stat", "100", "1", "Attack", "Foe", "Lower") becomes a stat effect
+    with a 100% chance of lowering the foe's attack by one stage.
+    """
+    effect_type: EffectType
+    chance: int = 100
+    condition: None | str = None
+    stages: int = 0
+    stat: None | str = None
+    target: None | str = None
+    direction: None | str = None
+    min_hits: int = 1
+    max_hits: int = 1
+    heal: int = 0
+
+    @classmethod
+    def from_spec(cls, effect: tuple[str, ...]) -> "MoveEffect":
+        """
+        Parse an effect spec from the move data.
+
+        :param effect: the comma separated effect fields, starting with the effect type
+        """
+        effect_type = EffectType(effect[0])
+        if effect_type is EffectType.condition:
+            return cls(effect_type, chance=int(effect[2]), condition=effect[1])
+        elif effect_type is EffectType.stat:
+            return cls(effect_type, chance=int(effect[1]), stages=int(effect[2]), stat=effect[3],
+                       target=effect[4], direction=effect[5])
+        elif effect_type is EffectType.multiple:
+            return cls(effect_type, min_hits=int(effect[1]), max_hits=int(effect[2]))
+
+        return cls(effect_type, heal=int(effect[1]))
 
-    move_pp = move_pp if move_pp is not None else moveData.PP
+    def getEffect(self):
+        """
+        Roll the effect for a single use of the move.
 
-    if not pd.isna(moveData.Effect):
-        effect = moveData.Effect[1: len(moveData.Effect) - 1].split(", ")
-        moveEffect = MoveEffect(effect)
-        move = Move2(name, moveData.Type, moveData.Cat, moveData.Power,
-                     moveData.Acc, move_pp, moveData.Description, moveEffect)
-    else:
-        move = Move2(name, moveData.Type, moveData.Cat, moveData.Power,
-                     moveData.Acc, move_pp, moveData.Description)
+        :return: the inflicted condition, the stat modification [stages, stat, target, direction], the number of
+            hits and the heal amount
+        """
+        inflictCondition, modify, hits, heal = None, None, 1, 0
 
-    return move
+        if self.effect_type is EffectType.condition:
+            if random.randint(0, 99) < self.chance - 1:
+                inflictCondition = self.condition
 
+        elif self.effect_type is EffectType.stat:
+            if random.randint(0, 99) < self.chance - 1:
+                modify = [self.stages, self.stat, self.target, self.direction]
 
-class Move2:
-    def __init__(self, name, moveType, category, power, accuracy, pp, description, effect=None):
-        self.name = name
-        self.type = moveType.title()
-        self.category = category
-        self.maxPP = int(pp)
-        self.PP = int(pp)
-
-        if power != "-":
-            self.power = int(power)
-        else:
-            self.power = None
+        elif self.effect_type is EffectType.multiple:
+            hits = random.randint(self.min_hits, self.max_hits)
 
-        if accuracy != "-":
-            self.accuracy = int(accuracy)
         else:
-            self.accuracy = None
+            heal = self.heal
 
-        if pd.isna(description):
-            self.description = None
-        else:
-            self.description = description
+        return inflictCondition, modify, hits, heal
 
-        self.effect = effect
 
-    def __str__(self):
-        return f"{self.name}: {self.type} {self.category} {self.power} {self.accuracy}"
+class MoveTemplate(NamedTuple):
+    """ Immutable move data shared by every instance of a move """
+    name: str
+    type: str
+    category: str
+    power: None | int
+    accuracy: None | int
+    max_pp: int
+    description: None | str
+    effect: None | MoveEffect
 
-    def __repr__(self):
-        return f"Move({self.name},{self.type},{self.category},{self.power},{self.accuracy})"
 
-    def get_json(self):
-        return {
-            "name": self.name,
-            "pp": self.PP,
-        }
+# templates are built the first time each move is requested and then shared
+_templates: dict[str, MoveTemplate] = {}
 
 
-class MoveEffect:
-    def __init__(self, effect):
-        self.effect = effect
+def get_template(name: str) -> MoveTemplate:
+    template = _templates.get(name)
+    if template is None:
+        data = records.moves[name]
+        template = MoveTemplate(
+            name=name,
+            type=data.type,
+            category=data.category,
+            power=data.power,
+            accuracy=data.accuracy,
+            max_pp=data.pp,
+            description=data.description,
+            effect=MoveEffect.from_spec(data.effect) if data.effect else None,
+        )
+        _templates[name] = template
 
-        if effect[0] == "Condition":
-            self.condition = True
-        else:
-            self.condition = False
+    return template
 
-        if effect[0] == "Stat":
-            self.modify = True
-        else:
-            self.modify = False
 
-        if effect[0] == "Multiple":
-            self.multipleHits = True
-        else:
-            self.multipleHits = False
+def getMove(name, move_pp=None):
+    template = get_template(name)
+    return Move2(template, move_pp if move_pp is not None else template.max_pp)
 
-        if effect[0] == "Heal":
-            self.heal = True
-        else:
-            self.heal = False
 
-        self.duration = 1
+class Move2:
+    """ A move known by a Pokémon: a reference to the shared move template and the remaining PP """
+    __slots__ = ("template", "PP")
 
-    def getEffect(self):
-        if self.condition:
-            num = random.randint(0, 99)
-            if num < int(self.effect[2]) - 1:
-                inflictCondition = self.effect[1]
-            else:
-                inflictCondition = None
-        else:
-            inflictCondition = None
-
-        if self.modify:
-            num = random.randint(0, 99)
-            if num < int(self.effect[1]) - 1:
-                modify = [int(self.effect[2]), self.effect[3], self.effect[4], self.effect[5]]
-            else:
-                modify = None
-        else:
-            modify = None
+    def __init__(self, template: MoveTemplate, pp: None | int = None):
+        """
+        :param template: the move template
+        :param pp: the remaining PP, defaults to the template's max PP
+        """
+        self.template = template
+        self.PP = int(pp) if pp is not None else template.max_pp
 
-        if self.multipleHits:
-            hits = random.randint(int(self.effect[1]), int(self.effect[2]))
-        else:
-            hits = 1
+    @property
+    def name(self) -> str:
+        return self.template.name
 
-        if self.heal:
-            heal = int(self.effect[1])
-        else:
-            heal = 0
+    @property
+    def type(self) -> str:
+        return self.template.type
 
-        return inflictCondition, modify, hits, heal
+    @property
+    def category(self) -> str:
+        return self.template.category
+
+    @property
+    def power(self) -> None | int:
+        return self.template.power
+
+    @property
+    def accuracy(self) -> None | int:
+        return self.template.accuracy
+
+    @property
+    def maxPP(self) -> int:
+        return self.template.max_pp
+
+    @property
+    def description(self) -> None | str:
+        return self.template.description
+
+    @property
+    def effect(self) -> None | MoveEffect:
+        return self.template.effect
+
+    def __reduce__(self):
+        # rebuild from the name so copies and pickles share the template
+        return getMove, (self.name, self.PP)
+
+    def __str__(self):
+        return f"{self.name}: {self.type} {self.category} {self.power} {self.accuracy}"
+
+    def __repr__(self):
+        return f"Move({self.name},{self.type},{self.category},{self.power},{self.accuracy})"
+
+    def get_json(self):
+        return {
+            "name": self.name,
+            "pp": self.PP,
+        }
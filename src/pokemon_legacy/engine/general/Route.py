@@ -1,53 +1,136 @@
+import random
+from bisect import bisect_right
 from enum import Enum
-from random import choice
+from itertools import accumulate
 
-import pandas as pd
+import numpy as np
+
+from pokemon_legacy.engine.data.bundle import game_data
+
+
+class Rarity(Enum):
+    """ Relative encounter weight of each rarity """
+    common = 20
+    uncommon = 10
+    rare = 5
+    very_rare = 1
+
+    @classmethod
+    def from_string(cls, rarity: str) -> "Rarity":
+        """ Parse a rarity from the location data, e.g. "Common", "U" or "Very Rare" """
+        rarity = rarity.strip().lower().replace(" ", "_")
+        abbreviations = {"c": cls.common, "u": cls.uncommon, "r": cls.rare, "vr": cls.very_rare}
+        return abbreviations[rarity] if rarity in abbreviations else cls[rarity]
+
+
+def _parse_list(value: str) -> list[str]:
+    return value[1: len(value) - 1].split(",")
+
+
+class EncounterTable:
+    def __init__(self, pokemon: list[str], rarities: list[Rarity], levels: list[tuple[int, int]]):
+        """
+        Wild encounters for one route at one time of day, compiled into cumulative weights.
+
+        :param pokemon: the species that can be encountered
+        :param rarities: the rarity of each species
+        :param levels: the (min, max) level of each species, inclusive
+        """
+        self.pokemon = tuple(pokemon)
+        self.rarities = tuple(rarities)
+        self.levels = tuple(levels)
+
+        self.cumulative_weights = list(accumulate(rarity.value for rarity in rarities))
+        self.total_weight = self.cumulative_weights[-1]
+
+        # arrays for batch sampling
+        self._cumulative = np.array(self.cumulative_weights)
+        self._min_levels = np.array([level[0] for level in levels])
+        self._max_levels = np.array([level[1] for level in levels])
+
+    def __len__(self):
+        return len(self.pokemon)
+
+    def probability(self, name: str) -> float:
+        """ Return the chance of encountering a species """
+        return sum(rarity.value for pk, rarity in zip(self.pokemon, self.rarities) if pk == name) / self.total_weight
+
+    def encounter(self, rng: random.Random = random) -> tuple[str, int]:
+        """
+        Draw a single encounter.
+
+        :param rng: the random number generator to draw from
+        :return: the species name and level
+        """
+        idx = bisect_right(self.cumulative_weights, rng.random() * self.total_weight)
+        min_level, max_level = self.levels[idx]
+        return self.pokemon[idx], rng.randint(min_level, max_level)
+
+    def sample(self, n: int, rng: None | np.random.Generator = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Draw many encounters at once, e.g. for simulations.
+
+        :param n: the number of encounters
+        :param rng: the numpy generator to draw from
+        :return: arrays of the species names and levels
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        idx = np.searchsorted(self._cumulative, rng.random(n) * self.total_weight, side="right")
+        levels = rng.integers(self._min_levels[idx], self._max_levels[idx], endpoint=True)
+        return np.array(self.pokemon)[idx], levels
 
 
 class Route:
+    _routes: dict[str, "Route"] = {}
+
     def __init__(self, name):
-        data = pd.read_csv(str.format("assets/data/Locations/{}.tsv", name), delimiter='\t', index_col=0)
+        data = game_data.table(f"Locations/{name}.tsv")
         self.name = name
-        self.data = {}
-        for time in data.index:
-            timeData = data.loc[time]
-            startLevels = list(map(int, (timeData.Start_Levels[1: len(timeData.Start_Levels) - 1].split(","))))
-            endLevels = list(map(int, (timeData.End_Levels[1: len(timeData.End_Levels) - 1].split(","))))
-            levels = []
-            for [idx, value] in enumerate(startLevels):
-                levels.append((value, endLevels[idx]))
-
-            timeData = {"Pokemon": timeData.Pokemon[1: len(timeData.Pokemon) - 1].split(", "),
-                        "Rarity": timeData.Rarity[1: len(timeData.Rarity) - 1].split(", "),
-                        "Levels": levels}
-            dictValue = {time: timeData}
-            self.data.update(dictValue)
+        self.tables: dict[str, EncounterTable] = {}
+        for time, time_data in data.iterrows():
+            start_levels = map(int, _parse_list(time_data.Start_Levels))
+            end_levels = map(int, _parse_list(time_data.End_Levels))
+
+            self.tables[time] = EncounterTable(
+                pokemon=[pk.strip() for pk in _parse_list(time_data.Pokemon)],
+                rarities=[Rarity.from_string(rarity) for rarity in _parse_list(time_data.Rarity)],
+                levels=list(zip(start_levels, end_levels)),
+            )
+
+    @classmethod
+    def get(cls, name: str) -> "Route":
+        """ Return the compiled route with the given name, compiling it on first use """
+        if name not in cls._routes:
+            cls._routes[name] = Route(name)
+        return cls._routes[name]
 
     def __repr__(self):
         return f"Route({self.name})"
 
-    def encounter(self, time):
+    @property
+    def species(self) -> set[str]:
+        """ Every species that can be encountered on the route, at any time of day """
+        return {pk for table in self.tables.values() for pk in table.pokemon}
+
+    def get_table(self, time) -> EncounterTable:
         if time.hour < 12:
-            data = self.data["Morning"]
+            return self.tables["Morning"]
         elif time.hour < 20:
-            data = self.data["Day"]
+            return self.tables["Day"]
         else:
-            data = self.data["Night"]
+            return self.tables["Night"]
 
-        idx, pokemon = choice(list(enumerate(data["Pokemon"])))
-        levels = data["Levels"][idx]
-        if levels[1] != levels[0]:
-            level = choice(range(levels[0], levels[1]))
-        else:
-            level = levels[0]
+    def encounter(self, time, rng: random.Random = random) -> tuple[str, int]:
+        return self.get_table(time).encounter(rng)
 
-        return pokemon, level
+    def sample(self, time, n: int, rng: None | np.random.Generator = None) -> tuple[np.ndarray, np.ndarray]:
+        return self.get_table(time).sample(n, rng)
 
 
 class Routes(Enum):
-    route201 = Route("route_201")
-    route202 = Route("Route 202")
-    route203 = Route("Route 203")
-    route204N = Route("Route 204 North")
-    route204S = Route("Route 204 South")
-    route205N = Route("Route 205 North")
+    route201 = Route.get("route_201")
+    route202 = Route.get("Route 202")
+    route203 = Route.get("Route 203")
+    route204N = Route.get("Route 204 North")
+    route204S = Route.get("Route 204 South")
+    route205N = Route.get("Route 205 North")
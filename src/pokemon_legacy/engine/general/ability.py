@@ -1,10 +1,4 @@
-import os
-
-import pandas as pd
-
-DATA_PATH = os.path.join(os.path.dirname(__file__), '../../../../assets/data/abilities.tsv')
-
-ABIlITIES = pd.read_csv(DATA_PATH, sep="\t", index_col=0)
+from pokemon_legacy.engine.data.records import records
 
 
 class Ability:
@@ -12,13 +6,12 @@ class Ability:
         if not ability_id and not name:
             raise ValueError("Ability ID or name must be specified")
 
-        data = ABIlITIES.loc[ability_id] if not name else ABIlITIES.loc[ABIlITIES["name"] == name]
-        if not data.empty:
-            data: pd.Series = data.iloc[0]
-            self.id = ability_id if ability_id else data.name
-            self.name = data["name"]
-            self.description = data["description"]
-            self.generation = data["generation"]
+        data = records.abilities_by_id.get(ability_id) if not name else records.abilities.get(name)
+        if data is not None:
+            self.id = ability_id if ability_id else data.ability_id
+            self.name = data.name
+            self.description = data.description
+            self.generation = data.generation
         else:
             self.id = ability_id
             self.name = name
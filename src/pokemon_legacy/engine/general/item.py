@@ -1,25 +1,12 @@
 import os
 
-import pandas as pd
 import pygame as pg
 
+from pokemon_legacy.constants import ASSET_PATH
+from pokemon_legacy.engine.data.records import records, ItemRecord
 from pokemon_legacy.engine.pokemon.pokemon import StatusEffect
 from enum import Enum
 
-DATA_PATH = os.path.join(os.path.dirname(__file__), '../../../../assets/data')
-
-item_data = pd.read_csv(os.path.join(DATA_PATH, "items.tsv"), delimiter="\t")
-item_types = pd.read_csv(os.path.join(DATA_PATH, "item_types.tsv"), delimiter="\t", index_col=0)
-battle_item_types = pd.read_csv(os.path.join(DATA_PATH, "battle_item_types.tsv"), delimiter="\t", index_col=0)
-pokeballs = pd.read_csv(os.path.join(DATA_PATH, "Items/pokeballs.tsv"), delimiter="\t", index_col=0)
-medicine = pd.read_csv(os.path.join(DATA_PATH, "Items/medicine.tsv"), delimiter="\t", index_col=0)
-
-item_data = item_data.merge(item_types, on="item_type_id", how="left", suffixes=["", "_item_type"])
-item_data = item_data.merge(battle_item_types, on="battle_item_type_id", how="left", suffixes=["", "_battle_item_type"])
-item_data = item_data.merge(medicine, on="item_id", how="left").merge(pokeballs, on="item_id", how="left")
-
-item_data = item_data.set_index("item_id")
-
 
 class ItemType(Enum):
     item = "Items"
@@ -39,23 +26,71 @@ class BattleItemType(Enum):
     battle_item = "battle_item"
 
 
+class ItemIconCache:
+    """ Item icons, loaded the first time each one is requested and shared by every instance of the item """
+    def __init__(self, sprite_dir: str = os.path.join(ASSET_PATH, "sprites/Items")):
+        self.sprite_dir = sprite_dir
+        self._icons: dict[tuple[str, str], None | pg.Surface] = {}
+
+    def __len__(self):
+        return len(self._icons)
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._icons
+
+    def get(self, item_type: str, name: str) -> None | pg.Surface:
+        """
+        Return the icon of an item. The surface is shared, copy it before drawing onto it.
+
+        :param item_type: the item sprite folder, e.g. "Medicine"
+        :param name: the item name
+        :return: the icon, or None if the item has no sprite
+        """
+        key = (item_type, name)
+        if key not in self._icons:
+            try:
+                self._icons[key] = pg.image.load(os.path.join(self.sprite_dir, str(item_type), f"{name}.png"))
+            except FileNotFoundError:
+                self._icons[key] = None
+
+        return self._icons[key]
+
+    def clear(self):
+        self._icons.clear()
+
+
+item_icons = ItemIconCache()
+
+
 class Item:
-    def __init__(self, data, item_type, description=""):
-        self.item_id = data.name
-        self.name = data["name"]
+    def __init__(self, data: ItemRecord, item_type, description=""):
+        self.item_id = data.item_id
+        self.name = data.name
         self.type = item_type
-        try:
-            self.image = pg.image.load(str.format("assets/sprites/Items/{}/{}.png", self.type, data["name"]))
-        except FileNotFoundError:
-            self.image = None
+        self._image = None
 
-        self.buyPrice = None if pd.isna(data.buy_price) else data.buy_price
-        self.sellPrice = None if pd.isna(data.sell_price) else data.sell_price
+        self.buyPrice = data.buy_price
+        self.sellPrice = data.sell_price
 
         self.description = description
 
-        self.item_type = None if pd.isna(data.name_item_type) else ItemType(data.name_item_type)
-        self.battle_item_type = None if pd.isna(data.name_battle_item_type) else BattleItemType(data.name_battle_item_type)
+        self.item_type = None if data.item_type is None else ItemType(data.item_type)
+        self.battle_item_type = None if data.battle_item_type is None else BattleItemType(data.battle_item_type)
+
+    @property
+    def image(self) -> None | pg.Surface:
+        return self._image if self._image is not None else item_icons.get(self.type, self.name)
+
+    @image.setter
+    def image(self, image: None | pg.Surface):
+        self._image = image
+
+    def __eq__(self, other):
+        # items are interchangeable by name, so bag lookups find the existing stack
+        return type(other) is type(self) and other.name == self.name
+
+    def __hash__(self):
+        return hash((type(self), self.name))
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.item_id}, {self.name})"
@@ -63,18 +98,14 @@ class Item:
 
 class Pokeball(Item):
     def __init__(self, name):
-        data = item_data.loc[item_data["name"] == name].iloc[0]
-        if pd.isna(data.description):
+        data = records.items[name]
+        if data.description is None:
             super().__init__(data, item_type="Pokeball")
         else:
             super().__init__(data, item_type="Pokeball", description=data.description)
 
-        self.modifier = data.Rate_Modifier
-
-        if pd.isna(data.Conditions):
-            self.conditions = None
-        else:
-            self.conditions = data.Conditions
+        self.modifier = data.rate_modifier
+        self.conditions = data.conditions
 
     def __repr__(self):
         return f"Pokeball({self.name}, {self.modifier}, {self.conditions})"
@@ -82,34 +113,21 @@ class Pokeball(Item):
 
 class MedicineItem(Item):
     def __init__(self, name):
-        data = item_data.loc[item_data["name"].str.lower() == name.lower()].iloc[0]
-        if pd.isna(data.description):
+        data = records.get_item(name)
+        if data.description is None:
             super().__init__(data, item_type="Medicine")
         else:
             super().__init__(data, item_type="Medicine", description=data.description)
 
-        self.heal = False if pd.isna(data.heal_amount) else int(data.heal_amount)
-        self.status = None if pd.isna(data.status) else StatusEffect(data.status)
-        self.battle_type = None if pd.isna(data.battle_type) else data.battle_type
+        self.heal = False if data.heal_amount is None else data.heal_amount
+        self.status = None if data.status is None else StatusEffect(data.status)
+        self.battle_type = data.battle_type
 
     def __repr__(self):
         return f"Medicine({self.name}, {self.heal if self.heal else 0}, {self.status})"
 
 
 class ItemGenerator:
-    item_data = pd.read_csv(os.path.join(DATA_PATH, "items.tsv"), delimiter="\t")
-    item_types = pd.read_csv(os.path.join(DATA_PATH, "item_types.tsv"), delimiter="\t", index_col=0)
-    battle_item_types = pd.read_csv(os.path.join(DATA_PATH, "battle_item_types.tsv"), delimiter="\t", index_col=0)
-    pokeballs = pd.read_csv(os.path.join(DATA_PATH, "Items/pokeballs.tsv"), delimiter="\t", index_col=0)
-    medicine = pd.read_csv(os.path.join(DATA_PATH, "Items/medicine.tsv"), delimiter="\t", index_col=0)
-
-    item_data = item_data.merge(item_types, on="item_type_id", how="left", suffixes=["", "_item_type"])
-    item_data = item_data.merge(battle_item_types, on="battle_item_type_id", how="left",
-                                suffixes=["", "_battle_item_type"])
-    item_data = item_data.merge(medicine, on="item_id", how="left").merge(pokeballs, on="item_id", how="left")
-
-    item_data = item_data.set_index("item_id")
-
     item_class_bindings = {
         ItemType.item: Item,
         ItemType.pokeball: Pokeball,
@@ -122,11 +140,11 @@ class ItemGenerator:
     @classmethod
     def generate_item(cls, item_name: str) -> None | Item | MedicineItem | Pokeball:
         """ Return item from name """
-        item_data = cls.item_data.loc[cls.item_data["name"].str.lower() == item_name.lower()]
-        if item_data.empty:
+        item_data = records.get_item(item_name)
+        if item_data is None:
             return None
 
-        item_type = ItemType(item_data.iloc[0]["name_item_type"])
+        item_type = ItemType(item_data.item_type)
 
         item_class = cls.item_class_bindings[item_type]
 
@@ -0,0 +1,252 @@
+"""
+Opt-in CPU and allocation profiling.
+
+The profiler is off unless configured, see ``main.py --profile``. It profiles either the whole run or only named
+regions of the game, e.g. battles or map transitions::
+
+    with profiler.region("battle"):
+        ...
+
+A region costs one attribute check unless the profiler is configured to profile it.
+
+cpu mode runs ``cProfile`` for a pstats file and samples the main thread's stack at a fixed interval for a
+collapsed stack file (``a;b;c count`` lines, as read by flamegraph.pl and speedscope). alloc mode traces allocations
+with ``tracemalloc`` and writes the bytes still allocated at the end of the run (or of each region) by stack, in the
+same collapsed format, and a summary of the biggest allocation sites.
+"""
+import cProfile
+import os
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import nullcontext
+from typing import Iterable
+
+PROFILE_MODES = ("cpu", "alloc")
+REGIONS = ("startup", "battle", "map_transition")
+
+_NULL_REGION = nullcontext()
+
+
+def frame_name(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def collapse_frame(frame) -> str:
+    """ Return the stack of a frame, outermost first, as a collapsed stack """
+    names = []
+    while frame is not None:
+        names.append(frame_name(frame.f_code))
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def collapse_traceback(traceback: tracemalloc.Traceback) -> str:
+    """ Return a tracemalloc traceback, outermost first, as a collapsed stack """
+    return ";".join(f"{os.path.basename(frame.filename)}:{frame.lineno}" for frame in traceback)
+
+
+def write_collapsed(path: str, stacks: Counter) -> str:
+    with open(path, "w", encoding="utf-8") as file:
+        for stack, count in stacks.most_common():
+            if count > 0:
+                file.write(f"{stack} {count}\n")
+    return path
+
+
+class StackSampler:
+    """ Samples the stack of one thread at a fixed interval """
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        """
+        :param thread_id: the thread to sample
+        :param interval: the time between samples, in seconds
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.active = False
+
+        self._stop = threading.Event()
+        self._thread: None | threading.Thread = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="stack_sampler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            if not self.active:
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse_frame(frame)] += 1
+
+
+class _Region:
+    """ Profiles a block """
+    __slots__ = ("profiler",)
+
+    def __init__(self, profiler: "Profiler"):
+        self.profiler = profiler
+
+    def __enter__(self):
+        self.profiler.resume()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.pause()
+        return False
+
+
+class Profiler:
+    def __init__(self):
+        self.mode: None | str = None
+        self.out: str = "profile"
+        self.regions: None | frozenset[str] = None
+        self.interval = 0.005
+        self.frames = 25
+
+        self._started = False
+        self._depth = 0
+        self._cprofile: None | cProfile.Profile = None
+        self._sampler: None | StackSampler = None
+        self._snapshot: None | tracemalloc.Snapshot = None
+        self._allocations: Counter = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode is not None
+
+    def configure(
+            self,
+            mode: None | str,
+            out: str = "profile",
+            regions: None | Iterable[str] = None,
+            interval: float = 0.005,
+            frames: int = 25,
+    ) -> None:
+        """
+        :param mode: cpu or alloc, or None to disable the profiler
+        :param out: the path of the output files, without extension
+        :param regions: only profile these regions, or None to profile the whole run
+        :param interval: the time between stack samples in cpu mode, in seconds
+        :param frames: the number of frames stored per allocation in alloc mode
+        """
+        if mode is not None and mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode {mode}, expected one of {PROFILE_MODES}")
+
+        self.mode = mode
+        self.out = out
+        self.regions = None if regions is None else frozenset(regions)
+        self.interval = interval
+        self.frames = frames
+
+    # ========== PROFILING ==========
+    def start(self) -> None:
+        """ Start profiling, the whole run is profiled unless the profiler has regions """
+        if not self.enabled or self._started:
+            return
+
+        self._started = True
+        if self.mode == "cpu":
+            self._cprofile = cProfile.Profile()
+            self._sampler = StackSampler(threading.get_ident(), self.interval)
+            self._sampler.start()
+
+        if self.regions is None:
+            self.resume()
+
+    def region(self, name: str, when: bool = True):
+        """
+        Return a context manager profiling its block if the profiler is configured to profile the region.
+
+        :param name: the name of the region
+        :param when: only profile the block when true
+        """
+        if not self._started or self.regions is None or not when or name not in self.regions:
+            return _NULL_REGION
+        return _Region(self)
+
+    def resume(self) -> None:
+        self._depth += 1
+        if self._depth > 1:
+            return
+
+        if self.mode == "cpu":
+            self._cprofile.enable()
+            self._sampler.active = True
+        elif self.mode == "alloc":
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+            self._snapshot = tracemalloc.take_snapshot()
+
+    def pause(self) -> None:
+        self._depth -= 1
+        if self._depth > 0:
+            return
+
+        if self.mode == "cpu":
+            self._sampler.active = False
+            self._cprofile.disable()
+        elif self.mode == "alloc":
+            # keep the memory still allocated since the region started
+            diff = tracemalloc.take_snapshot().compare_to(self._snapshot, "traceback")
+            for stat in diff:
+                if stat.size_diff > 0:
+                    self._allocations[collapse_traceback(stat.traceback)] += stat.size_diff
+            self._snapshot = None
+
+    def stop(self) -> list[str]:
+        """
+        Stop profiling and write the output files.
+
+        :return: the paths written
+        """
+        if not self._started:
+            return []
+
+        while self._depth > 0:
+            self.pause()
+
+        os.makedirs(os.path.dirname(self.out) or ".", exist_ok=True)
+        paths = []
+        if self.mode == "cpu":
+            self._sampler.stop()
+            self._cprofile.dump_stats(f"{self.out}.pstats")
+            paths.append(f"{self.out}.pstats")
+            paths.append(write_collapsed(f"{self.out}.collapsed", self._sampler.stacks))
+            self._cprofile, self._sampler = None, None
+
+        elif self.mode == "alloc":
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            paths.append(write_collapsed(f"{self.out}.alloc.collapsed", self._allocations))
+            paths.append(self._write_alloc_summary(f"{self.out}.alloc.txt"))
+            self._allocations = Counter()
+
+        self._started = False
+        return paths
+
+    def _write_alloc_summary(self, path: str, limit: int = 50) -> str:
+        """ Write the biggest allocation sites, by the innermost frame of their stacks """
+        sites = Counter()
+        for stack, size in self._allocations.items():
+            sites[stack.rsplit(";", 1)[-1]] += size
+
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(f"{sum(sites.values()) / 1024:.1f} KiB allocated\n")
+            for site, size in sites.most_common(limit):
+                file.write(f"{size / 1024:>10.1f} KiB  {site}\n")
+        return path
+
+
+profiler = Profiler()
@@ -0,0 +1,191 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+
+@dataclass
+class LoadTask:
+    """ A unit of loading work. Background tasks run on the thread pool, the rest run on the main thread. """
+    name: str
+    func: Callable[[], Any]
+    deps: tuple[str, ...] = ()
+    background: bool = False
+    weight: float = 1.0
+
+    # timings, filled in when the task runs
+    start: None | float = field(default=None, repr=False)
+    end: None | float = field(default=None, repr=False)
+    thread: None | str = field(default=None, repr=False)
+
+    @property
+    def duration(self) -> float:
+        return 0.0 if self.start is None or self.end is None else self.end - self.start
+
+
+class TaskGraph:
+    def __init__(self, max_workers: None | int = None):
+        """
+        A set of loading tasks with dependencies.
+
+        Tasks run as soon as all of their dependencies have finished. Background tasks (data reads, file parsing,
+        image decoding) run on a thread pool, while tasks that create pygame surfaces run on the calling thread.
+
+        :param max_workers: the size of the thread pool
+        """
+        self.max_workers = max_workers
+        self.tasks: dict[str, LoadTask] = {}
+        self.results: dict[str, Any] = {}
+
+        self.start: None | float = None
+        self.end: None | float = None
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def add(
+            self,
+            name: str,
+            func: Callable[[], Any],
+            deps: tuple[str, ...] | list[str] = (),
+            *,
+            background: bool = False,
+            weight: float = 1.0,
+    ) -> str:
+        """
+        Add a task to the graph.
+
+        :param name: unique name of the task
+        :param func: callable run with no arguments, its return value is stored in results
+        :param deps: names of the tasks that must finish first
+        :param background: run the task on the thread pool rather than the main thread
+        :param weight: the share of the progress bar the task represents
+        :return: the task name, to use as a dependency
+        """
+        if name in self.tasks:
+            raise ValueError(f"Duplicate task {name}")
+
+        self.tasks[name] = LoadTask(name, func, tuple(deps), background=background, weight=weight)
+        return name
+
+    def _validate(self):
+        """ Check that every dependency exists and that there are no cycles """
+        for task in self.tasks.values():
+            for dep in task.deps:
+                if dep not in self.tasks:
+                    raise ValueError(f"Task {task.name} depends on unknown task {dep}")
+
+        visited, in_progress = set(), set()
+
+        def visit(name):
+            if name in in_progress:
+                raise ValueError(f"Dependency cycle through task {name}")
+            if name not in visited:
+                in_progress.add(name)
+                for dep in self.tasks[name].deps:
+                    visit(dep)
+                in_progress.remove(name)
+                visited.add(name)
+
+        for name in self.tasks:
+            visit(name)
+
+    @property
+    def total_weight(self) -> float:
+        return sum(task.weight for task in self.tasks.values())
+
+    def _run_task(self, task: LoadTask):
+        task.thread = threading.current_thread().name
+        task.start = time.perf_counter()
+        try:
+            return task.func()
+        finally:
+            task.end = time.perf_counter()
+
+    def run(self, on_progress: None | Callable[[float, LoadTask], None] = None) -> dict[str, Any]:
+        """
+        Run every task, blocking until all have finished. An exception in any task is raised here once the
+        running tasks have stopped.
+
+        :param on_progress: called on the main thread after each task with the completed fraction and the task
+        :return: the result of each task, by name
+        """
+        self._validate()
+
+        remaining = dict(self.tasks)
+        done: set[str] = set()
+        running: dict[Future, LoadTask] = {}
+        total_weight, done_weight = self.total_weight or 1, 0.0
+
+        def is_ready(task: LoadTask) -> bool:
+            return all(dep in done for dep in task.deps)
+
+        def finish(task: LoadTask, result):
+            nonlocal done_weight
+            self.results[task.name] = result
+            done.add(task.name)
+            done_weight += task.weight
+            if on_progress is not None:
+                on_progress(done_weight / total_weight, task)
+
+        self.start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="startup") as pool:
+            try:
+                while remaining or running:
+                    for task in [task for task in remaining.values() if task.background and is_ready(task)]:
+                        running[pool.submit(self._run_task, remaining.pop(task.name))] = task
+
+                    # run one main thread task at a time, so finished background tasks are picked up in between
+                    main_task = next((task for task in remaining.values() if is_ready(task)), None)
+                    if main_task is not None:
+                        finish(main_task, self._run_task(remaining.pop(main_task.name)))
+
+                    if running:
+                        finished, _ = wait(running, timeout=0 if main_task else None, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            finish(running.pop(future), future.result())
+            except BaseException:
+                for future in running:
+                    future.cancel()
+                raise
+        self.end = time.perf_counter()
+
+        return self.results
+
+    # ========== TIMING REPORT ==========
+    @property
+    def wall_time(self) -> float:
+        return 0.0 if self.start is None or self.end is None else self.end - self.start
+
+    def critical_path(self) -> tuple[float, list[str]]:
+        """
+        Return the longest chain of dependent tasks by run time, which bounds the startup time however many
+        workers are available.
+
+        :return: the total duration of the path in seconds and the task names along it
+        """
+        longest: dict[str, tuple[float, list[str]]] = {}
+
+        def visit(name):
+            if name not in longest:
+                task = self.tasks[name]
+                dep_time, dep_path = max((visit(dep) for dep in task.deps), default=(0.0, []))
+                longest[name] = (dep_time + task.duration, dep_path + [name])
+            return longest[name]
+
+        return max((visit(name) for name in self.tasks), default=(0.0, []))
+
+    def report(self) -> str:
+        """ Return a summary of the wall time, critical path and per task timings """
+        path_time, path = self.critical_path()
+        lines = [
+            f"wall time: {self.wall_time * 1000:.0f} ms",
+            f"critical path: {path_time * 1000:.0f} ms ({' -> '.join(path)})",
+            f"serial time: {sum(task.duration for task in self.tasks.values()) * 1000:.0f} ms",
+        ]
+        for task in sorted(self.tasks.values(), key=lambda t: t.start or 0):
+            offset = (task.start - self.start) * 1000 if task.start is not None and self.start is not None else 0
+            lines.append(f"  {task.name:<24} {offset:>7.0f} ms +{task.duration * 1000:>6.0f} ms  [{task.thread}]")
+
+        return "\n".join(lines)
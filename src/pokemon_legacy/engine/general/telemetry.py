@@ -0,0 +1,291 @@
+"""
+Per-frame performance telemetry.
+
+Named timers and counters are recorded into fixed size windows of recent samples, and summarised as rolling
+percentiles (p50/p95/p99) to find frame time spikes. Timers record the duration of each call, counters are totalled
+per frame, and ``Telemetry.frame`` records the time between frames. Frames are marked by the game loop and by the
+nested loops drawing their own frames (battles, step animations). Loops blocked on input, e.g. menus and
+``wait_for_key``, are run in ``Telemetry.suspend`` so the wait is not recorded as one long frame.
+
+Telemetry is off unless enabled. Disabled, ``timed`` functions cost one attribute check per call and ``timer`` returns
+a shared no-op context manager, so the instrumentation can stay in the hot paths.
+
+    @telemetry.timed("map.render")
+    def render(self): ...
+
+    with telemetry.timer("battle.turn"):
+        ...
+
+    telemetry.count("assets.load")
+"""
+import functools
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+from typing import Callable
+
+import numpy as np
+import pygame as pg
+
+DEFAULT_WINDOW = 1200
+
+_NULL_TIMER = nullcontext()
+
+
+class RollingStats:
+    """ A fixed size window of the most recent samples of a metric """
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        """
+        :param window: the number of samples kept
+        """
+        self.samples = np.zeros(window, dtype=np.float64)
+        self.count = 0
+        self.total = 0.0
+
+    def __len__(self):
+        return min(self.count, len(self.samples))
+
+    def add(self, value: float) -> None:
+        self.samples[self.count % len(self.samples)] = value
+        self.count += 1
+        self.total += value
+
+    def recent(self) -> np.ndarray:
+        """ Return the samples in the window, in no particular order """
+        return self.samples[:len(self)]
+
+    def summary(self) -> dict[str, float]:
+        """ Return the percentiles of the window, and the count and mean of every sample """
+        recent = self.recent()
+        if not len(recent):
+            return {"count": 0}
+
+        p50, p95, p99 = np.percentile(recent, (50, 95, 99))
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "p50": float(p50), "p95": float(p95), "p99": float(p99),
+            "max": float(recent.max()),
+        }
+
+
+class _Timer:
+    """ Times a block into a telemetry timer """
+    __slots__ = ("telemetry", "name", "start")
+
+    def __init__(self, telemetry: "Telemetry", name: str):
+        self.telemetry = telemetry
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.telemetry.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _Suspend:
+    """ Pauses the frame time of a telemetry for a block """
+    __slots__ = ("telemetry",)
+
+    def __init__(self, telemetry: "Telemetry"):
+        self.telemetry = telemetry
+
+    def __enter__(self):
+        self.telemetry._suspended += 1
+        return self
+
+    def __exit__(self, *exc):
+        self.telemetry._suspended -= 1
+        if not self.telemetry._suspended:
+            # the next frame is timed from the end of the block
+            self.telemetry._last_frame = time.perf_counter()
+        return False
+
+
+class Telemetry:
+    def __init__(self, enabled: bool = False, window: int = DEFAULT_WINDOW):
+        """
+        :param enabled: record timers and counters
+        :param window: the number of recent samples kept for each metric
+        """
+        self.enabled = enabled
+        self.window = window
+
+        self.timers: dict[str, RollingStats] = {}
+        self.counters: dict[str, RollingStats] = {}
+
+        self._frame_counts: dict[str, int] = defaultdict(int)
+        self._last_frame: None | float = None
+        self._suspended = 0
+        self._lock = threading.Lock()
+
+        # the overlay is redrawn a few times a second, not every frame
+        self._overlay: None | pg.Surface = None
+        self._overlay_time = 0.0
+        self._font: None | pg.font.Font = None
+
+    def enable(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._last_frame = None
+
+    def reset(self) -> None:
+        """ Drop every recorded sample """
+        with self._lock:
+            self.timers.clear()
+            self.counters.clear()
+            self._frame_counts.clear()
+            self._last_frame = None
+
+    # ========== RECORDING ==========
+    def record(self, name: str, seconds: float) -> None:
+        """ Record a sample of a timer, safe from any thread """
+        with self._lock:
+            stats = self.timers.get(name)
+            if stats is None:
+                stats = self.timers[name] = RollingStats(self.window)
+            stats.add(seconds)
+
+    def timer(self, name: str):
+        """ Return a context manager timing its block, or a no-op when disabled """
+        return _Timer(self, name) if self.enabled else _NULL_TIMER
+
+    def timed(self, name: str) -> Callable:
+        """ Decorate a function to time each call """
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+
+            return wrapper
+        return decorator
+
+    def count(self, name: str, value: int = 1) -> None:
+        """ Add to a counter, which is totalled per frame """
+        if self.enabled:
+            with self._lock:
+                self._frame_counts[name] += value
+
+    def suspend(self):
+        """ Return a context manager pausing the frame time for its block, or a no-op when disabled """
+        return _Suspend(self) if self.enabled else _NULL_TIMER
+
+    def frame(self) -> None:
+        """ Mark the end of a frame: record the frame time and the counters of the frame """
+        if not self.enabled or self._suspended:
+            return
+
+        now = time.perf_counter()
+        if self._last_frame is not None:
+            self.record("frame", now - self._last_frame)
+        self._last_frame = now
+
+        with self._lock:
+            names = set(self.counters) | set(self._frame_counts)
+            for name in names:
+                stats = self.counters.get(name)
+                if stats is None:
+                    stats = self.counters[name] = RollingStats(self.window)
+                stats.add(self._frame_counts.get(name, 0))
+            self._frame_counts.clear()
+
+    # ========== REPORTING ==========
+    def summary(self) -> dict[str, dict]:
+        """ Return the summary of each timer (in milliseconds) and counter (per frame) """
+        with self._lock:
+            timers = {name: stats.summary() for name, stats in self.timers.items()}
+            counters = {name: stats.summary() for name, stats in self.counters.items()}
+
+        summary = {}
+        for name, stats in sorted(timers.items()):
+            summary[name] = {
+                "kind": "timer", "unit": "ms",
+                **{key: value if key == "count" else value * 1000 for key, value in stats.items()}
+            }
+        for name, stats in sorted(counters.items()):
+            summary[name] = {"kind": "counter", "unit": "per_frame", **stats}
+        return summary
+
+    def report(self) -> str:
+        """ Return the summary as a table """
+        lines = [f"{'metric':<28}{'count':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"]
+        for name, stats in self.summary().items():
+            if stats["count"]:
+                lines.append(
+                    f"{name:<28}{stats['count']:>8}{stats['p50']:>9.2f}{stats['p95']:>9.2f}"
+                    f"{stats['p99']:>9.2f}{stats['max']:>9.2f}"
+                )
+        return "\n".join(lines)
+
+    def export(self, path: str) -> str:
+        """
+        Append the summary of each metric to a JSON lines file.
+
+        :param path: the file to write
+        :return: the path written
+        """
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+        with open(path, "a", encoding="utf-8") as file:
+            for name, stats in self.summary().items():
+                file.write(json.dumps({"time": timestamp, "name": name, **stats}) + "\n")
+        return path
+
+    def draw_overlay(self, surface: pg.Surface, names: None | list[str] = None, refresh: float = 0.25) -> None:
+        """
+        Draw the p50/p95/p99 of some timers in the corner of a surface.
+
+        :param surface: the surface to draw on
+        :param names: the timers to show, by default the frame time and the slowest timers
+        :param refresh: how often the overlay text is redrawn, in seconds
+        """
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        if self._overlay is None or now - self._overlay_time > refresh:
+            self._overlay = self._render_overlay(names)
+            self._overlay_time = now
+        surface.blit(self._overlay, (2, 2))
+
+    def _render_overlay(self, names: None | list[str]) -> pg.Surface:
+        if self._font is None:
+            if not pg.font.get_init():
+                pg.font.init()
+            self._font = pg.font.Font(None, 16)
+
+        summary = {name: stats for name, stats in self.summary().items() if stats["kind"] == "timer" and stats["count"]}
+        if names is None:
+            slowest = sorted((name for name in summary if name != "frame"), key=lambda n: -summary[n]["p95"])
+            names = (["frame"] if "frame" in summary else []) + slowest[:5]
+
+        lines = [
+            f"{name} {summary[name]['p50']:.1f} / {summary[name]['p95']:.1f} / {summary[name]['p99']:.1f} ms"
+            for name in names if name in summary
+        ] or ["telemetry: no samples"]
+        texts = [self._font.render(line, True, (255, 255, 255)) for line in lines]
+
+        overlay = pg.Surface(
+            (max(text.get_width() for text in texts) + 6, sum(text.get_height() for text in texts) + 6), pg.SRCALPHA
+        )
+        overlay.fill((0, 0, 0, 160))
+        y = 3
+        for text in texts:
+            overlay.blit(text, (3, y))
+            y += text.get_height()
+        return overlay
+
+
+telemetry = Telemetry()
@@ -5,13 +5,13 @@ from enum import Enum
 from PIL import Image
 
 import pickle
-import pandas as pd
 import numpy as np
 import pygame as pg
 from enum import Enum
 
 # from pokemon import pokedex
 from pokemon_legacy.engine.general.image_editor import ImageEditor
+from pokemon_legacy.engine.general.telemetry import telemetry
 import time
 
 
@@ -52,6 +52,43 @@ def clean_surfaces(obj, _path='root'):
 editor = ImageEditor()
 
 
+BAR_WIDTHS = {"HP": 48, "XP": 64}
+_bar_surfaces: dict[str, pg.Surface] = {}
+
+
+def get_bar_colour(ratio: float) -> str:
+    """ Return the health bar colour for the given health ratio """
+    if ratio > 0.5:
+        return "high"
+    elif ratio > 0.25:
+        return "medium"
+    else:
+        return "low"
+
+
+def get_bar_surface(bar_type: str, ratio: float = 1) -> pg.Surface:
+    """
+    Return the (shared) unscaled bar image for a health or exp bar. The images are only loaded from disk
+    once, so the returned surface must not be modified.
+
+    :param bar_type: HP or exp
+    :param ratio: the fill ratio of the bar, used to choose the health colour
+    :return: the bar image
+    """
+    key = get_bar_colour(ratio) if bar_type == "HP" else "exp"
+
+    if key not in _bar_surfaces:
+        if bar_type == "HP":
+            bar_surf = pg.image.load(f"assets/battle/main_display/health_bar/health_{key}.png")
+        else:
+            bar_surf = pg.image.load("assets/battle/touch_display/pokemon/exp_bar.png")
+            bar_surf.set_alpha(100)
+
+        _bar_surfaces[key] = bar_surf
+
+    return _bar_surfaces[key]
+
+
 def create_display_bar(val: float, max_val: float, bar_type: str) -> pg.Surface:
     """
     This function creates the display bar used for health and exp displays within the game screen.
@@ -62,22 +99,10 @@ def create_display_bar(val: float, max_val: float, bar_type: str) -> pg.Surface:
     :return: pygame surface that is coloured and truncated relative to the maximum value
     """
     ratio = val / max_val
-
-    if bar_type == "HP":
-        if ratio > 0.5:
-            colour = "high"
-        elif ratio > 0.25:
-            colour = "medium"
-        else:
-            colour = "low"
-        bar_surf = pg.image.load(f"assets/battle/main_display/health_bar/health_{colour}.png")
-    else:
-        bar_surf = pg.image.load("assets/battle/touch_display/pokemon/exp_bar.png")
-        bar_surf.set_alpha(100)
-
+    bar_surf = get_bar_surface(bar_type, ratio)
     bar_size = pg.Vector2(bar_surf.get_size())
 
-    return pg.transform.scale(bar_surf, pg.Vector2((48 if bar_type == "HP" else 64) * ratio, bar_size.y))
+    return pg.transform.scale(bar_surf, pg.Vector2(BAR_WIDTHS.get(bar_type, 64) * ratio, bar_size.y))
 
 
 def load_gif(gif_path: str, bit_mask=None, opacity=255, scale=1) -> list[pg.Surface]:
@@ -129,21 +154,23 @@ def wait_for_key(
 
     t0 = time.monotonic()
     pg.event.clear()
-    while True:
-        event = pg.event.wait()
-        if event.type == pg.QUIT:
-            return "quit"
-
-        elif event.type == pg.KEYDOWN:
-            if key:
-                if event.key == key:
+    # waiting on a key is not frame time
+    with telemetry.suspend():
+        while True:
+            event = pg.event.wait()
+            if event.type == pg.QUIT:
+                return "quit"
+
+            elif event.type == pg.KEYDOWN:
+                if key:
+                    if event.key == key:
+                        return True
+                else:
                     return True
-            else:
-                return True
 
-        if time.monotonic() - t0 > 10 and break_on_timeout:
-            # timeout at 10s
-            return True
+            if time.monotonic() - t0 > 10 and break_on_timeout:
+                # timeout at 10s
+                return True
 
 
 class Colours(Enum):
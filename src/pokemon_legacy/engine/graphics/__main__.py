@@ -0,0 +1,28 @@
+"""
+Print the surface memory report, grouped by subsystem and owner.
+
+Given a report written by ``main.py --surface-report``, print that report. Otherwise load the shared surfaces that do
+not need a running game (the Pokémon sprite atlas and the fonts) and report them.
+
+    python -m pokemon_legacy.engine.graphics [report.json]
+"""
+import json
+import sys
+
+import pygame as pg
+
+from pokemon_legacy.engine.graphics.surface_registry import format_report, surface_registry
+
+paths = [arg for arg in sys.argv[1:] if not arg.startswith("-")]
+if paths:
+    with open(paths[0], "r") as file:
+        print(format_report(json.load(file)))
+    sys.exit(0)
+
+from pokemon_legacy.engine.graphics.font.font import ClockFont, Font, FontType, LevelFont
+from pokemon_legacy.engine.pokemon.sprite_atlas import pokemon_atlas
+
+pg.init()
+fonts = [Font(2), Font(2, FontType.level), LevelFont(2), ClockFont(2)]
+atlas = pokemon_atlas.surface
+print(surface_registry.report())
@@ -0,0 +1,137 @@
+"""
+Central registry of shared, lazily loaded assets.
+
+Large assets such as sprite sheets used to be loaded as class attributes, so importing a module read them from
+disk. They are now registered here with a loader and read the first time they are used::
+
+    class TeamDisplay:
+        hp_outline = LazyAsset("poketech/hp_outline", load_image, "hp_outline.png")
+
+Accessing ``TeamDisplay.hp_outline`` loads the image once and returns the shared object afterwards.
+"""
+import json
+import os
+import threading
+from typing import Any, Callable
+
+import cv2
+import pygame as pg
+
+from pokemon_legacy.engine.general.telemetry import telemetry
+from pokemon_legacy.engine.graphics.surface_registry import surface_registry
+
+
+def load_cv2_image(path: str | os.PathLike):
+    """ Read an image with its alpha channel as a numpy array """
+    image = cv2.imread(str(path), cv2.IMREAD_UNCHANGED)
+    if image is None:
+        raise FileNotFoundError(f"Could not read image {path}")
+    return image
+
+
+# the subsystem of surface assets, by the first part of the asset name
+ASSET_SUBSYSTEMS = {"pokemon": "sprites", "characters": "sprites", "trainers": "sprites", "poketech": "menus"}
+
+
+def load_image(path: str | os.PathLike) -> pg.Surface:
+    return pg.image.load(path)
+
+
+def load_json(path: str | os.PathLike):
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+class AssetService:
+    """ Loads each registered asset on first use and shares it between all users """
+    _instance = None
+
+    def __init__(self):
+        self._loaders: dict[str, tuple[Callable, tuple]] = {}
+        self._assets: dict[str, Any] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = AssetService()
+        return cls._instance
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._loaders
+
+    def register(self, name: str, loader: Callable, *args):
+        """
+        Register an asset without loading it.
+
+        :param name: unique name of the asset
+        :param loader: callable that loads the asset
+        :param args: arguments passed to the loader
+        """
+        registered = self._loaders.get(name)
+        if registered is not None and registered != (loader, args):
+            raise ValueError(f"Asset {name} is already registered with a different loader")
+
+        self._loaders[name] = (loader, args)
+
+    def get(self, name: str) -> Any:
+        """ Return an asset, loading it if this is the first request. Loading is safe from any thread. """
+        try:
+            return self._assets[name]
+        except KeyError:
+            pass
+
+        if name not in self._loaders:
+            raise KeyError(f"Asset {name} has not been registered")
+
+        with self._lock:
+            lock = self._locks.setdefault(name, threading.Lock())
+
+        with lock:
+            if name not in self._assets:
+                loader, args = self._loaders[name]
+                with telemetry.timer("assets.load"):
+                    asset = loader(*args)
+                telemetry.count("assets.load")
+
+                if isinstance(asset, pg.Surface):
+                    surface_registry.track(asset, name, ASSET_SUBSYSTEMS.get(name.split("/")[0], "other"))
+                self._assets[name] = asset
+
+        return self._assets[name]
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._assets
+
+    def loaded(self) -> list[str]:
+        """ Return the names of the assets that have been loaded """
+        return list(self._assets)
+
+    def unload(self, name: None | str = None):
+        """ Drop a loaded asset, or all of them, so it is reloaded on next use """
+        if name is None:
+            self._assets.clear()
+        else:
+            self._assets.pop(name, None)
+
+
+assets = AssetService.get_instance()
+
+
+class LazyAsset:
+    def __init__(self, name: str, loader: Callable, *args):
+        """
+        Class attribute that loads a shared asset on first access.
+
+        Assigning the attribute on an instance overrides the asset for that instance only.
+
+        :param name: unique name of the asset
+        :param loader: callable that loads the asset
+        :param args: arguments passed to the loader
+        """
+        self.name = name
+        assets.register(name, loader, *args)
+
+    def __get__(self, instance, owner=None):
+        return assets.get(self.name)
@@ -8,6 +8,8 @@ import numpy as np
 import pygame as pg
 
 from pokemon_legacy.engine.general.utils import Colours
+from pokemon_legacy.engine.general.telemetry import telemetry
+from pokemon_legacy.engine.graphics.surface_registry import surface_registry
 
 MODULE_PATH = resources.files(__package__)
 
@@ -105,7 +107,7 @@ class Font:
             image = pg.image.load(os.path.join(MODULE_PATH, f"{font_type.name}/{name}"))
             newImage = pg.transform.scale(image, pg.Vector2(image.get_size()) * scale)
             self.sizes[letter] = newImage.get_size()
-            self.letters[letter] = newImage
+            self.letters[letter] = surface_registry.track(newImage, self)
 
         self.size = 10
 
@@ -133,6 +135,7 @@ class Font:
         return sanitised
 
 
+    @telemetry.timed("font.render_text")
     def render_text(self, text: str, lineCount=1, colour=None, shadowColour=None) -> pg.Surface:
         words = text.split(" ")
         lines = []
@@ -223,6 +226,7 @@ class Font:
 
         return textSurf
 
+    @telemetry.timed("font.render_text_2")
     def render_text_2(self, text: str, text_box: pg.Rect | pg.Vector2 | tuple[int, int],
                       sep=0, vsep=1.5, colour: Colours | pg.Color = None, shadow_colour=None, max_chars=None) -> pg.Surface:
         """
@@ -324,8 +328,9 @@ class LevelFont:
             image = pg.image.load(str.format(os.path.join(MODULE_PATH, "level/{}"), name))
             newImage = pg.transform.scale(image, pg.Vector2(image.get_size()) * scale)
             self.sizes[letter] = newImage.get_size()
-            self.letters[letter] = newImage
+            self.letters[letter] = surface_registry.track(newImage, self)
 
+    @telemetry.timed("level_font.render_text")
     def render_text(self, text: str, lineCount, colour=None, shadowColour=None):
 
         width = 0
@@ -387,8 +392,9 @@ class ClockFont:
                 image = pg.image.load(os.path.join(clock_dir, name))
                 newImage = pg.transform.scale(image, pg.Vector2(image.get_size()) * scale)
                 self.sizes[letter] = newImage.get_size()
-                self.letters[letter] = newImage
+                self.letters[letter] = surface_registry.track(newImage, self)
 
+    @telemetry.timed("clock_font.render_text")
     def render_text(self, text: str):
         size = pg.Vector2(0, 0)
         size.y = self.sizes["0"][1]
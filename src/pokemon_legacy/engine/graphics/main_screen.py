@@ -3,6 +3,9 @@ import pygame as pg
 from pokemon_legacy.engine.graphics.sprite_screen import SpriteScreen
 from pokemon_legacy.engine.graphics.text_box import TextBox
 
+# the time to type one character at text speed 1 in ms
+CHAR_DELAY = 40
+
 
 class MainScreen(SpriteScreen):
     def __init__(
@@ -38,8 +41,7 @@ class MainScreen(SpriteScreen):
             self.update_display_text(text, max_chars=char_idx)
             window.blit(self.get_surface(offset=offset), (0, 0))
             pg.display.flip()
-            # 20 ms per character
-            pg.time.delay(int(40 / speed))
+            pg.time.delay(int(CHAR_DELAY / speed))
 
         if not keep_textbox:
             self.sprites.remove(self.text_box)
\ No newline at end of file
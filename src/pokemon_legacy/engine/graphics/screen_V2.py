@@ -4,6 +4,7 @@ import pygame as pg
 from pokemon_legacy.engine.graphics.font.font import Font, FontType
 
 from pokemon_legacy.engine.general.utils import BlitLocation, Colours
+from pokemon_legacy.engine.graphics.surface_registry import surface_registry
 
 
 # class Colours(Enum):
@@ -48,9 +49,9 @@ class FontOption(Enum):
 class Screen:
     def __init__(self, size, font=None, colour=None):
         self.size = pg.Vector2(size)
-        self.base_surface = pg.Surface(size, pg.SRCALPHA)
-        self.surface = pg.Surface(size, pg.SRCALPHA)
-        self.sprite_surface = pg.Surface(size, pg.SRCALPHA)
+        self.base_surface = self._new_surface(size)
+        self.surface = self._new_surface(size)
+        self.sprite_surface = self._new_surface(size)
 
         self.fonts = FontOption
         self.font: pg.font.Font = font if font else self.fonts.main
@@ -63,9 +64,13 @@ class Screen:
 
         self.power_off = False
 
-        self.power_off_surface = pg.Surface((self.size.x, self.size.y), pg.SRCALPHA)
+        self.power_off_surface = self._new_surface((self.size.x, self.size.y))
         self.power_off_surface.fill(Colours.white.value)
 
+    def _new_surface(self, size) -> pg.Surface:
+        """ Create a transparent surface, registered to this screen in the surface registry """
+        return surface_registry.track(pg.Surface(size, pg.SRCALPHA), self)
+
     def __getstate__(self):
         # self.font, self.fonts = None, None
         print("[__getstate__] Cleaning surfaces before pickling...")
@@ -211,8 +216,8 @@ class Screen:
                     self.surface.set_at((x_pos, y_pos), colour)
 
     def refresh(self):
-        self.surface = pg.Surface(self.size, pg.SRCALPHA)
-        self.sprite_surface = pg.Surface(self.size, pg.SRCALPHA)
+        self.surface = self._new_surface(self.size)
+        self.sprite_surface = self._new_surface(self.size)
 
     def clear_surfaces(self):
         self.surface = None
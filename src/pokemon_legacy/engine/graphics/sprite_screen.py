@@ -99,8 +99,8 @@ class SpriteScreen(Screen):
 
     def refresh(self, sprite_only=False):
         if not sprite_only:
-            self.surface = pg.Surface(self.size, pg.SRCALPHA)
-        self.sprite_surface = pg.Surface(self.size, pg.SRCALPHA)
+            self.surface = self._new_surface(self.size)
+        self.sprite_surface = self._new_surface(self.size)
 
 
 class DisplayContainer(pg.sprite.Sprite, SpriteScreen):
@@ -0,0 +1,195 @@
+"""
+Surface memory accounting.
+
+Maps, Pokémon, characters and displays each hold full size SRCALPHA surfaces, and ``map_properties`` can only find
+the surfaces reachable from one object after the fact. The engine's screens and loaders now register the surfaces they
+create here, tagged with their owner and subsystem (maps, battle, fonts, sprites, menus, displays). The registry only
+holds weak references, so a surface drops out of the report when it is freed.
+
+    surface_registry.track(pg.Surface(size, pg.SRCALPHA), self)
+    print(surface_registry.report())
+
+Subsurfaces share the pixels of their parent, so they are counted with no bytes of their own. The report can also be
+written as JSON, see ``main.py --surface-report`` and ``python -m pokemon_legacy.engine.graphics``.
+"""
+import json
+import threading
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable, TypeVar
+
+import pygame as pg
+
+SUBSYSTEMS = (
+    ("pokemon_legacy.engine.game_world", "maps"),
+    ("pokemon_legacy.maps", "maps"),
+    ("pokemon_legacy.engine.battle", "battle"),
+    ("pokemon_legacy.engine.graphics.font", "fonts"),
+    ("pokemon_legacy.engine.pokemon", "sprites"),
+    ("pokemon_legacy.engine.characters", "sprites"),
+    ("pokemon_legacy.displays.menu", "menus"),
+    ("pokemon_legacy.engine.bag", "menus"),
+    ("pokemon_legacy.engine.pokedex", "menus"),
+    ("pokemon_legacy.engine.poketech", "menus"),
+    ("pokemon_legacy.displays", "displays"),
+)
+
+Surfaces = TypeVar("Surfaces", bound=Iterable[pg.Surface])
+
+
+def subsystem_of(module: str) -> str:
+    """ Return the subsystem of a module, e.g. maps for ``pokemon_legacy.engine.game_world.tiled_map`` """
+    for prefix, subsystem in SUBSYSTEMS:
+        if module == prefix or module.startswith(prefix + "."):
+            return subsystem
+    return "other"
+
+
+def surface_bytes(surface: pg.Surface) -> int:
+    """ Return the pixel memory of a surface, subsurfaces share their parent's pixels """
+    if surface.get_parent() is not None:
+        return 0
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+@dataclass(slots=True)
+class SurfaceRecord:
+    owner: str
+    subsystem: str
+    size: tuple[int, int]
+    nbytes: int
+
+
+class SurfaceRegistry:
+    def __init__(self, enabled: bool = True):
+        """
+        :param enabled: track surfaces, a disabled registry returns surfaces untracked
+        """
+        self.enabled = enabled
+        self._entries: dict[int, tuple[weakref.ref, SurfaceRecord]] = {}
+        # re-entrant, a surface freed while the lock is held releases its entry on the same thread
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, surface: pg.Surface) -> bool:
+        entry = self._entries.get(id(surface))
+        return entry is not None and entry[0]() is surface
+
+    # ========== TRACKING ==========
+    def track(self, surface: pg.Surface, owner: object, subsystem: None | str = None) -> pg.Surface:
+        """
+        Register a surface. A surface keeps the owner it was first registered with.
+
+        :param surface: the surface
+        :param owner: the owner tag, or the object holding the surface, which is tagged by its class
+        :param subsystem: the subsystem, by default the subsystem of the owner's module
+        :return: the surface
+        """
+        if not self.enabled or surface is None:
+            return surface
+
+        if not isinstance(owner, str):
+            owner_type = owner if isinstance(owner, type) else type(owner)
+            subsystem = subsystem or subsystem_of(owner_type.__module__)
+            owner = owner_type.__name__
+
+        key = id(surface)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]() is surface:
+                return surface
+
+            def release(ref, key=key):
+                with self._lock:
+                    current = self._entries.get(key)
+                    if current is not None and current[0] is ref:
+                        del self._entries[key]
+
+            record = SurfaceRecord(owner, subsystem or "other", surface.get_size(), surface_bytes(surface))
+            self._entries[key] = (weakref.ref(surface, release), record)
+        return surface
+
+    def track_all(self, surfaces: Surfaces, owner: object, subsystem: None | str = None) -> Surfaces:
+        """ Register each surface of a collection, see ``track`` """
+        for surface in surfaces:
+            self.track(surface, owner, subsystem)
+        return surfaces
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # ========== REPORTING ==========
+    def records(self) -> list[SurfaceRecord]:
+        """ Return the records of the live surfaces """
+        with self._lock:
+            return [record for ref, record in self._entries.values() if ref() is not None]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(record.nbytes for record in self.records())
+
+    def by_subsystem(self) -> dict[str, dict]:
+        """ Return the count and bytes of the live surfaces of each subsystem and owner, largest first """
+        groups = defaultdict(lambda: {"count": 0, "bytes": 0, "owners": defaultdict(lambda: {"count": 0, "bytes": 0})})
+        for record in self.records():
+            group = groups[record.subsystem]
+            group["count"] += 1
+            group["bytes"] += record.nbytes
+            group["owners"][record.owner]["count"] += 1
+            group["owners"][record.owner]["bytes"] += record.nbytes
+
+        return {
+            subsystem: {
+                "count": group["count"],
+                "bytes": group["bytes"],
+                "owners": dict(sorted(group["owners"].items(), key=lambda item: -item[1]["bytes"])),
+            }
+            for subsystem, group in sorted(groups.items(), key=lambda item: -item[1]["bytes"])
+        }
+
+    def over_budget(self, budgets: dict[str, int]) -> dict[str, int]:
+        """
+        Return the subsystems using more memory than their budget.
+
+        :param budgets: the bytes allowed for each subsystem
+        :return: the bytes used by each subsystem over its budget
+        """
+        usage = self.by_subsystem()
+        return {
+            subsystem: usage[subsystem]["bytes"] for subsystem, budget in budgets.items()
+            if subsystem in usage and usage[subsystem]["bytes"] > budget
+        }
+
+    def write(self, path: str) -> str:
+        """ Write the report by subsystem as JSON """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.by_subsystem(), file, indent=4)
+        return path
+
+    def report(self, owners: int = 5) -> str:
+        return format_report(self.by_subsystem(), owners=owners)
+
+
+def format_report(usage: dict[str, dict], owners: int = 5) -> str:
+    """
+    Format a report by subsystem as a table.
+
+    :param usage: the report, see ``SurfaceRegistry.by_subsystem``
+    :param owners: the number of largest owners listed for each subsystem
+    """
+    total = sum(group["bytes"] for group in usage.values())
+    lines = [f"{'subsystem / owner':<36}{'surfaces':>10}{'MiB':>10}"]
+    for subsystem, group in usage.items():
+        lines.append(f"{subsystem:<36}{group['count']:>10}{group['bytes'] / 2 ** 20:>10.2f}")
+        for owner, stats in list(group["owners"].items())[:owners]:
+            lines.append(f"  {owner:<34}{stats['count']:>10}{stats['bytes'] / 2 ** 20:>10.2f}")
+    lines.append(f"{'total':<36}{sum(group['count'] for group in usage.values()):>10}{total / 2 ** 20:>10.2f}")
+    return "\n".join(lines)
+
+
+surface_registry = SurfaceRegistry()
@@ -0,0 +1,39 @@
+import time
+
+
+class Tween:
+    def __init__(self, start: float, end: float, duration: float):
+        """
+        Interpolates between two values over a fixed time, independent of the frame rate.
+
+        :param start: the starting value
+        :param end: the final value
+        :param duration: the length of the tween in ms
+        """
+        self.start = start
+        self.end = end
+        self.duration = duration / 1000
+        self.start_time = time.monotonic()
+
+    @property
+    def progress(self) -> float:
+        """ Fraction of the tween that has elapsed, between 0 and 1 """
+        if self.duration <= 0:
+            return 1
+
+        return min(1, (time.monotonic() - self.start_time) / self.duration)
+
+    @property
+    def value(self) -> float:
+        return self.start + (self.end - self.start) * self.progress
+
+    @property
+    def done(self) -> bool:
+        return self.progress >= 1
+
+    def __iter__(self):
+        """ Yield the tweened value once per frame until the tween is complete, ending on the final value """
+        while not self.done:
+            yield self.value
+
+        yield self.end
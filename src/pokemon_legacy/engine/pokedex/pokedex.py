@@ -1,6 +1,7 @@
 import pandas as pd
 import pygame as pg
 
+from pokemon_legacy.engine.data.bundle import game_data
 from pokemon_legacy.engine.pokemon.pokemon import loader
 from pokemon_legacy.displays.pokedex.pokedex_display import PokedexDisplay, PokedexDisplayStates
 
@@ -10,7 +11,7 @@ class Pokedex:
         self.game = game
         self.controller = game.controller
 
-        self.national_dex = pd.read_csv("assets/data/pokedex/NationalDex/NationalDex.tsv", delimiter='\t', index_col=0)
+        self.national_dex = game_data.table("pokedex/NationalDex/NationalDex.tsv")
 
         self.data: pd.DataFrame = loader.pokedex
         if "appearances" not in self.data.columns:
@@ -25,6 +26,24 @@ class Pokedex:
 
         self.load_surfaces()
 
+    def get_json_data(self) -> dict:
+        """ Return the seen and caught counters of the species that have been encountered """
+        seen = self.data.loc[self.data["appearances"] > 0, "appearances"]
+        return {
+            "appearances": {name: int(count) for name, count in seen.items()},
+            "caught": [name for name in self.data.index[self.data["caught"].astype(bool)]],
+        }
+
+    def load_from_state(self, state: dict) -> None:
+        """ Restore the seen and caught counters """
+        self.data["appearances"] = 0
+        self.data["caught"] = False
+
+        appearances = {name: count for name, count in state.get("appearances", {}).items() if name in self.data.index}
+        for name, count in appearances.items():
+            self.data.loc[name, "appearances"] = count
+        self.data.loc[[name for name in state.get("caught", []) if name in self.data.index], "caught"] = True
+
     def get_next_seen_index(self, descending=True):
         direction_mask = (self.data["Local_Num"] > self.main_display.pokemon_idx) if descending else \
                             (self.data["Local_Num"] < self.main_display.pokemon_idx)
@@ -0,0 +1,26 @@
+"""
+Build the Pokémon sprite atlas from the sprite sheets, at every supported scale, and decode the frame strips of
+every species animation.
+
+    python -m pokemon_legacy.engine.pokemon
+"""
+import os
+import time
+
+from pokemon_legacy.engine.data.records import records
+from pokemon_legacy.engine.pokemon.animation_cache import AnimationLoader
+from pokemon_legacy.engine.pokemon.sprite_atlas import SCALES, SpriteAtlas
+
+for scale in SCALES:
+    start = time.perf_counter()
+    atlas = SpriteAtlas(scale)
+    path = atlas.build()
+    print(f"Packed {len(atlas)} sprites at x{scale} to {os.path.normpath(path)} "
+          f"({os.path.getsize(path) / 1024:.0f} KiB) in {time.perf_counter() - start:.2f}s")
+
+start = time.perf_counter()
+loader = AnimationLoader(workers=os.cpu_count() or 2)
+strips = [future.result() for future in loader.prefetch(records.species)]
+loader.shutdown()
+print(f"Decoded the animations of {sum(strip is not None for strip in strips)} species to {os.path.normpath(loader.strip_dir)} "
+      f"in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,225 @@
+"""
+Background decoding and on-disk frame strips for species animations.
+
+Decoding a species' gifs with PIL, cropping and scaling every frame took long enough that the first encounter with
+a species hitched the battle intro. The decoded frames are now written to disk as a frame strip: a PNG holding each
+distinct frame side by side, and a JSON index of the frame order and where each frame sits in the strip. Strips are
+named by the content hash of their source gif, so a changed gif simply gets a new strip.
+
+Decoding runs on a small worker pool. ``AnimationLoader.prefetch`` queues the species that are about to be seen
+(e.g. the encounter table of a route) and ``AnimationLoader.load`` builds the surfaces from the strips on the calling
+thread, waiting only if the species is still being decoded. ``AnimationLRU`` bounds the memory held by the loaded
+animations.
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable
+
+import numpy as np
+import pygame as pg
+from PIL import Image
+
+from pokemon_legacy.engine.general.Animations import Animations, animation_paths, decode_gif, to_surface
+from pokemon_legacy.engine.pokemon.sprite_atlas import ATLAS_DIR
+from pokemon_legacy.engine.graphics.surface_registry import surface_registry
+
+ANIMATION_DIR = os.path.join(ATLAS_DIR, "animations")
+STRIP_VERSION = 1
+
+# the memory cap of the loaded animations, the largest species hold a few MiB of frames
+DEFAULT_MAX_BYTES = 48 * 1024 * 1024
+
+
+def gif_hash(path: str) -> str:
+    """ Return the content hash of a gif """
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+class FrameStrip:
+    """ The decoded frames of one gif, stored as a PNG strip and JSON index """
+
+    def __init__(self, source: str, scale: int = 2, strip_dir: str = ANIMATION_DIR):
+        """
+        :param source: the gif to decode
+        :param scale: the integer scale of the frames
+        :param strip_dir: where the strips are stored
+        """
+        self.source = source
+        self.scale = scale
+
+        stem = f"{gif_hash(source)[:20]}_x{scale}"
+        self.image_path = os.path.join(strip_dir, f"{stem}.png")
+        self.index_path = os.path.join(strip_dir, f"{stem}.json")
+
+    def exists(self) -> bool:
+        return os.path.exists(self.image_path) and os.path.exists(self.index_path)
+
+    def build(self) -> str:
+        """
+        Decode the gif and write the strip. Identical frames are stored once.
+
+        :return: the path of the written strip image
+        """
+        frames = decode_gif(self.source, self.scale)
+
+        seen, distinct, order, rects = {}, [], [], []
+        x = 0
+        for frame in frames:
+            key = (frame.shape, frame.tobytes())
+            if key not in seen:
+                seen[key] = len(distinct)
+                distinct.append(frame)
+                rects.append([x, 0, frame.shape[1], frame.shape[0]])
+                x += frame.shape[1]
+            order.append(seen[key])
+
+        strip = np.zeros((max(rect[3] for rect in rects), max(x, 1), 4), dtype=np.uint8)
+        for frame, (rx, _, w, h) in zip(distinct, rects):
+            strip[:h, rx: rx + w] = frame
+
+        index = {"version": STRIP_VERSION, "source": self.source, "scale": self.scale, "frames": order, "rects": rects}
+
+        # write then rename, so a strip is never seen half written by another loader
+        os.makedirs(os.path.dirname(self.image_path), exist_ok=True)
+        suffix = f"{threading.get_ident()}.tmp"
+        temp_image, temp_index = f"{self.image_path}.{suffix}", f"{self.index_path}.{suffix}"
+        Image.fromarray(strip, "RGBA").save(temp_image, format="PNG")
+        with open(temp_index, "w") as file:
+            json.dump(index, file)
+        os.replace(temp_image, self.image_path)
+        os.replace(temp_index, self.index_path)
+        return self.image_path
+
+    def prepare(self) -> "FrameStrip":
+        """ Build the strip if it is not already on disk """
+        if not self.exists():
+            self.build()
+        return self
+
+    def load(self) -> list[pg.Surface]:
+        """ Return the frames, as subsurfaces of the strip. They share the strip pixels and must not be modified. """
+        with open(self.index_path, "r") as file:
+            index = json.load(file)
+
+        strip = surface_registry.track(to_surface(pg.image.load(self.image_path)), self)
+        distinct = [strip.subsurface(rect) for rect in index["rects"]]
+        return [distinct[idx] for idx in index["frames"]]
+
+
+class AnimationLoader:
+    """ Decodes species animations to frame strips on a pool of worker threads """
+
+    def __init__(self, strip_dir: str = ANIMATION_DIR, workers: int = 2, scale: int = 2):
+        """
+        :param strip_dir: where the frame strips are stored
+        :param workers: the number of decoding threads
+        :param scale: the integer scale of the frames
+        """
+        self.strip_dir = strip_dir
+        self.workers = workers
+        self.scale = scale
+
+        self._pool: None | ThreadPoolExecutor = None
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _prepare(self, name: str) -> None | dict[str, FrameStrip]:
+        """ Worker: make sure the strips of a species are on disk """
+        paths = animation_paths(name)
+        if paths is None:
+            return None
+        return {key: FrameStrip(path, self.scale, self.strip_dir).prepare() for key, path in paths.items()}
+
+    def request(self, name: str) -> Future:
+        """ Queue a species to be decoded, returning its future. Each species is only queued once, unless it failed. """
+        with self._lock:
+            future = self._pending.get(name)
+            if future is not None and future.done() and (future.cancelled() or future.exception() is not None):
+                # a failed decode (a bad gif, an interrupted write) is retried rather than cached
+                future = None
+
+            if future is None:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="animation")
+                future = self._pool.submit(self._prepare, name)
+                self._pending[name] = future
+            return future
+
+    def prefetch(self, names: Iterable[str]) -> list[Future]:
+        """ Queue species that are likely to be seen soon """
+        return [self.request(name) for name in names]
+
+    def load(self, name: str) -> None | Animations:
+        """
+        Return the animations of a species, waiting for it to be decoded if it is not on disk yet.
+
+        :param name: the species name
+        :return: the animations, or None if the species has none
+        """
+        strips = self.request(name).result()
+        if strips is None:
+            return None
+        return Animations(front=strips["front"].load(), small=strips["small"].load())
+
+    def shutdown(self) -> None:
+        """ Stop the workers, letting queued decodes finish """
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+            self._pool = None
+            self._pending.clear()
+
+
+class AnimationLRU:
+    """ The loaded animations of each species, least recently used first, evicted when over a memory cap """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        :param max_bytes: the most pixel memory to hold. The newest animation is always kept, even if larger.
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries: OrderedDict[str, tuple[Animations, int]] = OrderedDict()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, name: str) -> Animations:
+        animations, _ = self._entries[name]
+        self._entries.move_to_end(name)
+        return animations
+
+    def __setitem__(self, name: str, animations: Animations) -> None:
+        self.pop(name)
+        size = animations.nbytes
+        self._entries[name] = (animations, size)
+        self.nbytes += size
+
+        while self.nbytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+
+    def get(self, name: str, default=None) -> None | Animations:
+        return self[name] if name in self._entries else default
+
+    def pop(self, name: str, default=None) -> None | Animations:
+        if name not in self._entries:
+            return default
+        animations, size = self._entries.pop(name)
+        self.nbytes -= size
+        return animations
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.nbytes = 0
+
+
+animation_loader = AnimationLoader()
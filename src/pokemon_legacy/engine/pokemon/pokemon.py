@@ -1,32 +1,24 @@
-import os
 import datetime
-import pickle
 import time
 from typing import Any
-import importlib.resources as resources
-from dataclasses import dataclass
 
-from enum import Enum
 from math import floor
 import random
 
-import cv2
-import pandas as pd
 import pygame as pg
-from pandas import DataFrame
 
-from pokemon_legacy.engine.general.utils import load_gif
 from pokemon_legacy.engine.general.Move import Move2
-from pokemon_legacy.engine.general.Animations import Animations, createAnimation
+from pokemon_legacy.engine.general.Animations import Animations
 from pokemon_legacy.engine.general.Move import getMove
 from pokemon_legacy.engine.general.ability import Ability
-from pokemon_legacy.engine.general.image_editor import ImageEditor
+from pokemon_legacy.engine.general.telemetry import telemetry
+from pokemon_legacy.engine.data.bundle import game_data
+from pokemon_legacy.engine.data.records import records
+from pokemon_legacy.engine.pokemon.pokemon_data import PokemonData, StatusEffect, Stats, StatStages
+from pokemon_legacy.engine.pokemon.species_sprites import SpeciesSprites
+from pokemon_legacy.engine.pokemon.sprite_atlas import pokemon_atlas
 
 
-MODULE_PATH = resources.files(__package__)
-
-from pokemon_legacy.constants import DATA_PATH
-
 class DataLoader:
     _instance = None
     _pokedex = None
@@ -45,120 +37,43 @@ class DataLoader:
     @property
     def pokedex(self):
         if self._pokedex is None:
-             with open(os.path.join(DATA_PATH, "pokedex/LocalDex/LocalDex.pickle"), 'rb') as file:
-                self._pokedex = pickle.load(file)
+            # the pokedex adds its own columns to this table, so it gets a copy of the shared data
+            self._pokedex = game_data.table("pokedex/LocalDex/LocalDex.pickle").copy()
         return self._pokedex
 
     @property
     def old_pokedex(self):
         if self._old_pokedex is None:
-            # Original was "pokedex/Local Dex.tsv" with delimiter='\t', index_col=1
-            self._old_pokedex = pd.read_csv(os.path.join(DATA_PATH, "pokedex/Local Dex.tsv"), delimiter='\t', index_col=1)
+            self._old_pokedex = game_data.table("pokedex/Local Dex.tsv")
         return self._old_pokedex
 
     @property
     def national_dex(self):
         if self._national_dex is None:
-            # Original was "pokedex/NationalDex/NationalDex.tsv" with delimiter='\t', index_col=0
-            self._national_dex = pd.read_csv(os.path.join(DATA_PATH, "pokedex/NationalDex/NationalDex.tsv"), delimiter='\t', index_col=0)
+            self._national_dex = game_data.table("pokedex/NationalDex/NationalDex.tsv")
         return self._national_dex
 
     @property
     def level_up_values(self):
         if self._level_up_values is None:
-            self._level_up_values = pd.read_csv(os.path.join(DATA_PATH, "level_up_exp.tsv"), delimiter='\t', index_col=6)
+            self._level_up_values = game_data.table("level_up_exp.tsv")
         return self._level_up_values
 
     @property
     def effectiveness(self):
         if self._effectiveness is None:
-            self._effectiveness = pd.read_csv(os.path.join(DATA_PATH, "effectiveness.csv"), index_col=0)
+            self._effectiveness = game_data.table("effectiveness.csv")
         return self._effectiveness
 
     @property
     def natures(self):
         if self._natures is None:
-            self._natures = pd.read_csv(os.path.join(DATA_PATH, "natures.tsv"), delimiter='\t', index_col=0)
+            self._natures = game_data.table("natures.tsv")
         return self._natures
 
 # Global instance for backward compatibility (or usages within the class)
 loader = DataLoader.get_instance()
 
-editor = ImageEditor()
-
-
-class StatusEffect(Enum):
-    """ Status Effect that a pokémon can have """
-    Burned = "Burned"
-    Frozen = "Frozen"
-    Paralysed = "Paralysed"
-    Poisoned = "Poisoned"
-    Sleeping = "Sleeping"
-    Confusion = "Confusion"
-
-
-class Stats:
-    def __init__(self, health=0, attack=0, defence=0, spAttack=0, spDefence=0, speed=0, exp=0):
-        self.health = health
-        self.attack = attack
-        self.defence = defence
-        self.spAttack = spAttack
-        self.spDefence = spDefence
-        self.speed = speed
-        self.exp = exp
-
-    @staticmethod
-    def _calc_stat(base, ev, level, is_hp=False):
-        ev_part = ev + ev // 4
-        if is_hp:
-            return floor(((2 * base + ev_part) * level) / 100 + level + 10)
-        return floor(((2 * base + ev_part) * level) / 100 + 5)
-
-    @classmethod
-    def from_base_and_evs(cls, base_stats, evs, level, exp=0):
-        """
-        Factory for Stats from base stats + EVs.
-
-        :param base_stats: iterable [HP, Atk, Def, SpAtk, SpDef, Speed]
-        :param evs: iterable [HP EV, Atk EV, ...]
-        :param level: Pokémon level
-        :param exp: current exp
-        :return: Stats instance
-        """
-        health = cls._calc_stat(base_stats[0], evs[0], level, is_hp=True)
-        others = [cls._calc_stat(b, e, level) for b, e in zip(base_stats[1:], evs[1:])]
-        return cls(health, *others, exp)
-
-    def __sub__(self, other):
-        new_dict = {k: v1 - other.__dict__[k] for k, v1 in self.__dict__.items()}
-        return Stats(**new_dict)
-
-    def __str__(self):
-        return f"{[(k, v) for k, v in self.__dict__.items()]}"
-
-    def __iter__(self):
-        for val in self.get_values():
-            yield val
-
-    def __getitem__(self, key):
-        return self.get_values()[key]
-
-    def get_values(self):
-        """ Return all values of stats """
-        return [self.health, self.attack, self.defence, self.spAttack, self.spDefence, self.speed]
-
-
-@dataclass
-class StatStages:
-    """ dataclass to keep track of the in-battle stat stages """
-    attack: int = 0
-    defence: int = 0
-    spAttack: int = 0
-    spDefence: int = 0
-    speed: int = 0
-    accuracy: int = 0
-    evasion: int = 0
-
 
 class PokemonSpriteSmall(pg.sprite.Sprite):
     def __init__(self, frames, pos=pg.Vector2(0, 0)):
@@ -187,49 +102,67 @@ class PokemonSprite(pg.sprite.Sprite):
     def __init__(self, pk_id, shiny, friendly=True, visible=False):
         pg.sprite.Sprite.__init__(self)
 
-        self.images = Pokemon.get_images(pk_id, shiny=shiny)
+        self.species_sprites = SpeciesSprites.get(pk_id, shiny=shiny, crop=False)
+        self.images = self.species_sprites.images
         self.friendly = friendly
 
         self.image = self.images["back"] if friendly else self.images["front"]
         self.rect = self.image.get_rect()
 
         # numpy and pygame use different x-y coordinate systems
-        self.mask = pg.surfarray.pixels_alpha(self.image).transpose()
+        self.mask = self.species_sprites.alpha(self.side)
 
         self.intro_animation = None
 
-        self.animations: dict[str, None | list[pg.Surface]] = {
-            "intro": None,
-            "stat_raise": None,
-            "stat_lower": None,
+        self.visible = visible
+
+    @property
+    def side(self) -> str:
+        return "back" if self.friendly else "front"
+
+    @property
+    def animations(self) -> dict[str, None | tuple[pg.Surface, ...]]:
+        """ The intro and stat stage animations. Stat stage frames are built once per species, on first use. """
+        return {
+            "intro": self.intro_animation,
+            "stat_raise": self.species_sprites.stat_animation(self.side, "raise"),
+            "stat_lower": self.species_sprites.stat_animation(self.side, "lower"),
         }
 
-        self.load_stat_stage_animations()
 
-        self.visible = visible
+class _DataField:
+    """ An attribute of the Pokémon view that is stored on its PokemonData """
+    def __init__(self, field: str):
+        self.field = field
 
-    def load_stat_stage_animations(self):
-        for direction in ["raise", "lower"]:
-            frames = load_gif(f"assets/battle/main_display/stat_{direction}.gif",
-                              bit_mask=self.mask, opacity=150, scale=2)
-            self.animations[f"stat_{direction}"] = [self.image.copy() for _ in range(len(frames))]
-            for frame_idx in range(len(frames)):
-                self.animations[f"stat_{direction}"][frame_idx].blit(frames[frame_idx], (0, 0))
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance.data, self.field)
+
+    def __set__(self, instance, value):
+        setattr(instance.data, self.field, value)
+
+
+class _SpeciesField:
+    """ A read only attribute of the Pokémon view taken from its species record """
+    def __init__(self, field: str):
+        self.field = field
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance.data.species, self.field)
 
 
 class Pokemon(pg.sprite.Sprite):
     # battle maps
     crit_chance = {0: 1 / 16, 1: 1 / 8, 2: 1 / 4, 3: 1 / 3, 4: 1 / 2}
     stage_multipliers = {idx: (idx + 2 if idx > 0 else 2) / (abs(idx) + 2 if idx < 0 else 2) for idx in range(-6, 7)}
-
-    # pokemon sprites
-    all_sprites = cv2.imread(str(MODULE_PATH / "assets/Gen_IV_Sprites.png"), cv2.IMREAD_UNCHANGED)
-    small_sprites = cv2.imread(str(MODULE_PATH / "assets/Gen_IV_Small_Sprites.png"), cv2.IMREAD_UNCHANGED)
-
-    # pokemon data
-    # pokemon data
-
-    _sprite_cache: dict[tuple[int, bool], dict[str, pg.Surface]] = {}
+    stat_stage_names = {
+        "Attack": "attack", "Defence": "defence", "Sp Attack": "spAttack", "Sp Defence": "spDefence",
+        "Speed": "speed", "Accuracy": "accuracy", "Evasion": "evasion",
+    }
 
     def __init__(
             self,
@@ -254,175 +187,164 @@ class Pokemon(pg.sprite.Sprite):
             catch_level=None,
             catch_date=None,
             animations: None | Animations = None,
+            lazy_load: bool = False,
     ):
+        """
+        :param lazy_load: don't load the images and sprite until the Pokémon is first drawn
+        """
+        self.data = PokemonData.create(
+            name, level, exp=exp, moves=moves, health=health, status=status, EVs=EVs, IVs=IVs, gender=gender,
+            nature=nature, ability_name=ability_name, stat_stages=stat_stages, shiny=shiny,
+            catch_location=catch_location, catch_level=catch_level, catch_date=catch_date,
+        )
+        self._init_view(friendly=friendly, visible=visible, animations=animations, lazy_load=lazy_load)
 
-        # ===== Load Default Data ======
-        data = loader.pokedex.loc[name]
-        oldData = loader.old_pokedex.loc[name]
-
-        self.name = name
-        self.ID = data.Local_Num
-        self.species = loader.national_dex.loc[name, "Species"]
-        self.growthRate = data.Growth_Rate
-        self.catch_rate = data.Catch_Rate
-        self.ev_yield = data.EV_Yield
-        self.moveData = data.Learnset
-
-        if isinstance(data.Type, str):
-            self.type1 = data.Type
-            self.type2 = None
-        else:
-            # will be in as a tuple
-            self.type1 = data.Type[0]
-            self.type2 = data.Type[1]
-
-        exp: int = int(loader.level_up_values.loc[level, self.growthRate]) if exp is None else exp
-        level: int = random.randint(1, 10) if level is None else level
-
-        self.level, self.exp = level, exp
-        self.level_exp: int = int(loader.level_up_values.loc[level, self.growthRate])
-        self.level_up_exp: int = int(loader.level_up_values.loc[level+1, self.growthRate])
-        self.evolveLevel: int = oldData.Evolve_Level
-
-        if moves is None:
-            possible_moves = [name for name, level in self.moveData if level <= self.level]
-            move_names = random.choices(possible_moves, k=min([4, len(possible_moves)]))
-            move_pps = [None] * len(move_names)
-        else:
-            move_names = [move["name"] for move in moves]
-            move_pps = [move["pp"] if "pp" in move else None for move in moves]
-
-        self.moves = [getMove(name, move_pp) for name, move_pp in zip(move_names, move_pps)]
+        # loading for the first time from the start team
+        if self.friendly and (not catch_date and not catch_location and not catch_level):
+            self.catchLocation = None
+            self.catchLevel = self.level
+            self.catchDate = datetime.datetime.now()
 
-        self.EVs = EVs if EVs is not None else [0] * 6
-        self.IVs = IVs if IVs is not None else [random.randint(0, 31) for _ in range(6)]
+    @classmethod
+    def from_data(
+            cls, data: PokemonData, friendly: bool = False, visible: bool = False, lazy_load: bool = True,
+    ) -> "Pokemon":
+        """
+        Create a view of existing Pokémon data, e.g. to draw a boxed Pokémon or take it into battle.
 
-        self.stats = Stats(exp=data.Base_Exp)
-        self.update_stats()
+        :param data: the Pokémon data, shared with the view rather than copied
+        :param friendly: the Pokémon belongs to the player
+        :param visible: show the Pokémon
+        :param lazy_load: don't load the images and sprite until the Pokémon is first drawn
+        """
+        pokemon = cls.__new__(cls)
+        pokemon.data = data
+        pokemon._init_view(friendly=friendly, visible=visible, lazy_load=lazy_load)
+        return pokemon
 
-        self.health = health if health else self.stats.health
+    def _init_view(self, friendly=False, visible=False, animations: None | Animations = None, lazy_load=False):
         self.friendly = friendly
 
-        if gender:
-            self.gender = gender.lower()
-        else:
-            genders = data.Gender
-            self.gender = ("male" if random.random() * 100 < genders[0] else "female") if genders else None
-
-        ability_name = ability_name if ability_name else random.choice(data.Abilities[:len(data.Abilities)])
-        self.ability = Ability(name=ability_name)
-
-        self.nature = nature if nature else loader.natures.loc[random.randint(0, 24)].Name
-        self.shiny = shiny if shiny else (True if random.randint(0, 4095) == 0 else False)
-
-        self.sprite: None | PokemonSprite = None
+        # surfaces, loaded on first access
+        self._sprite: None | PokemonSprite = None
+        self._images: None | dict[str, pg.Surface] = None
+        self._small_image: None | pg.Surface = None
 
         self._clear_surfaces = False
-        self.images: None | dict[str, pg.Surface] = None
-
-        self.smallImage: None | pg.Surface = None
 
         self.animation = animations.front if animations else None
         self.small_animation = animations.small if animations else None
 
-        self.load_images()
+        if not lazy_load:
+            self.load_images()
 
-        self.displayImage = self.image.copy()
-        self.sprite_mask = pg.mask.from_surface(self.image)
+        # =========== SPRITE INITIALISATION =======
+        pg.sprite.Sprite.__init__(self)
+        self.sprite_type = "pokemon"
+        self.id = self.name
+        self.visible = visible
 
+    # ========== DATA ==========
+    # the state of the individual is stored on its PokemonData, species values come from the records
+    level = _DataField("level")
+    exp = _DataField("exp")
+    health = _DataField("health")
+    status = _DataField("status")
+    gender = _DataField("gender")
+    shiny = _DataField("shiny")
+    nature = _DataField("nature")
+    moves = _DataField("moves")
+    EVs = _DataField("evs")
+    IVs = _DataField("ivs")
+    item = _DataField("item")
+    stat_stages = _DataField("stat_stages")
+    catchLocation = _DataField("catch_location")
+    catchLevel = _DataField("catch_level")
+    catchDate = _DataField("catch_date")
+
+    # the local dex number, shared by alternate forms, for display, sprites and evolutions
+    ID = _SpeciesField("local_id")
+    name = _SpeciesField("name")
+    species = _SpeciesField("species")
+    growthRate = _SpeciesField("growth_rate")
+    catch_rate = _SpeciesField("catch_rate")
+    ev_yield = _SpeciesField("ev_yield")
+    moveData = _SpeciesField("learnset")
+    type1 = _SpeciesField("type1")
+    type2 = _SpeciesField("type2")
+    evolveLevel = _SpeciesField("evolve_level")
 
-        self.stat_stages = StatStages(**stat_stages) if stat_stages else StatStages()
-        self.status = StatusEffect(status) if status else None
+    @property
+    def stats(self) -> Stats:
+        return self.data.stats
 
-        self.item = None
+    @property
+    def level_exp(self) -> int:
+        return self.data.level_exp
 
-        self.catchLocation = catch_location
-        self.catchLevel = catch_level
-        if catch_date:
-            year, month, day = catch_date.split("-")
-            self.catchDate = datetime.date(int(year), int(month), int(day))
-        else:
-            self.catchDate = None
+    @property
+    def level_up_exp(self) -> int:
+        return self.data.level_up_exp
 
-        # loading for the first time from the start team
-        if self.friendly and (not catch_date and not catch_location and not catch_level):
-            self.catchLocation = None
-            self.catchLevel = self.level
-            self.catchDate = datetime.datetime.now()
+    @property
+    def ability(self) -> Ability:
+        return Ability(name=self.data.ability)
 
-        # =========== SPRITE INITIALISATION =======
-        pg.sprite.Sprite.__init__(self)
-        self.sprite_type = "pokemon"
-        self.id = name
-        self.visible = visible
+    @ability.setter
+    def ability(self, ability: Ability | str) -> None:
+        self.data.ability = ability if isinstance(ability, str) else ability.name
 
     def __str__(self):
         return f"Lv.{self.level} {self.name} caught on {self.catchDate}.\nIt likes playing \n{self.stats}"
 
     def __repr__(self):
-        return f"Pokemon({self.name},Lv{self.level},Type:{self.type1}, IVs:{self.IVs})"
+        return f"Pokemon({self.name},Lv{self.level},Type:{self.type1}, IVs:{list(self.IVs)})"
 
     def __getstate__(self):
         self._clear_images()
         return self.__dict__
 
     def __setstate__(self, state):
+        # saves from before lazy loading stored the surfaces as plain attributes
+        for key in ("images", "sprite", "smallImage", "displayImage", "sprite_mask"):
+            state.pop(key, None)
+
+        if "data" not in state:
+            state = self._migrate_state(state)
+
         self.__dict__.update(state)
-        self.load_images()
+        self.__dict__.setdefault("_images", None)
+        self.__dict__.setdefault("_sprite", None)
+        self.__dict__.setdefault("_small_image", None)
+
+    @staticmethod
+    def _migrate_state(state: dict) -> dict:
+        """ Move the data of a Pokémon pickled before PokemonData into its own object """
+        data = PokemonData(
+            state["name"], state["level"], state["exp"], state["IVs"], state["EVs"],
+            state["moves"],
+            status=state.get("status"),
+            nature_id=records.natures.index(state["nature"]),
+            gender=state.get("gender"),
+            shiny=state.get("shiny", False),
+            ability=state["ability"].name,
+            stat_stages=state.get("stat_stages"),
+            catch_location=state.get("catchLocation"),
+            catch_level=state.get("catchLevel"),
+            catch_date=state.get("catchDate"),
+        )
+        data.health = state["health"]
+        data.item = state.get("item")
+
+        view_keys = {"friendly", "visible", "animation", "small_animation", "_clear_surfaces", "sprite_type", "id"}
+        migrated = {key: value for key, value in state.items() if key in view_keys or key.startswith("_")}
+        migrated["data"] = data
+        return migrated
 
     @classmethod
     def get_images(cls, local_id, crop=False, shiny=False) -> dict[str, pg.Surface]:
-        """ Return the font, back and small images for the Pokémon """
-        cache_key = (local_id, shiny)
-        if cache_key in cls._sprite_cache:
-            # Return copies to avoid external modification affecting cache
-            cached = cls._sprite_cache[cache_key]
-            return {
-                "front": cached["front"].copy(),
-                "back": cached["back"].copy(),
-                "small": cached["small"].copy()
-            }
-
-        grid_width, per_row = 5, 32
-
-        image_size = pg.Vector2(80, 80)
-
-        y, x = divmod(local_id - 1, int(per_row / 2))
-
-        images = {}
-
-        pk_block = pg.Rect((x * (80 + grid_width) * 2 + grid_width, y * (80 + grid_width) * 2 + grid_width),
-                           image_size * 2 + pg.Vector2(grid_width, grid_width))
-
-        front_rect = pg.Rect(pk_block.topleft, image_size)
-        back_rect = pg.Rect(pk_block.topleft + pg.Vector2(image_size.x + grid_width, 0), image_size)
-
-        if shiny:
-            front_rect = front_rect.move(pg.Vector2(0, grid_width + image_size.y))
-            back_rect = back_rect.move(pg.Vector2(0, grid_width + image_size.y))
-
-        small_rect = pg.Rect(pg.Vector2(x * (32 + grid_width) + grid_width, y * (32 + grid_width) + grid_width),
-                             (32, 32))
-
-        images["front"] = cls.all_sprites[front_rect.top:front_rect.bottom, front_rect.left:front_rect.right, :]
-        images["back"] = cls.all_sprites[back_rect.top:back_rect.bottom, back_rect.left:back_rect.right, :]
-        images["small"] = cls.small_sprites[small_rect.top:small_rect.bottom, small_rect.left:small_rect.right, :]
-
-        for k, v in images.items():
-            editor.loadData(v)
-            if crop and k != "small":
-                editor.crop_transparent_borders(overwrite=True)
-            editor.scaleImage((2, 2), overwrite=True)
-            images[k] = editor.createSurface()
-
-        # Cache the surfaces
-        cls._sprite_cache[cache_key] = {
-            "front": images["front"].copy(),
-            "back": images["back"].copy(),
-            "small": images["small"].copy()
-        }
-
-        return images
+        """ Return new front, back and small images for the Pokémon, cut from the pre-built sprite atlas """
+        return pokemon_atlas.get_images(local_id, crop=crop, shiny=shiny)
 
     @property
     def rect(self) -> pg.Rect:
@@ -433,7 +355,7 @@ class Pokemon(pg.sprite.Sprite):
     @property
     def is_koed(self) -> bool:
         """ Return True if the Pokémon has no health left """
-        return self.health <= 0
+        return self.data.is_koed
 
     @property
     def image(self) -> None | pg.Surface:
@@ -446,6 +368,64 @@ class Pokemon(pg.sprite.Sprite):
     def image(self, img: pg.Surface) -> None:
         self.images["front"] = img
 
+    # ========== SURFACES ==========
+    @property
+    def images(self) -> dict[str, pg.Surface]:
+        if self._images is None:
+            self.load_images(verbose=False)
+        return self._images
+
+    @images.setter
+    def images(self, images: None | dict[str, pg.Surface]) -> None:
+        self._images = images
+
+    @property
+    def sprite(self) -> "PokemonSprite":
+        if self._sprite is None:
+            self.load_images(verbose=False)
+        return self._sprite
+
+    @sprite.setter
+    def sprite(self, sprite: None | PokemonSprite) -> None:
+        self._sprite = sprite
+
+    @property
+    def smallImage(self) -> pg.Surface:
+        if self._small_image is None:
+            self.load_images(verbose=False)
+        return self._small_image
+
+    @smallImage.setter
+    def smallImage(self, image: None | pg.Surface) -> None:
+        self._small_image = image
+
+    @property
+    def images_loaded(self) -> bool:
+        return self._images is not None
+
+    @property
+    def displayImage(self) -> pg.Surface:
+        """ The unmodified blit image, shared with every Pokémon of the species """
+        return SpeciesSprites.get(self.ID, shiny=self.shiny).images["back" if self.friendly else "front"]
+
+    @property
+    def sprite_mask(self) -> pg.Mask:
+        return SpeciesSprites.get(self.ID, shiny=self.shiny).mask("back" if self.friendly else "front")
+
+    def set_opacity(self, opacity: float) -> None:
+        """
+        Set the opacity of the blit image. The species image is shared, so it is copied before the first change.
+
+        :param opacity: the opacity, from 0 to 255
+        """
+        key = "back" if self.friendly else "front"
+        if SpeciesSprites.get(self.ID, shiny=self.shiny).is_shared(self.images[key]):
+            if opacity >= 255:
+                return
+            self.images[key] = self.images[key].copy()
+
+        self.images[key].set_alpha(opacity)
+
     @property
     def health_ratio(self) -> float:
         """
@@ -454,7 +434,7 @@ class Pokemon(pg.sprite.Sprite):
         :return: heath ratio
         :rtype: float (0-1)
         """
-        return self.health / self.stats.health
+        return self.data.health_ratio
 
     def _get_move_damage(self, move: Move2, target, ignore_modifiers=False) -> float:
         """ Return the damage that the move will do to the target"""
@@ -511,8 +491,8 @@ class Pokemon(pg.sprite.Sprite):
 
         stab = 1.5 if (move.type == self.type1 or move.type == self.type2) else 1
 
-        type1 = self.effectiveness.loc[str.upper(move.type), target.type1]
-        type2 = self.effectiveness.loc[str.upper(move.type), target.type2] if target.type2 else 1
+        type1 = records.get_effectiveness(move.type, target.type1)
+        type2 = records.get_effectiveness(move.type, target.type2)
 
         SRF, EB, TL, Berry = 1, 1, 1, 1
 
@@ -534,8 +514,7 @@ class Pokemon(pg.sprite.Sprite):
         :param foe_name: the name of the pokemon that was knocked out
         """
 
-        data = loader.pokedex.loc[foe_name]
-        EVYield = data.EV_Yield
+        EVYield = records.species[foe_name].ev_yield
         for [idx, value] in enumerate(EVYield):
             self.EVs[idx] += value
 
@@ -550,16 +529,11 @@ class Pokemon(pg.sprite.Sprite):
         return exp
 
     def update_stats(self):
-        data = loader.pokedex.loc[self.name]
-        base_stats = data.Stats  # [HP, Atk, Def, SpAtk, SpDef, Speed]
-        self.stats = Stats.from_base_and_evs(base_stats, self.EVs, self.level, self.stats.exp)
+        self.data.update_stats()
 
     def level_up(self):
         """ Level up the pokémon. Update the stats """
-        self.level += 1
-        self.level_exp = int(loader.level_up_values.loc[self.level, self.growthRate])
-        self.level_up_exp = int(loader.level_up_values.loc[self.level + 1, self.growthRate])
-        self.update_stats()
+        self.data.level_up()
 
     def get_new_moves(self) -> list[Move2]:
         """ Return a list of new moves for this level """
@@ -567,33 +541,30 @@ class Pokemon(pg.sprite.Sprite):
 
     def get_evolution(self):
         """ Get the evolution of the pokémon """
-        return loader.old_pokedex[loader.old_pokedex["ID"] == self.ID + 1].index[0]
+        return records.species_by_id[self.ID + 1].name
 
     def _clear_images(self) -> None:
         self.animation = None
-
-        self.displayImage = None
-
-        self.smallImage = None
         self.small_animation = None
-        self.sprite.kill()
-        self.sprite = None
-        self.sprite_mask = None
+        self.release_images()
+
+    def release_images(self) -> None:
+        """ Drop the images and sprite. They are loaded again the next time the Pokémon is drawn. """
+        if self._sprite is not None:
+            self._sprite.kill()
 
-        self.images = None
+        self._sprite = None
+        self._images = None
+        self._small_image = None
 
-    def load_images(self, verbose=True):
-        """ Load images """
+    @telemetry.timed("pokemon.load_images")
+    def load_images(self, verbose=False):
+        """ Load images, timed by the pokemon.load_images telemetry timer """
         t1 = time.monotonic()
-        self.images = self.get_images(self.ID, crop=True, shiny=self.shiny)
+        self.images = SpeciesSprites.get(self.ID, shiny=self.shiny).images
 
         self.smallImage = self.images["small"]
 
-        if self.animation is not None:
-            animations = createAnimation(self.name)
-            self.small_animation = animations.small
-            self.animation = animations.front
-
         self.sprite = PokemonSprite(self.ID, self.shiny, friendly=self.friendly)
 
         if verbose:
@@ -602,29 +573,29 @@ class Pokemon(pg.sprite.Sprite):
     def reset_stat_stages(self) -> None:
         self.stat_stages = StatStages()
 
+    def modify_stat_stage(self, stat_name: str, change: int) -> bool:
+        """
+        Apply an in-battle stat stage change, clamped to the -6 to +6 range.
+
+        :param stat_name: the stat as named in the move effect data, e.g. "Sp Attack"
+        :param change: number of stages to raise (positive) or lower (negative) the stat by
+        :return: True if the stage hit its limit
+        """
+        attr = self.stat_stage_names.get(stat_name)
+        if attr is None:
+            return False
+
+        stage = getattr(self.stat_stages, attr) + change
+        setattr(self.stat_stages, attr, max(-6, min(6, stage)))
+        return not -6 <= stage <= 6
+
     def restore(self) -> None:
         """ Restore the pokémon to full health """
-        self.health = self.stats.health
-        self.status = None
-
-        for move in self.moves:
-            move.PP = move.maxPP
+        self.data.restore()
 
     # ========== GET JSON SAVE DATA  =============
     def get_json_data(self) -> dict[str, Any]:
         """ Return the json data representation of this pokémon """
-        status = self.status.value if self.status else None
-
-        data = {
-            "name": self.name, "level": self.level, "exp": self.exp,
-            "moves": [move.get_json() for move in self.moves], "health": self.health,
-            "status": status, "EVs": self.EVs, "IVs": self.IVs,
-            "gender": self.gender, "nature": self.nature, "ability_name": self.ability.name,
-            "stat_stages": self.stat_stages.__dict__,
-            "friendly": self.friendly, "shiny": self.shiny, "visible": self.visible,
-            "catch_date": self.catchDate.strftime("%Y-%m-%d"),
-            "catch_location": self.catchLocation,
-            "catch_level": self.catchLevel
-        }
-
+        data = self.data.get_json_data()
+        data.update(friendly=self.friendly, visible=self.visible)
         return data
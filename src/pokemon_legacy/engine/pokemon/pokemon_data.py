@@ -0,0 +1,356 @@
+"""
+Compact per-individual Pokémon data.
+
+``PokemonData`` holds only what differs between two Pokémon of the same species: level, exp, IVs / EVs, moves,
+health, status and so on, in slots rather than an instance dictionary. Species data (types, base stats,
+learnset) is read from the shared records, and surfaces and sprite state belong to the ``Pokemon`` view, so
+boxed, trainer and simulated Pokémon can be held as data alone.
+"""
+import datetime
+import random
+from array import array
+from dataclasses import dataclass, asdict
+from enum import Enum
+from math import floor
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from pokemon_legacy.engine.data.records import SpeciesRecord, records
+from pokemon_legacy.engine.general.Move import Move2, getMove
+
+
+class StatusEffect(Enum):
+    """ Status Effect that a pokémon can have """
+    Burned = "Burned"
+    Frozen = "Frozen"
+    Paralysed = "Paralysed"
+    Poisoned = "Poisoned"
+    Sleeping = "Sleeping"
+    Confusion = "Confusion"
+
+
+class Stats:
+    __slots__ = ("health", "attack", "defence", "spAttack", "spDefence", "speed", "exp")
+
+    def __init__(self, health=0, attack=0, defence=0, spAttack=0, spDefence=0, speed=0, exp=0):
+        self.health = health
+        self.attack = attack
+        self.defence = defence
+        self.spAttack = spAttack
+        self.spDefence = spDefence
+        self.speed = speed
+        self.exp = exp
+
+    @staticmethod
+    def _calc_stat(base, ev, level, is_hp=False):
+        ev_part = ev + ev // 4
+        if is_hp:
+            return floor(((2 * base + ev_part) * level) / 100 + level + 10)
+        return floor(((2 * base + ev_part) * level) / 100 + 5)
+
+    @classmethod
+    def from_base_and_evs(cls, base_stats, evs, level, exp=0):
+        """
+        Factory for Stats from base stats + EVs.
+
+        :param base_stats: iterable [HP, Atk, Def, SpAtk, SpDef, Speed]
+        :param evs: iterable [HP EV, Atk EV, ...]
+        :param level: Pokémon level
+        :param exp: current exp
+        :return: Stats instance
+        """
+        health = cls._calc_stat(base_stats[0], evs[0], level, is_hp=True)
+        others = [cls._calc_stat(b, e, level) for b, e in zip(base_stats[1:], evs[1:])]
+        return cls(health, *others, exp)
+
+    def _items(self):
+        return [(name, getattr(self, name)) for name in self.__slots__]
+
+    def __sub__(self, other):
+        return Stats(**{k: v1 - getattr(other, k) for k, v1 in self._items()})
+
+    def __str__(self):
+        return f"{self._items()}"
+
+    def __iter__(self):
+        for val in self.get_values():
+            yield val
+
+    def __getitem__(self, key):
+        return self.get_values()[key]
+
+    def get_values(self):
+        """ Return all values of stats """
+        return [self.health, self.attack, self.defence, self.spAttack, self.spDefence, self.speed]
+
+
+@dataclass
+class StatStages:
+    """ dataclass to keep track of the in-battle stat stages """
+    attack: int = 0
+    defence: int = 0
+    spAttack: int = 0
+    spDefence: int = 0
+    speed: int = 0
+    accuracy: int = 0
+    evasion: int = 0
+
+
+class PokemonData:
+    """ The state of an individual Pokémon, without any surfaces """
+    __slots__ = (
+        "species_name", "level", "exp", "health", "status", "nature_id", "gender", "shiny", "ability",
+        "ivs", "evs", "moves", "item", "catch_location", "catch_level", "catch_date", "_stat_stages", "_stats",
+    )
+
+    def __init__(
+            self,
+            species_name: str,
+            level: int,
+            exp: int,
+            ivs: Iterable[int],
+            evs: Iterable[int],
+            moves: list[Move2],
+            health: None | float = None,
+            status: None | StatusEffect = None,
+            nature_id: int = 0,
+            gender: None | str = None,
+            shiny: bool = False,
+            ability: None | str = None,
+            stat_stages: None | StatStages = None,
+            catch_location: None | str = None,
+            catch_level: None | int = None,
+            catch_date: None | datetime.date = None,
+    ):
+        """
+        :param species_name: the name of the species, unique unlike its local dex number which alternate forms share
+        :param level: the current level
+        :param exp: the total exp
+        :param ivs: the six individual values, 0-31
+        :param evs: the six effort values
+        :param moves: the known moves with their remaining PP
+        :param health: the current health, defaults to full health
+        :param status: the current status condition
+        :param nature_id: the index of the nature in ``records.natures``
+        :param gender: "male", "female" or None
+        :param shiny: use the shiny sprites
+        :param ability: the name of the ability
+        :param stat_stages: the in-battle stat stages, created when first needed
+        """
+        self.species_name = species_name
+        self.level = level
+        self.exp = exp
+        self.ivs = array("B", ivs)
+        self.evs = array("H", evs)
+        self.moves = moves
+        self.status = status
+        self.nature_id = nature_id
+        self.gender = gender
+        self.shiny = shiny
+        self.ability = ability
+        self.item = None
+
+        self.catch_location = catch_location
+        self.catch_level = catch_level
+        self.catch_date = catch_date
+
+        self._stat_stages = stat_stages
+        self._stats: None | Stats = None
+        self.health = health if health else self.stats.health
+
+    @classmethod
+    def create(
+            cls,
+            name: str,
+            level: None | int,
+            exp: None | int = None,
+            moves: None | list[dict] = None,
+            health: None | float = None,
+            status: None | str = None,
+            EVs: None | list[int] = None,
+            IVs: None | list[int] = None,
+            gender: None | str = None,
+            nature: None | str = None,
+            ability_name: None | str = None,
+            stat_stages: None | dict = None,
+            shiny: None | bool = None,
+            catch_location: None | str = None,
+            catch_level: None | int = None,
+            catch_date: None | str = None,
+    ) -> "PokemonData":
+        """
+        Create a Pokémon from its save data, rolling any missing moves, IVs, gender, ability, nature and shininess.
+        The arguments match the keys of the save data.
+        """
+        data = records.species[name]
+
+        level_exp = records.level_exp[data.growth_rate]
+        exp = level_exp[level] if exp is None else exp
+        level = random.randint(1, 10) if level is None else level
+
+        if moves is None:
+            possible_moves = [move_name for move_name, move_level in data.learnset if move_level <= level]
+            move_names = random.choices(possible_moves, k=min([4, len(possible_moves)]))
+            move_pps = [None] * len(move_names)
+        else:
+            move_names = [move["name"] for move in moves]
+            move_pps = [move["pp"] if "pp" in move else None for move in moves]
+
+        IVs = IVs if IVs is not None else [random.randint(0, 31) for _ in range(6)]
+
+        if gender:
+            gender = gender.lower()
+        else:
+            genders = data.gender
+            gender = ("male" if random.random() * 100 < genders[0] else "female") if genders else None
+
+        ability_name = ability_name if ability_name else random.choice(data.abilities)
+        nature_id = records.natures.index(nature) if nature else random.randint(0, 24)
+        shiny = shiny if shiny else (True if random.randint(0, 4095) == 0 else False)
+
+        if catch_date:
+            year, month, day = catch_date.split("-")
+            catch_date = datetime.date(int(year), int(month), int(day))
+
+        return cls(
+            data.name, level, exp,
+            ivs=IVs,
+            evs=EVs if EVs is not None else [0] * 6,
+            moves=[getMove(name, move_pp) for name, move_pp in zip(move_names, move_pps)],
+            health=health,
+            status=StatusEffect(status) if status else None,
+            nature_id=nature_id,
+            gender=gender,
+            shiny=shiny,
+            ability=ability_name,
+            stat_stages=StatStages(**stat_stages) if stat_stages else None,
+            catch_location=catch_location,
+            catch_level=catch_level,
+            catch_date=catch_date,
+        )
+
+    def __repr__(self):
+        return f"PokemonData({self.name},Lv{self.level})"
+
+    # ========== SPECIES ==========
+    @property
+    def species(self) -> SpeciesRecord:
+        return records.species[self.species_name]
+
+    @property
+    def species_id(self) -> int:
+        """ The local dex number of the species, for display and sprites """
+        return self.species.local_id
+
+    @property
+    def name(self) -> str:
+        return self.species_name
+
+    @property
+    def nature(self) -> str:
+        return records.natures[self.nature_id]
+
+    @nature.setter
+    def nature(self, nature: str) -> None:
+        self.nature_id = records.natures.index(nature)
+
+    # ========== STATS ==========
+    @property
+    def stats(self) -> Stats:
+        if self._stats is None:
+            self.update_stats()
+        return self._stats
+
+    def update_stats(self) -> None:
+        """ Recalculate the stats, after a level up or EV change """
+        species = self.species
+        self._stats = Stats.from_base_and_evs(species.base_stats, self.evs, self.level, species.base_exp)
+
+    @property
+    def stat_stages(self) -> StatStages:
+        if self._stat_stages is None:
+            self._stat_stages = StatStages()
+        return self._stat_stages
+
+    @stat_stages.setter
+    def stat_stages(self, stat_stages: None | StatStages) -> None:
+        self._stat_stages = stat_stages
+
+    @property
+    def level_exp(self) -> int:
+        return records.level_exp[self.species.growth_rate][self.level]
+
+    @property
+    def level_up_exp(self) -> int:
+        return records.level_exp[self.species.growth_rate][self.level + 1]
+
+    @property
+    def is_koed(self) -> bool:
+        return self.health <= 0
+
+    @property
+    def health_ratio(self) -> float:
+        return self.health / self.stats.health
+
+    def level_up(self) -> None:
+        self.level += 1
+        self.update_stats()
+
+    def restore(self) -> None:
+        """ Restore the pokémon to full health """
+        self.health = self.stats.health
+        self.status = None
+
+        for move in self.moves:
+            move.PP = move.maxPP
+
+    # ========== SAVE DATA ==========
+    def get_json_data(self) -> dict[str, Any]:
+        """ Return the save data, in the form accepted by ``create`` """
+        return {
+            "name": self.name, "level": self.level, "exp": self.exp,
+            "moves": [move.get_json() for move in self.moves], "health": self.health,
+            "status": self.status.value if self.status else None, "EVs": list(self.evs), "IVs": list(self.ivs),
+            "gender": self.gender, "nature": self.nature, "ability_name": self.ability,
+            "stat_stages": asdict(self.stat_stages),
+            "shiny": self.shiny,
+            "catch_date": self.catch_date.strftime("%Y-%m-%d") if self.catch_date else None,
+            "catch_location": self.catch_location,
+            "catch_level": self.catch_level,
+        }
+
+
+# ========== BATCH OPERATIONS ==========
+def compute_stats(pokemon: Sequence[PokemonData]) -> np.ndarray:
+    """
+    Calculate the stats of many Pokémon at once.
+
+    :param pokemon: the Pokémon
+    :return: an (n, 6) array of [HP, Atk, Def, SpAtk, SpDef, Speed]
+    """
+    if not pokemon:
+        return np.zeros((0, 6), dtype=np.int64)
+
+    base = np.array([pk.species.base_stats for pk in pokemon], dtype=np.int64)
+    evs = np.array([pk.evs for pk in pokemon], dtype=np.int64)
+    levels = np.array([pk.level for pk in pokemon], dtype=np.int64)[:, None]
+
+    stats = ((2 * base + evs + evs // 4) * levels) // 100 + 5
+    stats[:, 0] += levels[:, 0] + 5
+    return stats
+
+
+def update_stats(pokemon: Sequence[PokemonData]) -> None:
+    """ Recalculate the cached stats of many Pokémon at once """
+    for pk, values in zip(pokemon, compute_stats(pokemon).tolist()):
+        pk._stats = Stats(*values, exp=pk.species.base_exp)
+
+
+def restore_all(pokemon: Iterable[PokemonData]) -> None:
+    """ Restore many Pokémon to full health """
+    for pk in pokemon:
+        pk.health = pk.stats.health
+        pk.status = None
+        for move in pk.moves:
+            move.PP = move.template.max_pp
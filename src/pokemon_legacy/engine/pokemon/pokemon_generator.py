@@ -1,10 +1,24 @@
+import warnings
+from typing import Iterable
+
 from pokemon_legacy.engine.pokemon.pokemon import Pokemon
-from pokemon_legacy.engine.general.Animations import createAnimation
+from pokemon_legacy.engine.pokemon.animation_cache import (
+    AnimationLoader, AnimationLRU, DEFAULT_MAX_BYTES, animation_loader
+)
 
 
 class PokemonGenerator:
-    def __init__(self):
-        self.animations = {}
+    def __init__(self, max_animation_bytes: int = DEFAULT_MAX_BYTES, loader: AnimationLoader = animation_loader):
+        """
+        :param max_animation_bytes: the memory cap of the cached species animations
+        :param loader: decodes the species animations in the background
+        """
+        self.animations = AnimationLRU(max_animation_bytes)
+        self.loader = loader
+
+    def prefetch(self, pokemon_names: Iterable[str]) -> None:
+        """ Start decoding the animations of species that are likely to be seen soon """
+        self.loader.prefetch(name for name in pokemon_names if name not in self.animations)
 
     def generate_pokemon(
             self,
@@ -13,7 +27,14 @@ class PokemonGenerator:
     ):
         pk_animations = self.animations.get(pokemon_name)
         if pk_animations is None:
-            pk_animations = createAnimation(pokemon_name)
-            self.animations[pokemon_name] = pk_animations
+            try:
+                pk_animations = self.loader.load(pokemon_name)
+            except Exception as e:
+                # the Pokémon is shown with its still sprites, the decode is tried again for the next one
+                warnings.warn(f"Could not load the animations of {pokemon_name}: {e}")
+                pk_animations = None
+
+            if pk_animations is not None:
+                self.animations[pokemon_name] = pk_animations
 
-        return Pokemon(pokemon_name, animations=pk_animations, **kwargs)
\ No newline at end of file
+        return Pokemon(pokemon_name, animations=pk_animations, **kwargs)
@@ -0,0 +1,105 @@
+"""
+Sprites shared by every Pokémon of a species.
+
+Each Pokémon used to cut its own copies of the front, back and small sprites, build its own alpha mask and load
+the stat stage animations from disk. The surfaces are identical for every Pokémon of the same species, so they
+are now built once per species and shared. Shared surfaces must not be modified: a Pokémon that needs to change
+its image (e.g. fading out when knocked out) copies it first, see ``Pokemon.set_opacity``.
+"""
+import threading
+
+import numpy as np
+import pygame as pg
+
+from pokemon_legacy.engine.general.utils import load_gif
+from pokemon_legacy.engine.pokemon.sprite_atlas import SpriteAtlas, pokemon_atlas
+
+STAT_STAGE_GIFS = {
+    "raise": "assets/battle/main_display/stat_raise.gif",
+    "lower": "assets/battle/main_display/stat_lower.gif",
+}
+
+
+class SpeciesSprites:
+    """ The front, back and small sprites of one species, with masks and stat stage animations built on first use """
+    _cache: dict[tuple[int, bool, bool], "SpeciesSprites"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, local_id: int, shiny: bool = False, crop: bool = True, atlas: SpriteAtlas = pokemon_atlas):
+        """
+        :param local_id: the local dex number of the species
+        :param shiny: use the shiny sprites
+        :param crop: trim the transparent borders of the front and back sprites
+        :param atlas: the sprite atlas to read from
+        """
+        self.local_id = local_id
+        self.shiny = shiny
+        self.crop = crop
+
+        prefix = "shiny_" if shiny else ""
+        self.front = atlas.get(local_id, f"{prefix}front", crop, copy=False)
+        self.back = atlas.get(local_id, f"{prefix}back", crop, copy=False)
+        self.small = atlas.get(local_id, "small", copy=False)
+
+        self._masks: dict[str, pg.Mask] = {}
+        self._alphas: dict[str, np.ndarray] = {}
+        self._stat_animations: dict[tuple[str, str], tuple[pg.Surface, ...]] = {}
+
+    @classmethod
+    def get(cls, local_id: int, shiny: bool = False, crop: bool = True) -> "SpeciesSprites":
+        """ Return the shared sprites of a species, building them on first use """
+        key = (local_id, bool(shiny), crop)
+        sprites = cls._cache.get(key)
+        if sprites is None:
+            with cls._lock:
+                sprites = cls._cache.setdefault(key, SpeciesSprites(local_id, shiny=bool(shiny), crop=crop))
+        return sprites
+
+    @classmethod
+    def clear(cls):
+        cls._cache.clear()
+
+    def __repr__(self):
+        return f"SpeciesSprites({self.local_id}, shiny={self.shiny}, crop={self.crop})"
+
+    @property
+    def images(self) -> dict[str, pg.Surface]:
+        """ Return a new dictionary of the shared surfaces, so entries can be replaced without affecting others """
+        return {"front": self.front, "back": self.back, "small": self.small}
+
+    def is_shared(self, surface: pg.Surface) -> bool:
+        return surface is self.front or surface is self.back or surface is self.small
+
+    def mask(self, side: str) -> pg.Mask:
+        """ Return the collision mask of the front or back sprite """
+        if side not in self._masks:
+            self._masks[side] = pg.mask.from_surface(self.images[side])
+        return self._masks[side]
+
+    def alpha(self, side: str) -> np.ndarray:
+        """ Return the read only alpha channel of the front or back sprite, indexed [y, x] """
+        if side not in self._alphas:
+            alpha = pg.surfarray.array_alpha(self.images[side]).transpose().copy()
+            alpha.flags.writeable = False
+            self._alphas[side] = alpha
+        return self._alphas[side]
+
+    def stat_animation(self, side: str, direction: str) -> tuple[pg.Surface, ...]:
+        """
+        Return the frames of the stat stage animation, the stat overlay blended onto the sprite.
+
+        :param side: "front" or "back"
+        :param direction: "raise" or "lower"
+        """
+        key = (side, direction)
+        if key not in self._stat_animations:
+            image = self.images[side]
+            overlays = load_gif(STAT_STAGE_GIFS[direction], bit_mask=self.alpha(side), opacity=150, scale=2)
+            frames = []
+            for overlay in overlays:
+                frame = image.copy()
+                frame.blit(overlay, (0, 0))
+                frames.append(frame)
+            self._stat_animations[key] = tuple(frames)
+
+        return self._stat_animations[key]
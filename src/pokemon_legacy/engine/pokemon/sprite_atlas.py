@@ -0,0 +1,275 @@
+"""
+Pre-cropped, pre-scaled Pokémon sprite atlas.
+
+The Gen IV sprite sheets are stored at 1x with every sprite in a fixed grid cell. Loading a species used to slice
+the sheets with cv2, crop the transparent borders and scale each image, every time a species was first seen.
+The atlas does that work once: every front, back, shiny and small sprite is cropped, scaled and packed into a
+single PNG, with a JSON index of where each sprite sits and where it belongs in its uncropped frame. The index
+records the content hash of the source sheets, and the atlas is rebuilt whenever they change.
+
+At runtime a sprite is a ``subsurface`` of the atlas, so no cv2 work happens after the atlas is built. Build the
+atlas ahead of time with::
+
+    python -m pokemon_legacy.engine.pokemon
+"""
+import hashlib
+import importlib.resources as resources
+import json
+import os
+import threading
+
+import numpy as np
+import pygame as pg
+
+from pokemon_legacy.constants import DATA_PATH
+from pokemon_legacy.engine.graphics.surface_registry import surface_registry
+
+MODULE_PATH = resources.files(__package__)
+
+SPRITE_SHEET = MODULE_PATH / "assets/Gen_IV_Sprites.png"
+SMALL_SPRITE_SHEET = MODULE_PATH / "assets/Gen_IV_Small_Sprites.png"
+ATLAS_DIR = os.path.join(DATA_PATH, "compiled")
+ATLAS_VERSION = 1
+
+SCALES = (2,)
+
+# sheet layout: each species has a block of front / back (top) and shiny front / shiny back (bottom) sprites
+GRID_WIDTH = 5
+IMAGE_SIZE = 80
+SMALL_SIZE = 32
+PER_ROW = 16
+
+# the width of the packed atlas, tall sprites are packed into shelves across it
+ATLAS_WIDTH = 2048
+
+VARIANTS = ("front", "back", "shiny_front", "shiny_back", "small")
+
+
+def sheet_hash(*paths) -> str:
+    """ Return the combined content hash of the source sheets """
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def sheet_rects(local_id: int) -> dict[str, tuple[int, int, int, int]]:
+    """
+    Return the (x, y, w, h) of each sprite of a species in the source sheets.
+
+    :param local_id: the local dex number of the species
+    """
+    y, x = divmod(local_id - 1, PER_ROW)
+    block_x = x * (IMAGE_SIZE + GRID_WIDTH) * 2 + GRID_WIDTH
+    block_y = y * (IMAGE_SIZE + GRID_WIDTH) * 2 + GRID_WIDTH
+    step = IMAGE_SIZE + GRID_WIDTH
+
+    return {
+        "front": (block_x, block_y, IMAGE_SIZE, IMAGE_SIZE),
+        "back": (block_x + step, block_y, IMAGE_SIZE, IMAGE_SIZE),
+        "shiny_front": (block_x, block_y + step, IMAGE_SIZE, IMAGE_SIZE),
+        "shiny_back": (block_x + step, block_y + step, IMAGE_SIZE, IMAGE_SIZE),
+        "small": (x * (SMALL_SIZE + GRID_WIDTH) + GRID_WIDTH, y * (SMALL_SIZE + GRID_WIDTH) + GRID_WIDTH,
+                  SMALL_SIZE, SMALL_SIZE),
+    }
+
+
+def _species_ids(sheet: np.ndarray) -> range:
+    """ Return the local ids of every complete block in the sprite sheet """
+    rows = (sheet.shape[0] - GRID_WIDTH) // ((IMAGE_SIZE + GRID_WIDTH) * 2)
+    return range(1, rows * PER_ROW + 1)
+
+
+def _opaque_bounds(image: np.ndarray) -> None | tuple[int, int, int, int]:
+    """ Return the (x, y, w, h) of the non-transparent part of a BGRA image, or None if it is fully transparent """
+    rows = np.flatnonzero(image[:, :, 3].any(axis=1))
+    cols = np.flatnonzero(image[:, :, 3].any(axis=0))
+    if not len(rows):
+        return None
+    return int(cols[0]), int(rows[0]), int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1)
+
+
+class SpriteAtlas:
+    """ Packed sprites for every species at one scale, built from the sprite sheets on demand """
+
+    def __init__(
+            self,
+            scale: int = 2,
+            atlas_dir: str = ATLAS_DIR,
+            sheet: str | os.PathLike = SPRITE_SHEET,
+            small_sheet: str | os.PathLike = SMALL_SPRITE_SHEET,
+    ):
+        """
+        :param scale: the integer scale of the packed sprites
+        :param atlas_dir: where the atlas image and index are stored
+        :param sheet: the front / back sprite sheet
+        :param small_sheet: the small sprite sheet
+        """
+        if scale not in SCALES:
+            raise ValueError(f"Unsupported sprite scale {scale}, expected one of {SCALES}")
+
+        self.scale = scale
+        self.sheet = sheet
+        self.small_sheet = small_sheet
+        self.image_path = os.path.join(atlas_dir, f"pokemon_sprites_x{scale}.png")
+        self.index_path = os.path.join(atlas_dir, f"pokemon_sprites_x{scale}.json")
+
+        self._index: None | dict[str, list[int]] = None
+        self._surface: None | pg.Surface = None
+        self._converted = False
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: tuple[int, str]) -> bool:
+        local_id, variant = key
+        self.prepare()
+        return f"{local_id}/{variant}" in self._index
+
+    def __len__(self):
+        self.prepare()
+        return len(self._index)
+
+    # ========== BUILD ==========
+    def is_current(self) -> bool:
+        """ Check that the atlas on disk was built from the current sprite sheets """
+        try:
+            with open(self.index_path, "r") as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            return False
+
+        return (
+                index.get("version") == ATLAS_VERSION
+                and index.get("sheet_hash") == sheet_hash(self.sheet, self.small_sheet)
+                and os.path.exists(self.image_path)
+        )
+
+    def build(self) -> str:
+        """
+        Crop, scale and pack every sprite from the sheets and write the atlas image and index.
+
+        :return: the path of the written atlas image
+        """
+        # cv2 is only needed to build the atlas, not to load it
+        import cv2
+        from pokemon_legacy.engine.graphics.assets import load_cv2_image
+
+        sheet, small_sheet = load_cv2_image(self.sheet), load_cv2_image(self.small_sheet)
+
+        sprites: list[tuple[str, np.ndarray, list[int]]] = []
+        for local_id in _species_ids(sheet):
+            for variant, (x, y, w, h) in sheet_rects(local_id).items():
+                source = small_sheet if variant == "small" else sheet
+                image = source[y: y + h, x: x + w]
+                full_size = [image.shape[1] * self.scale, image.shape[0] * self.scale]
+
+                bounds = _opaque_bounds(image)
+                if bounds is None:
+                    # empty cell, stored as a zero sized sprite
+                    sprites.append((f"{local_id}/{variant}", image[:0, :0], [0, 0, *full_size]))
+                    continue
+
+                bx, by, bw, bh = bounds
+                cropped = image[by: by + bh, bx: bx + bw]
+                cropped = cv2.resize(cropped, (bw * self.scale, bh * self.scale), interpolation=cv2.INTER_NEAREST)
+                sprites.append((f"{local_id}/{variant}", cropped, [bx * self.scale, by * self.scale, *full_size]))
+
+        # shelf packing, tallest sprites first
+        entries, shelf_x, shelf_y, shelf_height = {}, 0, 0, 0
+        placed = []
+        for key, image, frame in sorted(sprites, key=lambda sprite: -sprite[1].shape[0]):
+            h, w = image.shape[:2]
+            if shelf_x + w > ATLAS_WIDTH:
+                shelf_x, shelf_y, shelf_height = 0, shelf_y + shelf_height, 0
+            entries[key] = [shelf_x, shelf_y, w, h, *frame]
+            placed.append((shelf_x, shelf_y, image))
+            shelf_x += w
+            shelf_height = max(shelf_height, h)
+
+        atlas = np.zeros((max(shelf_y + shelf_height, 1), ATLAS_WIDTH, 4), dtype=np.uint8)
+        for x, y, image in placed:
+            atlas[y: y + image.shape[0], x: x + image.shape[1]] = image
+
+        index = {
+            "version": ATLAS_VERSION,
+            "sheet_hash": sheet_hash(self.sheet, self.small_sheet),
+            "scale": self.scale,
+            # x, y, w, h in the atlas, then the offset of the sprite in its uncropped frame and the frame size
+            "sprites": entries,
+        }
+
+        os.makedirs(os.path.dirname(self.image_path), exist_ok=True)
+        temp_image, temp_index = f"{self.image_path}.tmp.png", f"{self.index_path}.tmp"
+        if not cv2.imwrite(temp_image, atlas):
+            raise OSError(f"Could not write sprite atlas {self.image_path}")
+        with open(temp_index, "w") as file:
+            json.dump(index, file)
+        os.replace(temp_image, self.image_path)
+        os.replace(temp_index, self.index_path)
+
+        self._index, self._surface, self._converted = None, None, False
+        return self.image_path
+
+    # ========== LOAD ==========
+    def prepare(self):
+        """
+        Load the atlas, building it first if it is missing or out of date. Safe to call from a loading thread;
+        the atlas is converted to the display format on first use.
+        """
+        if self._index is not None:
+            return
+
+        with self._lock:
+            if self._index is not None:
+                return
+
+            if not self.is_current():
+                self.build()
+
+            with open(self.index_path, "r") as file:
+                index = json.load(file)
+            self._surface = surface_registry.track(pg.image.load(self.image_path), self)
+            self._index = index["sprites"]
+
+    @property
+    def surface(self) -> pg.Surface:
+        self.prepare()
+        if not self._converted and pg.display.get_init() and pg.display.get_surface() is not None:
+            self._surface = surface_registry.track(self._surface.convert_alpha(), self)
+            self._converted = True
+        return self._surface
+
+    def get(self, local_id: int, variant: str, crop: bool = False, copy: bool = True) -> pg.Surface:
+        """
+        Return a surface with one sprite.
+
+        :param local_id: the local dex number of the species
+        :param variant: one of ``VARIANTS``
+        :param crop: trim the transparent borders, otherwise the sprite is placed in its full frame
+        :param copy: return a new surface. Otherwise a cropped sprite is a subsurface sharing the atlas pixels,
+            which must not be modified.
+        """
+        surface = self.surface
+        x, y, w, h, frame_x, frame_y, frame_w, frame_h = self._index[f"{local_id}/{variant}"]
+        sprite = surface.subsurface((x, y, w, h))
+
+        if crop and w and h:
+            return sprite.copy() if copy else sprite
+
+        image = pg.Surface((frame_w, frame_h), pg.SRCALPHA)
+        # max blending onto the clear frame copies the pixels exactly, including partial alpha
+        image.blit(sprite, (frame_x, frame_y), special_flags=pg.BLEND_RGBA_MAX)
+        return image
+
+    def get_images(self, local_id: int, crop: bool = False, shiny: bool = False) -> dict[str, pg.Surface]:
+        """ Return new front, back and small surfaces for a species. The small sprite is never cropped. """
+        prefix = "shiny_" if shiny else ""
+        return {
+            "front": self.get(local_id, f"{prefix}front", crop),
+            "back": self.get(local_id, f"{prefix}back", crop),
+            "small": self.get(local_id, "small"),
+        }
+
+
+pokemon_atlas = SpriteAtlas()
+
@@ -1,4 +1,5 @@
 from pokemon_legacy.engine.pokemon.pokemon import Pokemon
+from pokemon_legacy.engine.pokemon.pokemon_data import restore_all
 
 
 class Team:
@@ -71,8 +72,27 @@ class Team:
 
     def restore(self):
         """ Restore all pokémon in team """
-        for pk in self.pokemon:
-            pk.restore()
+        restore_all(pk.data for pk in self.pokemon)
 
     def get_json_data(self):
-        return [pk.get_json_data() for pk in self.pokemon]
\ No newline at end of file
+        return [pk.get_json_data() for pk in self.pokemon]
+
+
+class TeamSpec:
+    """ The save data of a team, only turned into Pokémon when the team is needed """
+
+    def __init__(self, data: list[dict]):
+        """
+        :param data: the save data of each Pokémon, shared and never modified
+        """
+        self.data = tuple(data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return f"TeamSpec({[pk_data['name'] for pk_data in self.data]})"
+
+    def build(self, lazy_load: bool = True) -> Team:
+        """ Create the Pokémon of the team """
+        return Team(data=list(self.data), lazy_load=lazy_load)
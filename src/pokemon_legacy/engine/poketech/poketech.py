@@ -3,6 +3,7 @@ from enum import Enum
 
 import pygame as pg
 
+from pokemon_legacy.engine.graphics.assets import LazyAsset, load_image
 from pokemon_legacy.engine.graphics.font.font import ClockFont
 from pokemon_legacy.engine.graphics.screen_V2 import BlitLocation
 from pokemon_legacy.engine.graphics.sprite_screen import SpriteScreen
@@ -100,8 +101,8 @@ class TeamDisplay(SpriteScreen):
         (47, 28), (142, 28), (47, 81), (142, 81), (47, 129), (142, 129)
     ]
 
-    hp_outline = pg.image.load(MODULE_PATH / 'assets/hp_outline.png')
-    hp_infill = pg.image.load(MODULE_PATH / 'assets/hp_infill.png')
+    hp_outline = LazyAsset("poketech/hp_outline", load_image, MODULE_PATH / 'assets/hp_outline.png')
+    hp_infill = LazyAsset("poketech/hp_infill", load_image, MODULE_PATH / 'assets/hp_infill.png')
 
     def __init__(self, size, team: Team, scale: float = 1.0):
         SpriteScreen.__init__(self, size)
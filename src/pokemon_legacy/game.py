@@ -1,30 +1,38 @@
 import os
-import json
+import glob
 import random
-import shutil
 import sys
 import warnings
 import time
-import pickle
 from datetime import datetime
+from typing import Any
 
 from dataclasses import dataclass
 
-import pandas as pd
 import pygame as pg
 
 from pokemon_legacy.engine import pokemon_generator, item_generator
 
 from pokemon_legacy.engine.bag.bag import BagV2
 from pokemon_legacy.engine.battle.battle import Battle, BattleOutcome
+from pokemon_legacy.constants import ASSET_PATH
+from pokemon_legacy.engine.battle.battle_speed import BattleSpeed
+from pokemon_legacy.engine.data.records import records
+from pokemon_legacy.engine.data.autosave import Autosave, AutosaveTrigger, DEFAULT_TRIGGERS
+from pokemon_legacy.engine.data.save_file import SaveError, SaveFile
+from pokemon_legacy.engine.game_world.tiled_map import preload_tmx
+from pokemon_legacy.engine.graphics.assets import assets
 from pokemon_legacy.engine.game_world.game_map import TallGrass
 from pokemon_legacy.engine.game_world.game_obejct import PokeballTile
 from pokemon_legacy.engine.pokedex.pokedex import Pokedex
-from pokemon_legacy.engine.game_log.game_log import GameLog, GameEvent, GameEventType
+from pokemon_legacy.engine.game_log.game_log import GameLog, GameEvent, GameEventType, LOG_DIR
 
 from pokemon_legacy.displays.load_display import LoadDisplay
 from pokemon_legacy.engine.general.controller import Controller
 from pokemon_legacy.engine.general.Time import Time
+from pokemon_legacy.engine.general.task_graph import TaskGraph, LoadTask
+from pokemon_legacy.engine.general.profiler import profiler
+from pokemon_legacy.engine.general.telemetry import telemetry
 from pokemon_legacy.engine.general.Route import Route
 from pokemon_legacy.engine.general.utils import Colours, wait_for_key
 
@@ -47,23 +55,28 @@ from pokemon_legacy.engine.pokemon.pokemon import Pokemon
 
 from pokemon_legacy.engine.poketech.poketech import Poketech
 from pokemon_legacy.engine.pokemon.team import Team
-
-
-pokedex = pd.read_csv("assets/data/pokedex/Local Dex.tsv", delimiter='\t', index_col=1)
+from pokemon_legacy.engine.pokemon.sprite_atlas import pokemon_atlas
 
 
 @dataclass
 class GameConfig:
     # active stats
     text_speed: float = 3.0
+    # battle messages are typed at the text speed, then scaled with the battle animations by the battle speed
+    battle_speed: BattleSpeed = BattleSpeed.normal
     graphics_scale: float = 1.0
 
     render_mode: int = 0
     explore_mode: bool = False
+    lazy_load: bool = False
+    # record frame telemetry, render mode 2 and above also draws the telemetry overlay
+    telemetry: bool = False
 
     # save config
     save_slot: None | int = None
     overwrite_mode: bool = False
+    autosave_triggers: tuple[AutosaveTrigger, ...] = DEFAULT_TRIGGERS
+    autosave_steps: int = 100
 
 
 class Game:
@@ -78,6 +91,8 @@ class Game:
     ):
 
         self.cfg = cfg
+        if cfg.telemetry or cfg.render_mode > 1:
+            telemetry.enable()
 
         self.overwrite: bool = overwrite
         self.save_slot: int = save_slot
@@ -85,6 +100,10 @@ class Game:
 
         self.data_path: str = f"assets/data/save_states/{'save_state_' + str(save_slot) if not new else 'start'}"
 
+        # save components are plain JSON, read before any engine object is created
+        self.save_file = SaveFile.for_slot(save_slot)
+        save_data = None if new else self.save_file.load()
+
         native_size = pg.Vector2(256, 382)
         self.graphics_scale = cfg.graphics_scale
 
@@ -108,49 +127,68 @@ class Game:
         }
 
         self.load_displays()
-        self.game_display = GameDisplay(
-            self.topSurf.get_size(),
-            self.player,
-            window=self.topSurf,
-            scale=self.graphics_scale,
-            render_mode=self.cfg.render_mode
-        )
 
         self.animations = {}
 
-        # ==== PICKLE DATA INITIALISATION ====
+        # ==== SAVE DATA INITIALISATION ====
+        self._start_location: dict[str, str] = {}
+        # the play time of previous sessions, the current session is timed from the end of startup
+        self._saved_play_time: float = 0.0
+        if save_data:
+            game_state = GameState[save_data["story"]["game_state"]]
+            player_state = save_data["player"]
+            self.player.load_from_state(
+                {**player_state, "team": save_data["team"], "bag": save_data["bag"]}, lazy_load=cfg.lazy_load
+            )
+            self._saved_play_time = player_state.get("play_time", 0.0)
+            if player_state.get("map_name"):
+                self._start_location = {
+                    "start_map": player_state["map_name"], "start_collection": player_state["collection_name"]
+                }
+
         self.game_state_machine = build_game_state_machine(initial=game_state)
 
         self.battle = None
 
         self.controller = Controller()
-        self.poketech = Poketech(self.topSurf.get_size(), self.time, team=self.player.team, scale=self.graphics_scale)
-        self.pokedex = Pokedex(self)
-        self.pokedex.data.loc[[pk.name for pk in self.player.team], "appearances"] += 1
-        self.pokedex.load_surfaces()
-
-        # ========== DISPLAY INITIALISATION =========
-        self.menu_objects = {
-            GameDisplayStates.pokedex: self.pokedex,
-            GameDisplayStates.team: MenuTeamDisplay(self.displaySize, self.graphics_scale, self),
-            GameDisplayStates.bag: MenuBagDisplay(self.displaySize, self.graphics_scale, self),
-        }
 
+        self.poketech = None
+        self.pokedex = None
+        self.menu_objects = None
         self.menu_active = False
 
-        # === initialise the game characters ===
-        self.rival = Rival(scale=self.graphics_scale)
-        self.professor_rowan = ProfessorRowan(scale=self.graphics_scale)
-        self.dawn = Dawn(scale=self.graphics_scale)
+        self.rival = None
+        self.professor_rowan = None
+        self.dawn = None
+
+        # ========== STARTUP LOADING =========
+        self.startup = self.build_startup_graph()
+        self.startup.run(on_progress=self.show_load_progress)
+
+        if save_data:
+            self.pokedex.load_from_state(save_data["pokedex"])
+            self.game_display.load_from_state({"player": save_data["player"]})
+            self.game_display.load_map_state(save_data["maps"])
 
         self.storyline_events = [
             SelectStarterPokemon()
         ]
 
         # ==== LOG INITIALISATION ====
-        self.log, self.log_dir = GameLog(), "assets/data/logs"
+        self.log, self.log_dir = GameLog(LOG_DIR), LOG_DIR
         self.log.add_event(GameEvent(name="startup complete"))
 
+        # saves are written on a worker thread, autosaves are only taken when the slot is being overwritten
+        self.autosave = Autosave(
+            self.save_file,
+            triggers=cfg.autosave_triggers if overwrite else (),
+            step_interval=cfg.autosave_steps,
+            on_saved=lambda written: self.log.add_event(
+                GameEvent(f"game saved successfully: {', '.join(written) if written else 'no changes'}")
+            ),
+            on_error=lambda e: self.log.add_event(GameEvent(f"Save failed: {e}", GameEventType.error)),
+        )
+
         # ========== POST INITIALISATION =========
         # happens after all attributes initialised
         self.loadDisplay.finish()
@@ -161,71 +199,106 @@ class Game:
         pg.time.delay(750)
 
         self.game_display.fade_to_black(self.topSurf, self.bottomSurf, 500)
+        self._session_start = time.monotonic()
 
-    # GET JSON
-    def _get_json_data(self):
-        game_state = {
-            "game_state": self.game_state_machine.current_state_value.name,
-            "player": self.player.get_json_data(),
-            "game_display": self.game_display.get_json_data(),
-        }
+    # === STARTUP ===
+    def build_startup_graph(self) -> TaskGraph:
+        """
+        Declare the startup loading tasks. File reads, parsing and sprite sheet decoding run on worker threads;
+        everything that creates surfaces runs on the main thread once its inputs are ready.
+        """
+        graph = TaskGraph()
 
-        return game_state
+        data = graph.add("game data", self._load_game_data, background=True)
+        sheets = graph.add("sprite sheets", self._load_sprite_sheets, background=True)
+        maps = graph.add("map files", self._parse_map_files, background=True)
 
-    def _load_from_save_state(self):
-        if self.cfg.save_slot:
-            save_file = f"assets/data/save_states/save_state_{self.cfg.save_slot}/game_state.json"
-        else:
-            save_file = f"assets/data/save_states/start/game_state.json"
+        graph.add("game display", self._create_game_display, deps=[data, sheets, maps], weight=4)
+        graph.add("poketech", self._create_poketech, deps=[data])
+        pokedex = graph.add("pokedex", self._create_pokedex, deps=[data], weight=2)
+        graph.add("menus", self._create_menus, deps=[pokedex], weight=2)
+        graph.add("characters", self._create_characters, deps=[data, sheets])
+
+        return graph
+
+    def show_load_progress(self, progress: float, task: LoadTask):
+        """ Draw the startup progress, called on the main thread as each loading task finishes """
+        self.loadDisplay.update_progress(progress, task.name)
+        top, bottom = self.loadDisplay.getScreens()
+        self.topSurf.blit(top, (0, 0))
+        self.bottomSurf.blit(bottom, (0, 0))
+        pg.display.flip()
+        pg.event.pump()
 
-        save_data = json.load(open(save_file))
-        self.game_state_machine = build_game_state_machine(initial=GameState[save_data.get("game_state", "new_game")])
+    @staticmethod
+    def _load_game_data():
+        records.preload()
 
-        self.player.load_from_state(save_data.get("player"))
+    @staticmethod
+    def _load_sprite_sheets():
+        pokemon_atlas.prepare()
+        assets.get("characters/npc_sheet")
 
-        active_map = save_data["game_display"]["map_name"]
-        active_collection = save_data["game_display"]["collection_name"]
+    @staticmethod
+    def _parse_map_files() -> int:
+        return preload_tmx(glob.glob(os.path.join(ASSET_PATH, "maps", "**", "*.tmx"), recursive=True))
+
+    def _create_game_display(self):
         self.game_display = GameDisplay(
             self.topSurf.get_size(),
             self.player,
             window=self.topSurf,
             scale=self.graphics_scale,
             render_mode=self.cfg.render_mode,
-            start_map=active_map,
-            start_collection=active_collection,
+            **self._start_location,
         )
 
-        self.load_game_state()
-        self.game_display.load_from_state(save_data)
-
-    # === GAME SETUP ===
-    def __getstate__(self):
-        save_file = f"assets/data/save_states/save_state_{self.cfg.save_slot}/game_state.json"
-        with open(save_file, "w") as f:
-            json.dump(self._get_json_data(), f, indent=4)
-
-        self.window = None
-        self.topSurf = None
-        self.bottomSurf = None
-
-        # need to set all pygame surfaces to none
-        self.game_display = None
-        self.animations = None
-        self.loadDisplay = None
+    def _create_poketech(self):
+        self.poketech = Poketech(self.topSurf.get_size(), self.time, team=self.player.team, scale=self.graphics_scale)
 
-        self.menu_objects = None
+    def _create_pokedex(self):
+        self.pokedex = Pokedex(self)
+        self.pokedex.data.loc[[pk.name for pk in self.player.team], "appearances"] += 1
+        self.pokedex.load_surfaces()
 
-        self.game_state_machine = None
+    def _create_menus(self):
+        self.menu_objects = {
+            GameDisplayStates.pokedex: self.pokedex,
+            GameDisplayStates.team: MenuTeamDisplay(self.displaySize, self.graphics_scale, self),
+            GameDisplayStates.bag: MenuBagDisplay(self.displaySize, self.graphics_scale, self),
+        }
 
-        return self.__dict__
+    def _create_characters(self):
+        self.rival = Rival(scale=self.graphics_scale)
+        self.professor_rowan = ProfessorRowan(scale=self.graphics_scale)
+        self.dawn = Dawn(scale=self.graphics_scale)
 
-    def __setstate__(self, state: dict):
-        self.__dict__.update(state)
-        self.running = True
-        self.load_displays()
-        self._load_from_save_state()
+    # === SAVE DATA ===
+    def get_save_components(self) -> dict[str, Any]:
+        """ Return the JSON data of each save component, see ``SaveFile`` """
+        player = self.player.get_json_data()
+        return {
+            "story": {"game_state": self.game_state_machine.current_state_value.name},
+            "player": {
+                "name": self.player.name,
+                "play_time": round(self.play_time, 1),
+                "steps": player["steps"],
+                "money": player["money"],
+                "positions": player["positions"],
+                **self.game_display.get_json_data(),
+            },
+            "team": player["team"],
+            "bag": player["bag"],
+            "pokedex": self.pokedex.get_json_data(),
+            "maps": self.game_display.get_map_state(),
+        }
 
     # === DYNAMIC PROPERTIES ===
+    @property
+    def play_time(self) -> float:
+        """ The total play time of the save, in seconds """
+        return self._saved_play_time + time.monotonic() - self._session_start
+
     @property
     def time(self):
         return datetime.now()
@@ -246,6 +319,15 @@ class Game:
     ):
         return pokemon_generator.generate_pokemon(name, **kwargs)
 
+    def prefetch_wild_pokemon(self):
+        """ Decode the animations of the active map's wild Pokémon in the background, before the first encounter """
+        if self.cfg.explore_mode:
+            return
+
+        routes = {grass.route for grass in self.game_display.map.get_sprite_types(TallGrass)}
+        for route in sorted(routes):
+            pokemon_generator.prefetch(Route.get(route).species)
+
     def load_displays(self):
         self.window = pg.display.set_mode(self.displaySize)
         self.topSurf = self.window.subsurface(((0, 0), (self.displaySize.x, self.displaySize.y / 2)))
@@ -256,6 +338,7 @@ class Game:
 
         self.displays["choose_starter"] = ChooseStarterDisplay(self.topSurf.get_size(), scale=self.graphics_scale)
 
+    @telemetry.timed("game.update_display")
     def update_display(
             self,
             flip: bool = True
@@ -264,6 +347,8 @@ class Game:
         self.game_display.refresh()
         self.topSurf.blit(self.game_display.get_surface(), (0, 0))
         self.bottomSurf.blit(self.poketech.get_surface(), (0, 0))
+        if self.cfg.render_mode > 1:
+            telemetry.draw_overlay(self.topSurf)
         if flip:
             pg.display.flip()
 
@@ -285,16 +370,25 @@ class Game:
         :return: bool
         """
 
+        start_map = self.game_display.map
         map_obj, moved, edge = self.game_display.move_player(
             direction, self.topSurf, check_facing_direction=check_direction, duration=duration
         )
 
         if moved:
-            self.update_display()
+            # the first draw of a map entered through a door or link
+            with profiler.region("map_transition", when=self.game_display.map is not start_map):
+                self.update_display()
             self.player.steps += 1
             self.poketech.pedometerSteps += 1
             self.poketech.update_pedometer()
 
+            if self.game_display.map is not start_map:
+                self.prefetch_wild_pokemon()
+                self.autosave.trigger(AutosaveTrigger.map_change, self.get_save_components)
+            else:
+                self.autosave.step(self.player.steps, self.get_save_components)
+
             if (
                 not self.cfg.explore_mode
                 and isinstance(map_obj, TallGrass)
@@ -357,8 +451,7 @@ class Game:
     ) -> None:
         """ Start a battle. """
         if not foe_team:
-            route = Route(route)
-            wild_name, wild_level = route.encounter(self.time)
+            wild_name, wild_level = Route.get(route).encounter(self.time)
             wild_pk: Pokemon = self.create_pokemon(wild_name, level=wild_level)
             foe_team = [wild_pk]
 
@@ -366,14 +459,16 @@ class Game:
             self.pokedex.data.loc[pk.name, "appearances"] += 1
 
         self.log.add_event(GameEvent(name=f"battle started against {foe_team}", event_type=GameEventType.game))
-        self.battle = Battle(self, self.player.team, foe_team, route_name=route, trainer=trainer)
-        outcome = self.battle.run()
+        with profiler.region("battle"):
+            self.battle = Battle(self, self.player.team, foe_team, route_name=route, trainer=trainer)
+            outcome = self.battle.run()
 
         if outcome == BattleOutcome.quit:
             self.running = False
         else:
             self.battle = None
             self.log.add_event(GameEvent(name=f"battle completed with outcome {outcome}", event_type=GameEventType.game))
+            self.autosave.trigger(AutosaveTrigger.battle_end, self.get_save_components)
 
         if trainer is not None:
             trainer.battled = True
@@ -396,18 +491,19 @@ class Game:
 
         t0 = time.monotonic()
         pg.event.clear()
-        while True:
-            event = pg.event.wait()
-            if event.type == pg.QUIT:
-                self.save_and_exit()
+        with telemetry.suspend():
+            while True:
+                event = pg.event.wait()
+                if event.type == pg.QUIT:
+                    self.save_and_exit()
 
-            elif event.type == pg.KEYDOWN:
-                if event.key == key:
-                    return True
+                elif event.type == pg.KEYDOWN:
+                    if event.key == key:
+                        return True
 
-            if time.monotonic() - t0 > 10 and break_on_timeout:
-                # timeout at 10s
-                return True
+                if time.monotonic() - t0 > 10 and break_on_timeout:
+                    # timeout at 10s
+                    return True
 
     def display_message(
             self,
@@ -567,11 +663,13 @@ class Game:
 
     def loop(self):
         self.load_game_state()
+        self.prefetch_wild_pokemon()
 
         if self.battle:
             self.battle.update_screen(flip=False)
             # self.game_display.fade_to_black(500, battle=True)
-            outcome = self.battle.loop()
+            with profiler.region("battle"):
+                outcome = self.battle.loop()
 
             if outcome == BattleOutcome.quit:
                 self.running = False
@@ -579,6 +677,7 @@ class Game:
                 self.battle = None
                 self.log.add_event(
                     GameEvent(name=f"battle completed with outcome {outcome}", event_type=GameEventType.game))
+                self.autosave.trigger(AutosaveTrigger.battle_end, self.get_save_components)
 
         else:
             self.update_display(flip=False)
@@ -638,14 +737,16 @@ class Game:
 
                     if event.key == self.controller.y:
                         print("looping")
-                        action = self.game_display.menu_loop(self)
-                        while action:
-                            if isinstance(action, GameDisplayStates):
-                                if action in self.menu_objects.keys():
-                                    self.menu_objects[action].loop()
-
+                        # the menus wait on input in their own loops
+                        with telemetry.suspend():
                             action = self.game_display.menu_loop(self)
-                            self.update_display()
+                            while action:
+                                if isinstance(action, GameDisplayStates):
+                                    if action in self.menu_objects.keys():
+                                        self.menu_objects[action].loop()
+
+                                action = self.game_display.menu_loop(self)
+                                self.update_display()
                         self.update_display()
 
                     elif event.key == self.controller.a:
@@ -665,7 +766,7 @@ class Game:
 
                             item = item_generator.generate_item(obj.item)
                             # remove pokeball from map
-                            obj.kill()
+                            self.game_display.collect_item(obj)
                             self.game_display.update(force_refresh=True)
                             self.update_display()
 
@@ -696,41 +797,42 @@ class Game:
 
             self.game_display.update()
             self.update_display()
+            telemetry.frame()
 
         if self.overwrite:
             self.save()
+        self.shutdown()
 
-    def save(self):
-        # save_temp = f"assets/data/save_states/save_{self.save_slot}_temp"
-        save_dir = f"assets/data/save_states/save_state_{self.save_slot}"
-        save_error = False
-        if not os.path.exists(save_dir):
-            os.mkdir(save_dir)
+    def shutdown(self):
+        """ Export the telemetry, then wait for any autosave and the log to be written """
+        if telemetry.enabled:
+            path = telemetry.export(os.path.join(self.log_dir, f"telemetry_{time.strftime('%Y-%m-%d_%H-%M-%S')}.jsonl"))
+            self.log.add_event(GameEvent(f"telemetry written to {path}"))
+
+        self.autosave.shutdown()
+        self.log.close()
 
+    def save(self):
+        """ Write the save components that have changed since the last save, waiting for any autosave first """
         try:
-            with open(os.path.join(save_dir, "game_temp.pickle"), 'wb') as f:
+            # the save and any autosave in progress share one worker, so they are written in order
+            self.autosave.save_now(self.get_save_components())
 
-                pickle.dump(self, f)
-                print("Successfully pickled")
-                shutil.copy(
-                    os.path.join(save_dir, "game_temp.pickle"),
-                    os.path.join(save_dir, "game.pickle")
-                )
-                # os.remove(os.path.join(save_dir, "game_temp.pickle"))
+        except SaveError as e:
+            # the slot on disk cannot be read back, so it is left as it is rather than saved over
+            warnings.warn(f"Save Failed ({e})...\nThe save slot was not changed")
+            self.log.add_event(GameEvent(f"save failed: {e}", GameEventType.error))
+            return
 
-        except TypeError as e:
-            save_error = True
-            self.log.add_event(GameEvent("Pickle failed", GameEventType.error))
-            self.log.add_event(GameEvent(str(e), GameEventType.error))
-            warnings.warn("Pickle Failed...\nThe data was not overwritten")
+        except OSError as e:
+            warnings.warn("Save Failed...\nThe previous save was kept")
             raise e
 
-        if not save_error:
-            self.log.add_event(GameEvent("game save successfully"))
-        self.log.write_log(log_dir=self.log_dir)
+        self.log.flush()
 
     def save_and_exit(self):
         self.save()
+        self.shutdown()
         sys.exit(0)
 
     def load_game_state(self):
@@ -1,9 +1,8 @@
-import os.path
 from enum import Enum
 import pygame as pg
 
 from pokemon_legacy.engine.pokemon.pokemon import Pokemon
-from pokemon_legacy.engine.battle.battle_animation import BattleAnimation, ANIMATION_PATH
+from pokemon_legacy.engine.battle.battle_animation import BattleAnimation, animation_cache
 
 
 class BattleActionType(Enum):
@@ -20,6 +19,8 @@ class BattleAction:
 
 
 class BattleAttack(pg.sprite.Sprite, BattleAction, ):
+    opacity = 220
+
     def __init__(self, target: Pokemon, move, animation_size=pg.Vector2(256, 192)):
         """
         Battle attacks are an object that allows the tracking of battle moves and contains the
@@ -43,23 +44,34 @@ class BattleAttack(pg.sprite.Sprite, BattleAction, ):
         self.sprite_type = "animation"
         self.friendly_action = target.friendly
 
-        target_type = "friendly" if self.friendly_action else "foe"
+        target_type = self.get_target_type(move.name, self.friendly_action)
 
         # print(f"Move: {move}, Target: {repr(target)}, Target type: {target_type}")
 
-        if move.name in ["Growl"]:
-            target_type = "foe" if self.friendly_action else "friendly"
-
-        if os.path.isdir(f"assets/battle/move_animations/{move.name}/{target_type}"):
-            # print("Creating animation")
-            frame_path = os.path.join(ANIMATION_PATH, move.name.lower(), target_type)
-            self.animation = BattleAnimation(frame_dir=frame_path, size=animation_size, opacity=220)
+        frames = animation_cache.get(move.name, target_type, animation_size, self.opacity)
+        if frames:
+            self.animation = BattleAnimation(frames=frames)
             self.frame_count = len(self.animation.frames)
             self.frame_idx = 0
         else:
             self.animation = None
             self.frame_count, self.frame_idx = 0, 0
 
+    @staticmethod
+    def get_target_type(move_name: str, friendly_target: bool) -> str:
+        """ Return the animation directory for a move, which depends on the side it affects """
+        target_type = "friendly" if friendly_target else "foe"
+
+        if move_name in ["Growl"]:
+            target_type = "foe" if friendly_target else "friendly"
+
+        return target_type
+
+    @classmethod
+    def cache_key(cls, move, target: Pokemon, animation_size) -> tuple:
+        return animation_cache.make_key(move.name, cls.get_target_type(move.name, target.friendly),
+                                        animation_size, cls.opacity)
+
     def get_animation_frame(self, idx):
         return self.animation[idx]
 
@@ -78,17 +90,19 @@ class BattleTagIn(pg.sprite.Sprite, BattleAction, ):
 
         self.sprite_type = "animation"
 
-        frame_path = os.path.join(ANIMATION_PATH, "tag_in")
-        if os.path.isdir(frame_path):
-            print("Creating animation")
-
-            self.animation = BattleAnimation(frame_dir=frame_path, size=animation_size)
+        frames = animation_cache.get("tag_in", size=animation_size)
+        if frames:
+            self.animation = BattleAnimation(frames=frames)
             self.frame_count = len(self.animation.frames)
             self.frame_idx = 0
         else:
             self.animation = None
             self.frame_count, self.frame_idx = 0, 0
 
+    @staticmethod
+    def cache_key(animation_size) -> tuple:
+        return animation_cache.make_key("tag_in", size=animation_size)
+
     def get_animation_frame(self, idx):
         return self.animation[idx]
 
@@ -18,6 +18,8 @@ from pokemon_legacy.maps.buildings.pokemart.pokemart_containers import (
     ConfirmContainer, ConfirmOption
 )
 
+from pokemon_legacy.engine.data.bundle import game_data
+from pokemon_legacy.engine.graphics.assets import LazyAsset
 from pokemon_legacy.engine.general.item import ItemGenerator
 
 from pokemon_legacy.constants import ASSET_PATH
@@ -175,8 +177,7 @@ class PokeMart(TiledMap2, MapLinkTile, StateMachine):
             | idle.to.itself()
     )
 
-    with open(os.path.join(ASSET_PATH, 'data/game_config/pokemart_data.json'), 'r') as file:
-        pokemart_data: list[dict] = json.load(file)
+    pokemart_data: list[dict] = LazyAsset("pokemart/catalogue", game_data.table, "game_config/pokemart_data.json")
 
     def __init__(self, rect, player, map_scale=1, obj_scale=1, parent_map_scale=1.0, properties=None):
         size = pg.Vector2(256, 192) * map_scale
@@ -3,10 +3,10 @@ import importlib.resources as resources
 from enum import Enum
 
 import pygame as pg
-import pandas as pd
 
 from pokemon_legacy.engine.general.direction import Direction
 from pokemon_legacy.engine.general.item import Item
+from pokemon_legacy.engine.data.records import ItemRecord
 from pokemon_legacy.engine.graphics.screen_V2 import BlitLocation
 from pokemon_legacy.engine.graphics.sprite_screen import DisplayContainer
 from pokemon_legacy.engine.graphics.selector_display import SelectorDisplay
@@ -36,16 +36,7 @@ class ItemSetContainer(SelectorDisplay):
         container_img_path = os.path.join(MODULE_PATH, "assets/containers/item_set_container.png")
         selector_img_path = os.path.join(MODULE_PATH, "assets/containers/item_selector.png")
 
-        cancel_item = Item(
-            data=pd.Series({
-                "name": "CANCEL",
-                "buy_price": None,
-                "sell_price": None,
-                "name_item_type": None,
-                "name_battle_item_type": None
-            }),
-            item_type=None
-        )
+        cancel_item = Item(data=ItemRecord(item_id=None, name="CANCEL"), item_type=None)
 
         cancel_item.image = pg.image.load(os.path.join(MODULE_PATH, "assets/cancel_item.png"))
 
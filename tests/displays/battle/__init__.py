@@ -0,0 +1 @@
+# Battle display tests
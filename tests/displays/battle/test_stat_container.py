@@ -0,0 +1,34 @@
+"""
+Tests for the battle stat containers.
+
+These tests verify:
+- Redrawing just the bars gives the same image as a full update
+"""
+import pygame as pg
+import pytest
+
+
+@pytest.fixture
+def pokemon():
+    """Create a friendly pokemon to display."""
+    from pokemon_legacy.engine.battle.simulator import build_team
+    team = build_team("party", [{"name": "Turtwig", "level": 5, "moves": [{"name": "Tackle"}]}], friendly=True, seed=1)
+    return team[0]
+
+
+class TestStatContainer:
+    """Test the health/exp bar redraws."""
+
+    def test_bar_update_matches_full_update(self, pokemon):
+        """Partial bar redraws should leave the container identical to a full redraw."""
+        from pokemon_legacy.displays.battle.battle_display_main import StatContainer
+
+        container = StatContainer("friendly_stats", pokemon)
+        pokemon.health = pokemon.stats.health * 0.2
+        pokemon.exp = pokemon.level_exp + (pokemon.level_up_exp - pokemon.level_exp) / 2
+
+        container.update_bars()
+        partial = pg.image.tobytes(container.image, "RGBA")
+
+        container.update()
+        assert pg.image.tobytes(container.image, "RGBA") == partial
@@ -0,0 +1 @@
+# Bag tests
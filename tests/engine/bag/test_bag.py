@@ -0,0 +1,55 @@
+"""
+Tests for the bag.
+
+These tests verify:
+- A bag is rebuilt from its saved data
+- Adding an item stacks it with existing items of the same name
+- Items can be added to an empty bag
+- Battle pockets are filtered by battle item type
+"""
+import pytest
+
+
+@pytest.fixture
+def bag():
+    """Create a bag with some medicine and pokeballs."""
+    from pokemon_legacy.engine.bag.bag import BagV2
+    return BagV2({"Medicine": {"Potion": 2, "Antidote": 1}, "Pokeballs": {"Poke Ball": 5}})
+
+
+class TestBag:
+    """Test the bag."""
+
+    def test_load(self, bag):
+        """Saved data should round trip through the bag."""
+        assert bag.get_json_data() == {"Medicine": {"Potion": 2, "Antidote": 1}, "Pokeballs": {"Poke Ball": 5}}
+
+    def test_add_item_stacks(self, bag):
+        """Adding an item should increase the count of the existing stack."""
+        from pokemon_legacy.engine.general.item import ItemType, MedicineItem
+
+        potion = next(item for item in bag.data[ItemType.medicine] if item.name == "Potion")
+        bag.add_item(MedicineItem("Potion"), 3)
+
+        assert len(bag.data[ItemType.medicine]) == 2
+        assert bag.data[ItemType.medicine][potion] == 5
+        assert next(iter(bag.data[ItemType.medicine])) is potion
+
+    def test_add_to_empty_bag(self):
+        """Items should be added to pockets that do not exist yet."""
+        from pokemon_legacy.engine.bag.bag import BagV2
+        from pokemon_legacy.engine.general.item import Pokeball
+
+        bag = BagV2()
+        bag.add_item(Pokeball("Poke Ball"))
+
+        assert bag.get_json_data() == {"Pokeballs": {"Poke Ball": 1}}
+
+    def test_battle_pocket(self, bag):
+        """Battle pockets should contain only the requested battle item type."""
+        from pokemon_legacy.engine.general.item import BattleItemType
+
+        pokeballs = bag.get_items(battle_item_type=BattleItemType.pokeball)
+
+        assert [item.name for item in pokeballs] == ["Poke Ball"]
+        assert list(pokeballs.values()) == [5]
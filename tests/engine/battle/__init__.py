@@ -0,0 +1 @@
+# Battle tests
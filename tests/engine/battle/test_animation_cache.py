@@ -0,0 +1,88 @@
+"""
+Tests for the battle animation frame cache.
+
+These tests verify:
+- Frames are shared between lookups with the same key
+- Preloaded animations are decoded off the main thread and returned by get
+- Missing animations are cached as None
+- Eviction drops the least recently used animations first, and preloads that were never used
+"""
+import pytest
+
+
+SIZE = (64, 48)
+
+
+@pytest.fixture
+def cache():
+    """Create an empty animation cache."""
+    from pokemon_legacy.engine.battle.battle_animation import BattleAnimationCache
+    return BattleAnimationCache(max_entries=2)
+
+
+class TestBattleAnimationCache:
+    """Test the battle animation cache."""
+
+    def test_frames_are_shared(self, cache):
+        """Repeated lookups should not reload the frames."""
+        frames = cache.get("Tackle", "foe", SIZE, 220)
+
+        assert frames
+        assert frames[0].get_size() == SIZE
+        assert frames[0].get_alpha() == 220
+        assert cache.get("tackle", "foe", SIZE, 220) is frames
+
+    def test_key_includes_size_and_opacity(self, cache):
+        """Different sizes or opacities are cached separately."""
+        frames = cache.get("Tackle", "foe", SIZE, 220)
+        other = cache.get("Tackle", "foe", (32, 24), 220)
+
+        assert other is not frames
+        assert other[0].get_size() == (32, 24)
+
+    def test_preload(self, cache):
+        """Preloaded animations should be cached once requested."""
+        key = cache.make_key("Growl", "friendly", SIZE, 220)
+        cache.preload([key, key])
+
+        frames = cache.get("Growl", "friendly", SIZE, 220)
+        assert frames
+        assert key in cache
+
+    def test_missing_animation(self, cache):
+        """Moves without an animation return None."""
+        assert cache.get("Withdraw", "friendly", SIZE) is None
+        assert cache.make_key("Withdraw", "friendly", SIZE) in cache
+
+    def test_lru_eviction(self, cache):
+        """Eviction should keep the most recently used animations."""
+        cache.get("Tackle", "foe", SIZE)
+        cache.get("Tackle", "friendly", SIZE)
+        cache.get("Bubble", "foe", SIZE)
+        cache.get("Tackle", "foe", SIZE)
+
+        assert len(cache) == 3
+        cache.evict()
+
+        assert len(cache) == 2
+        assert cache.make_key("Tackle", "friendly", SIZE) not in cache
+        assert cache.make_key("Tackle", "foe", SIZE) in cache
+        assert cache.make_key("Bubble", "foe", SIZE) in cache
+
+    def test_evict_unused_preloads(self, cache):
+        """Preloads that are never used should not be kept after eviction."""
+        import gc
+        import weakref
+
+        key = cache.make_key("Growl", "friendly", SIZE, 220)
+        cache.preload([key])
+        future = cache._pending[key]
+        frames = weakref.ref(future.result()[0])
+        del future
+
+        cache.evict()
+        gc.collect()
+
+        assert cache.pending == 0
+        assert key not in cache
+        assert frames() is None
@@ -0,0 +1,46 @@
+"""
+Tests for the battle speed setting.
+
+These tests verify:
+- Durations and frame counts scale with the speed
+- Instant speed skips waits but still shows one frame
+- Speeds parse from command line strings
+"""
+import pytest
+
+
+@pytest.fixture
+def speed_cls():
+    """Import the BattleSpeed enum."""
+    from pokemon_legacy.engine.battle.battle_speed import BattleSpeed
+    return BattleSpeed
+
+
+class TestBattleSpeed:
+    """Test the battle speed scaling helpers."""
+
+    def test_scale_durations(self, speed_cls):
+        """Durations are divided by the speed multiplier."""
+        assert speed_cls.normal.scale(1000) == 1000
+        assert speed_cls.double.scale(1000) == 500
+        assert speed_cls.quadruple.scale(1500) == 375
+        assert speed_cls.instant.scale(1000) == 0
+
+    def test_scale_frames(self, speed_cls):
+        """Animations always keep at least one frame."""
+        assert speed_cls.normal.frames(30) == 30
+        assert speed_cls.quadruple.frames(30) == 7
+        assert speed_cls.quadruple.frames(2) == 1
+        assert speed_cls.instant.frames(100) == 1
+
+    @pytest.mark.parametrize("value, expected", [
+        ("1", "normal"), ("2x", "double"), ("4", "quadruple"), ("Instant", "instant"),
+    ])
+    def test_from_string(self, speed_cls, value, expected):
+        """Command line values map onto the speeds."""
+        assert speed_cls.from_string(value) is speed_cls[expected]
+
+    def test_invalid_speed(self, speed_cls):
+        """Unsupported multipliers are rejected."""
+        with pytest.raises(ValueError):
+            speed_cls.from_string("3")
@@ -0,0 +1,116 @@
+"""
+Tests for the headless batch battle simulator.
+
+These tests verify:
+- Stat stage changes are clamped to +/-6
+- Simulated battles always finish with a consistent result
+- Results stream to disk and read back column-wise
+"""
+import json
+
+import numpy as np
+import pytest
+
+
+PARTY = [{"name": "Turtwig", "level": 5, "moves": [{"name": "Tackle"}, {"name": "Withdraw"}]}]
+OPPONENT = [{"name": "Starly", "level": 3, "moves": [{"name": "Tackle"}, {"name": "Growl"}]}]
+
+
+@pytest.fixture
+def simulator():
+    """Import the simulator module."""
+    from pokemon_legacy.engine.battle import simulator
+    return simulator
+
+
+class TestStatStages:
+    """Test the shared stat stage helper used by battles and the simulator."""
+
+    def test_stage_changes_are_clamped(self, simulator):
+        """Stages should never leave the -6 to +6 range."""
+        team = simulator.build_team("party", PARTY, friendly=True, seed=1)
+        pokemon = team[0]
+        pokemon.reset_stat_stages()
+
+        assert pokemon.modify_stat_stage("Defence", 4) is False
+        assert pokemon.modify_stat_stage("Defence", 4) is True
+        assert pokemon.stat_stages.defence == 6
+
+        assert pokemon.modify_stat_stage("Sp Attack", -7) is True
+        assert pokemon.stat_stages.spAttack == -6
+
+    def test_unknown_stat_is_ignored(self, simulator):
+        """Unknown stat names should leave the stages untouched."""
+        team = simulator.build_team("party", PARTY, friendly=True, seed=1)
+        team[0].reset_stat_stages()
+
+        assert team[0].modify_stat_stage("Luck", 2) is False
+        assert team[0].stat_stages.__dict__ == {k: 0 for k in team[0].stat_stages.__dict__}
+
+
+class TestSimulateBattle:
+    """Test single battle resolution."""
+
+    def test_battle_has_one_winner(self, simulator):
+        """A finished battle should leave exactly one side standing."""
+        party = simulator.build_team("party", PARTY, friendly=True, seed=2)
+        opponent = simulator.build_team("opponent", OPPONENT, friendly=False, seed=2)
+
+        for _ in range(10):
+            simulator.reset_team(party)
+            simulator.reset_team(opponent)
+            result = simulator.simulate_battle(party, opponent)
+
+            assert result.turns > 0
+            assert party.all_koed != opponent.all_koed
+            assert result.won == opponent.all_koed
+            assert 0.0 <= result.hp_remaining <= 1.0
+            assert (result.exp_gained > 0) == result.won
+
+    def test_turn_limit(self, simulator):
+        """Battles that hit the turn limit should count as a loss."""
+        party = simulator.build_team("party", PARTY, friendly=True, seed=3)
+        opponent = simulator.build_team("opponent", OPPONENT, friendly=False, seed=3)
+        simulator.reset_team(party)
+        simulator.reset_team(opponent)
+
+        result = simulator.simulate_battle(party, opponent, max_turns=1)
+
+        assert result.turns == 1
+        assert not result.won
+
+
+class TestResultStorage:
+    """Test the columnar result file."""
+
+    def test_round_trip(self, simulator, tmp_path):
+        """Chunks written by the writer should be read back in order."""
+        path = str(tmp_path / "results.cols")
+        chunks = [
+            {name: np.arange(n).astype(dtype) for name, dtype in simulator.RESULT_COLUMNS.items()}
+            for n in (3, 5)
+        ]
+
+        with simulator.ColumnarResultWriter(path) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+
+        results = simulator.load_results(path)
+        assert len(results["turns"]) == 8
+        assert results["turns"].dtype == np.uint16
+        assert results["turns"].tolist() == [0, 1, 2, 0, 1, 2, 3, 4]
+
+        with open(path + ".json") as f:
+            assert json.load(f)["rows"] == 8
+
+    def test_run_simulation_in_process(self, simulator, tmp_path):
+        """An in-process run should write every battle and summarise each pairing."""
+        path = str(tmp_path / "results.cols")
+        metadata = simulator.run_simulation(
+            {"party": PARTY}, {"a": OPPONENT, "b": OPPONENT}, battles=6, out_path=path, chunk_size=4
+        )
+
+        assert metadata["battles"] == 12
+        assert [row["opponent"] for row in metadata["summary"]] == ["a", "b"]
+        assert all(0.0 <= row["win_rate"] <= 1.0 for row in metadata["summary"])
+        assert len(simulator.load_results(path)["won"]) == 12
@@ -0,0 +1,125 @@
+"""
+Tests for the background autosave.
+
+These tests verify:
+- Snapshots share no containers with the live save components
+- Autosaves are written on the worker thread and can be read back
+- Only enabled triggers save, and the steps trigger saves every interval
+- A burst of requests while a save is being written only writes the latest snapshot
+- Failed saves are reported and do not stop later saves
+"""
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def components():
+    """Return the components of a small save."""
+    return {
+        "story": {"game_state": "going_to_lake_verity"},
+        "player": {"steps": 0, "money": 3000, "positions": [("twinleaf_town", "route_orchestrator", [5, 6])]},
+        "team": [{"name": "Piplup", "level": 5}],
+        "bag": {"Medicine": {"Potion": 2}},
+        "pokedex": {"appearances": {}, "caught": []},
+        "maps": {},
+    }
+
+
+@pytest.fixture
+def autosave(tmp_path):
+    """Create an autosave writing to an empty slot."""
+    from pokemon_legacy.engine.data.autosave import Autosave
+    from pokemon_legacy.engine.data.save_file import SaveFile
+
+    autosave = Autosave(SaveFile(str(tmp_path / "save_state_1")), step_interval=10)
+    yield autosave
+    autosave.shutdown()
+
+
+class BlockingSaveFile:
+    """A save file whose first save waits until it is released."""
+
+    def __init__(self, save_file):
+        self.save_file = save_file
+        self.started, self.release = threading.Event(), threading.Event()
+        self.saved = []
+
+    def save(self, components):
+        self.started.set()
+        self.release.wait(5)
+        self.saved.append(components)
+        return self.save_file.save(components)
+
+
+class TestAutosave:
+    """Test writing snapshots in the background."""
+
+    def test_snapshot(self, components):
+        """A snapshot should not change when the live components do."""
+        from pokemon_legacy.engine.data.autosave import snapshot
+
+        copy = snapshot(components)
+        components["player"]["positions"][0][2][0] = 7
+        components["bag"]["Medicine"]["Potion"] = 1
+
+        assert copy["player"]["positions"] == [["twinleaf_town", "route_orchestrator", [5, 6]]]
+        assert copy["bag"]["Medicine"]["Potion"] == 2
+
+    def test_background_save(self, autosave, components):
+        """A requested save should be written on the worker thread."""
+        from pokemon_legacy.engine.data.save_file import SaveFile
+
+        threads = []
+        autosave.on_saved = lambda written: threads.append(threading.current_thread())
+
+        future = autosave.request(components)
+        components["player"]["money"] = 0
+
+        assert sorted(future.result(5)) == sorted(components)
+        assert threads and threads[0] is not threading.main_thread()
+        assert SaveFile(autosave.save_file.save_dir).load()["player"]["money"] == 3000
+
+    def test_triggers(self, autosave, components):
+        """Only enabled triggers should save."""
+        from pokemon_legacy.engine.data.autosave import AutosaveTrigger
+
+        autosave.triggers = frozenset([AutosaveTrigger.map_change])
+        assert autosave.trigger(AutosaveTrigger.battle_end, lambda: components) is None
+        assert autosave.step(10, lambda: components) is None
+        assert autosave.trigger(AutosaveTrigger.map_change, lambda: components) is not None
+
+        autosave.triggers = frozenset([AutosaveTrigger.steps])
+        assert autosave.step(9, lambda: components) is None
+        assert autosave.step(20, lambda: components) is not None
+
+    def test_coalesces(self, autosave, components):
+        """Requests made while a save is written should only write the latest snapshot."""
+        blocking = BlockingSaveFile(autosave.save_file)
+        autosave.save_file = blocking
+
+        first = autosave.request(components)
+        assert blocking.started.wait(5)
+        for steps in range(1, 6):
+            components["player"]["steps"] = steps
+            autosave.request(components)
+
+        blocking.release.set()
+        first.result(5)
+        autosave.wait(5)
+
+        assert [saved["player"]["steps"] for saved in blocking.saved] == [0, 5]
+        assert not autosave.busy
+
+    def test_failed_save(self, autosave, components, tmp_path):
+        """A failed save should be reported and the next save written."""
+        errors = []
+        autosave.on_error = errors.append
+
+        (tmp_path / "save_state_1").write_text("not a directory")
+        with pytest.raises(OSError):
+            autosave.save_now(components)
+        assert len(errors) == 1
+
+        (tmp_path / "save_state_1").unlink()
+        assert sorted(autosave.save_now(components)) == sorted(components)
@@ -0,0 +1,137 @@
+"""
+Tests for the compiled game data bundle.
+
+These tests verify:
+- Tables round trip through the bundle unchanged
+- A warm load reads the bundle without parsing any source files
+- Changed sources are recompiled, while touched but unchanged sources are not
+- Bundles with a different format version or a corrupt payload are rebuilt
+- Tables matched by a pattern are discovered and dropped with their source files
+"""
+import os
+
+import pytest
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Create a small data directory."""
+    data = tmp_path / "data"
+    (data / "Locations").mkdir(parents=True)
+    (data / "Moves.tsv").write_text("Name\tType\tPP\nTackle\tNormal\t35\nBubble\tWater\t30\n")
+    (data / "Locations" / "Route A.tsv").write_text("Time\tPokemon\nMorning\t[Starly]\n")
+    (data / "config.json").write_text('{"1": ["Hello"]}')
+    return data
+
+
+@pytest.fixture
+def make_game_data(data_dir, tmp_path):
+    """Create game data services sharing a bundle path."""
+    from pokemon_legacy.engine.data.bundle import GameData
+
+    specs = {
+        "Moves.tsv": {"delimiter": "\t", "index_col": 0},
+        "Locations/*.tsv": {"delimiter": "\t", "index_col": 0},
+        "config.json": {},
+    }
+
+    def make():
+        return GameData(str(data_dir), str(tmp_path / "compiled" / "game_data.bundle"), specs)
+
+    return make
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    """Record the source files parsed by the bundle."""
+    from pokemon_legacy.engine.data import bundle
+
+    calls = []
+    parse_table = bundle.parse_table
+
+    def record(path, **kwargs):
+        calls.append(os.path.basename(path))
+        return parse_table(path, **kwargs)
+
+    monkeypatch.setattr(bundle, "parse_table", record)
+    return calls
+
+
+class TestGameData:
+    """Test the compiled game data bundle."""
+
+    def test_round_trip(self, make_game_data):
+        """Tables should be identical after being read back from the bundle."""
+        built = make_game_data()
+        path = built.build()
+        assert os.path.exists(path)
+
+        loaded = make_game_data()
+        assert loaded.table("Moves.tsv").equals(built.table("Moves.tsv"))
+        assert loaded.table("Moves.tsv").at["Bubble", "PP"] == 30
+        assert loaded.table("config.json") == {"1": ["Hello"]}
+        assert "Locations/Route A.tsv" in loaded
+
+    def test_warm_load_does_not_parse(self, make_game_data, parse_calls):
+        """A current bundle should be used without reparsing the sources."""
+        make_game_data().build()
+        parse_calls.clear()
+
+        game_data = make_game_data()
+        game_data.table("Moves.tsv")
+
+        assert parse_calls == []
+
+    def test_changed_source_is_recompiled(self, make_game_data, data_dir, parse_calls):
+        """Only sources whose content changed should be parsed again."""
+        make_game_data().build()
+        parse_calls.clear()
+
+        (data_dir / "Moves.tsv").write_text("Name\tType\tPP\nTackle\tNormal\t35\nEmber\tFire\t25\n")
+        stat = os.stat(data_dir / "config.json")
+        os.utime(data_dir / "config.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        game_data = make_game_data()
+        assert "Ember" in game_data.table("Moves.tsv").index
+        assert parse_calls == ["Moves.tsv"]
+
+        parse_calls.clear()
+        make_game_data().table("Moves.tsv")
+        assert parse_calls == []
+
+    def test_version_mismatch_rebuilds(self, make_game_data, parse_calls, monkeypatch):
+        """A bundle written by a different format version should be ignored."""
+        from pokemon_legacy.engine.data import bundle
+
+        make_game_data().build()
+        parse_calls.clear()
+
+        monkeypatch.setattr(bundle, "BUNDLE_VERSION", bundle.BUNDLE_VERSION + 1)
+        make_game_data().table("Moves.tsv")
+
+        assert sorted(parse_calls) == ["Moves.tsv", "Route A.tsv", "config.json"]
+
+    def test_corrupt_bundle_rebuilds(self, make_game_data, parse_calls):
+        """A bundle that fails its content hash should be rebuilt."""
+        path = make_game_data().build()
+        with open(path, "r+b") as file:
+            file.seek(-8, os.SEEK_END)
+            file.write(b"\x00" * 8)
+        parse_calls.clear()
+
+        assert make_game_data().table("Moves.tsv").at["Tackle", "PP"] == 35
+        assert len(parse_calls) == 3
+
+    def test_pattern_tables(self, make_game_data, data_dir):
+        """New and removed files matching a pattern should be picked up."""
+        make_game_data().build()
+
+        (data_dir / "Locations" / "Route B.tsv").write_text("Time\tPokemon\nNight\t[Hoothoot]\n")
+        (data_dir / "Locations" / "Route A.tsv").unlink()
+
+        game_data = make_game_data()
+        assert "Locations/Route B.tsv" in game_data
+        assert "Locations/Route A.tsv" not in game_data
+
+        with pytest.raises(KeyError):
+            game_data.table("Locations/Route A.tsv")
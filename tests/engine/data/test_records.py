@@ -0,0 +1,105 @@
+"""
+Tests for the static game data record store.
+
+These tests verify:
+- Species, moves, items and abilities are indexed by name and by ID
+- Species numbers shared with alternate forms give the base form
+- Missing and non-numeric fields are normalised to None
+- Lookup tables (exp, effectiveness, natures) match the source data
+- Records are immutable
+"""
+import pytest
+
+
+@pytest.fixture
+def records():
+    """Return the shared record store."""
+    from pokemon_legacy.engine.data.records import records
+    return records
+
+
+class TestSpeciesRecords:
+    """Test the species table."""
+
+    def test_lookup_by_name_and_id(self, records):
+        """A species can be found by name or local dex number."""
+        turtwig = records.species["Turtwig"]
+
+        assert records.species_by_id[turtwig.local_id] is turtwig
+        assert turtwig.type1 == "Grass" and turtwig.type2 is None
+        assert turtwig.evolve_level == 18
+        assert ("Tackle", 1) in turtwig.learnset
+
+    def test_dual_type(self, records):
+        """Dual typed species keep both types."""
+        starly = records.species["Starly"]
+        assert (starly.type1, starly.type2) == ("Normal", "Flying")
+
+    def test_number_gives_base_form(self, records):
+        """Alternate forms share a local number, which finds the base form."""
+        for base, form in (("Alakazam", "Mega Alakazam"), ("Geodude", "Alolan Geodude"), ("Lucario", "Mega Lucario")):
+            assert records.species[form].local_id == records.species[base].local_id
+            assert records.species_by_id[records.species[base].local_id].name == base
+
+        assert records.species_by_id[records.species["Burmy (Sandy Cloak)"].local_id].name == "Burmy (Plant Cloak)"
+
+    def test_records_are_immutable(self, records):
+        """Records cannot be modified by the code using them."""
+        with pytest.raises(AttributeError):
+            records.species["Turtwig"].catch_rate = 255
+
+
+class TestMoveRecords:
+    """Test the move table."""
+
+    def test_move_fields(self, records):
+        """Move fields are parsed into python values."""
+        bubble = records.moves["Bubble"]
+
+        assert records.moves_by_id[bubble.move_id] is bubble
+        assert (bubble.type, bubble.power, bubble.accuracy, bubble.pp) == ("Water", 40, 100, 30)
+        assert bubble.effect == ("Stat", "10", "1", "Speed", "Foe", "Lower")
+
+    def test_status_move(self, records):
+        """Status moves have no power and no effect is stored as None."""
+        growl = records.moves["Growl"]
+        assert growl.power is None
+        assert records.moves["Tackle"].effect is None
+
+
+class TestItemRecords:
+    """Test the item table."""
+
+    def test_case_insensitive_lookup(self, records):
+        """Items can be found regardless of the name's case."""
+        potion = records.get_item("potion")
+
+        assert potion is records.items["Potion"]
+        assert records.items_by_id[potion.item_id] is potion
+        assert potion.item_type == "Medicine"
+        assert potion.heal_amount == 20
+        assert records.get_item("Master Key") is None
+
+    def test_pokeball_fields(self, records):
+        """Pokeball specific columns are merged into the record."""
+        assert records.items["Great Ball"].rate_modifier == 1.5
+
+
+class TestLookupTables:
+    """Test the exp, effectiveness and nature tables."""
+
+    def test_level_exp(self, records):
+        """Exp thresholds are indexed by growth rate then level."""
+        assert records.level_exp["Medium Slow"][5] == 135
+        assert records.level_exp["Fast"][100] == 800000
+
+    def test_effectiveness(self, records):
+        """Type effectiveness multipliers are looked up case-insensitively."""
+        assert records.get_effectiveness("Fire", "Grass") == 2
+        assert records.get_effectiveness("WATER", "Fire") == 2
+        assert records.get_effectiveness("Normal", None) == 1
+
+    def test_natures(self, records):
+        """All 25 natures are available in order."""
+        assert len(records.natures) == 25
+        assert records.natures[0] == "Hardy"
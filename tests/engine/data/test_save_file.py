@@ -0,0 +1,241 @@
+"""
+Tests for the component-wise save files.
+
+These tests verify:
+- Components round trip through a save slot
+- Only components whose content changed are written again, and replaced revisions are removed
+- A save over a slot that was not loaded replaces its components
+- Legacy game_state.json saves are split into components
+- Newer save versions, components that do not match the manifest and unreadable slots raise SaveError
+- Unreadable slots are moved aside, keeping their files
+- Saving and loading a slot takes milliseconds
+- Each save writes a small header matching its manifest, and slots are listed from their headers
+- Headers that do not match their manifest are rebuilt from the components
+"""
+import json
+import os
+import shutil
+import time
+
+import pytest
+
+LEGACY_SAVE = "assets/data/save_states/save_state_1/game_state.json"
+
+
+@pytest.fixture
+def components():
+    """Return the components of a small save."""
+    return {
+        "story": {"game_state": "going_to_lake_verity"},
+        "player": {"name": "Benji", "play_time": 3725.0, "steps": 12, "money": 3000, "positions": [], "map_name": "twinleaf_town",
+                   "collection_name": "route_orchestrator"},
+        "team": [{"name": "Piplup", "level": 5}],
+        "bag": {"Medicine": {"Potion": 2}},
+        "pokedex": {"appearances": {"Piplup": 1}, "caught": ["Piplup"]},
+        "maps": {},
+    }
+
+
+@pytest.fixture
+def save_file(tmp_path):
+    """Create a save file in an empty slot."""
+    from pokemon_legacy.engine.data.save_file import SaveFile
+    return SaveFile(str(tmp_path / "save_state_1"))
+
+
+class TestSaveFile:
+    """Test writing and reading save slots."""
+
+    def test_round_trip(self, save_file, components):
+        """Loading a slot should return the saved components."""
+        from pokemon_legacy.engine.data.save_file import SaveFile
+
+        assert save_file.load() is None
+        assert sorted(save_file.save(components)) == sorted(components)
+        assert SaveFile(save_file.save_dir).load() == components
+
+    def test_only_dirty_components_written(self, save_file, components):
+        """Unchanged components should not be written again."""
+        save_file.save(components)
+        assert save_file.save(components) == []
+
+        components["player"]["steps"] += 1
+        assert save_file.save(components) == ["player"]
+
+        manifest = save_file.read_manifest()
+        assert manifest["components"]["player"]["revision"] == 2
+        assert manifest["components"]["team"]["revision"] == 1
+
+        # the replaced revision is removed, nothing is left half written
+        assert sorted(os.listdir(save_file.save_dir)) == sorted(
+            ["manifest.json", "header.json"] + [entry["file"] for entry in manifest["components"].values()]
+        )
+
+    def test_save_over_unloaded_slot(self, save_file, components):
+        """A new save file should replace the components already in the slot."""
+        from pokemon_legacy.engine.data.save_file import SaveFile
+
+        save_file.save(components)
+        components["bag"] = {}
+        SaveFile(save_file.save_dir).save(components)
+
+        assert SaveFile(save_file.save_dir).load()["bag"] == {}
+        assert len(os.listdir(save_file.save_dir)) == len(components) + 2
+
+    def test_legacy_save(self, tmp_path):
+        """A legacy save should be split into components."""
+        from pokemon_legacy.engine.data.save_file import SaveFile
+
+        slot = tmp_path / "save_state_1"
+        slot.mkdir()
+        shutil.copy(LEGACY_SAVE, slot / "game_state.json")
+        with open(LEGACY_SAVE) as file:
+            legacy = json.load(file)
+
+        save_file = SaveFile(str(slot))
+        loaded = save_file.load()
+        assert loaded["story"]["game_state"] == legacy["game_state"]
+        assert loaded["team"] == legacy["player"]["team"]
+        assert loaded["player"]["map_name"] == legacy["game_display"]["map_name"]
+
+        save_file.save(loaded)
+        assert SaveFile(str(slot)).load() == loaded
+
+    def test_newer_version(self, save_file, components):
+        """A save from a newer version should not be loaded."""
+        from pokemon_legacy.engine.data.save_file import SaveError
+
+        save_file.save(components)
+        manifest = save_file.read_manifest()
+        manifest["version"] += 1
+        with open(save_file.manifest_path, "w") as file:
+            json.dump(manifest, file)
+
+        with pytest.raises(SaveError):
+            save_file.load()
+
+    def test_corrupt_component(self, save_file, components):
+        """A component that does not match the manifest should not be loaded."""
+        from pokemon_legacy.engine.data.save_file import SaveError
+
+        save_file.save(components)
+        team_file = save_file.read_manifest()["components"]["team"]["file"]
+        with open(os.path.join(save_file.save_dir, team_file), "w") as file:
+            file.write("[]")
+
+        with pytest.raises(SaveError):
+            save_file.load()
+
+    def test_unreadable_slot(self, save_file, components, tmp_path):
+        """Missing components, incomplete manifests and corrupt legacy saves should raise SaveError."""
+        from pokemon_legacy.engine.data.save_file import SaveError, SaveFile
+
+        save_file.save(components)
+        manifest = save_file.read_manifest()
+        os.remove(os.path.join(save_file.save_dir, manifest["components"]["team"]["file"]))
+        with pytest.raises(SaveError):
+            SaveFile(save_file.save_dir).load()
+
+        del manifest["components"]["team"]
+        with open(save_file.manifest_path, "w") as file:
+            json.dump(manifest, file)
+        with pytest.raises(SaveError):
+            SaveFile(save_file.save_dir).load()
+
+        legacy = tmp_path / "save_state_2"
+        legacy.mkdir()
+        (legacy / "game_state.json").write_text("{")
+        with pytest.raises(SaveError):
+            SaveFile(str(legacy)).load()
+
+    def test_move_aside(self, save_file, components):
+        """An unreadable slot should be moved aside so a new game is not saved over it."""
+        from pokemon_legacy.engine.data.save_file import SaveFile, list_slots
+
+        save_file.save(components)
+        with open(save_file.manifest_path, "w") as file:
+            file.write("{")
+
+        moved = SaveFile(save_file.save_dir).move_aside()
+        assert not os.path.exists(save_file.save_dir)
+        assert os.path.exists(os.path.join(moved, "manifest.json"))
+        assert list_slots(os.path.dirname(save_file.save_dir)) == {}
+
+        new_game = SaveFile(save_file.save_dir)
+        assert new_game.load() is None
+        new_game.save(components)
+        assert SaveFile(save_file.save_dir).load() == components
+
+    def test_fast(self, save_file, components):
+        """Saving and loading should take milliseconds."""
+        from pokemon_legacy.engine.data.save_file import SaveFile
+
+        start = time.perf_counter()
+        for steps in range(20):
+            components["player"]["steps"] = steps
+            save_file.save(components)
+            SaveFile(save_file.save_dir).load()
+
+        assert (time.perf_counter() - start) / 20 < 0.05
+
+
+class TestSlotHeader:
+    """Test the save slot headers."""
+
+    def test_header(self, save_file, components):
+        """A save should write a small header summarising the slot."""
+        from pokemon_legacy.engine.data.records import records
+
+        save_file.save(components)
+        header = save_file.read_header()
+
+        assert os.path.getsize(save_file.header_path) < 512
+        assert header.player_name == "Benji"
+        assert header.play_time_str == "1:02"
+        assert header.game_state == "going_to_lake_verity"
+        assert header.map_name == "twinleaf_town"
+        assert header.party == [records.species["Piplup"].national_id]
+        assert header.checksum == save_file.manifest_checksum()
+
+    def test_header_follows_save(self, save_file, components):
+        """The header should be rewritten with every save that writes a component."""
+        save_file.save(components)
+        components["player"]["map_name"] = "route_201"
+        save_file.save(components)
+
+        header = save_file.read_header()
+        assert header.map_name == "route_201"
+        assert header.checksum == save_file.manifest_checksum()
+
+    def test_stale_header(self, save_file, components):
+        """A header that does not match the manifest should be rebuilt from the components."""
+        from pokemon_legacy.engine.data.save_file import SaveFile
+
+        save_file.save(components)
+        with open(save_file.header_path) as file:
+            stale = file.read()
+
+        # a crash between the manifest and header writes leaves the previous header
+        components["player"]["map_name"] = "route_201"
+        save_file.save(components)
+        with open(save_file.header_path, "w") as file:
+            file.write(stale)
+
+        header = SaveFile(save_file.save_dir).read_header()
+        assert header.map_name == "route_201"
+        assert header.checksum == save_file.manifest_checksum()
+
+    def test_list_slots(self, tmp_path, components):
+        """Slots should be listed from their headers, legacy slots from their components."""
+        from pokemon_legacy.engine.data.save_file import SaveFile, list_slots
+
+        SaveFile(str(tmp_path / "save_state_1")).save(components)
+        legacy = tmp_path / "save_state_2"
+        legacy.mkdir()
+        shutil.copy(LEGACY_SAVE, legacy / "game_state.json")
+        (tmp_path / "save_state_3").mkdir()
+
+        slots = list_slots(str(tmp_path))
+        assert list(slots) == ["1", "2"]
+        assert slots["1"].player_name == "Benji"
+        assert slots["2"].checksum is None
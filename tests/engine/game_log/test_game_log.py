@@ -0,0 +1,128 @@
+"""
+Tests for the streaming game log.
+
+These tests verify:
+- Events are streamed to a JSON lines file by the background writer
+- Only the most recent events are kept in memory
+- Events of filtered out types are neither kept nor written
+- Closing the log writes every remaining event
+- A failed write stops the writer without blocking the game, and events are no longer queued
+- The ring buffer can be dumped, optionally filtered by type
+"""
+import json
+import os
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def log(tmp_path):
+    """Create a game log streaming to a temporary directory."""
+    from pokemon_legacy.engine.game_log.game_log import GameLog
+    log = GameLog(str(tmp_path), capacity=10)
+    yield log
+    log.close()
+
+
+def read_records(path):
+    """Read the records of a JSON lines file."""
+    with open(path) as file:
+        return [json.loads(line) for line in file]
+
+
+class TestGameLog:
+    """Test streaming events to the log file."""
+
+    def test_streamed(self, log):
+        """Events should be written by the writer thread as they are added."""
+        from pokemon_legacy.engine.game_log.game_log import GameEvent, GameEventType
+
+        log.add_event(GameEvent("startup complete"))
+        log.add_event(GameEvent("battle started", GameEventType.game))
+        log.flush()
+
+        records = read_records(log.log_path)
+        assert [record["name"] for record in records] == ["startup complete", "battle started"]
+        assert records[1]["type"] == "game"
+        assert " " not in os.path.basename(log.log_path) and ":" not in os.path.basename(log.log_path)
+        assert any(thread.name == "game_log" for thread in threading.enumerate())
+
+    def test_ring_buffer(self, log):
+        """Only the most recent events should be kept in memory, every event should be written."""
+        from pokemon_legacy.engine.game_log.game_log import GameEvent
+
+        for idx in range(25):
+            log.add_event(GameEvent(f"step {idx}"))
+        log.flush()
+
+        assert len(log) == 10
+        assert log.recent()[0].name == "step 15"
+        assert len(read_records(log.log_path)) == 25
+
+    def test_filter(self, tmp_path):
+        """Events of filtered out types should be dropped."""
+        from pokemon_legacy.engine.game_log.game_log import GameEvent, GameEventType, GameLog
+
+        log = GameLog(str(tmp_path), event_types=[GameEventType.error, GameEventType.game])
+        log.add_event(GameEvent("startup complete"))
+        log.add_event(GameEvent("save failed", GameEventType.error))
+        log.add_event(GameEvent("battle started", GameEventType.game))
+        log.close()
+
+        assert [event.name for event in log.recent(GameEventType.error)] == ["save failed"]
+        assert [record["name"] for record in read_records(log.log_path)] == ["save failed", "battle started"]
+
+    def test_close(self, tmp_path):
+        """Closing the log should write the remaining events and stop the writer."""
+        from pokemon_legacy.engine.game_log.game_log import GameEvent, GameLog
+
+        log = GameLog(str(tmp_path), batch_size=4)
+        for idx in range(100):
+            log.add_event(GameEvent(f"step {idx}"))
+        log.close()
+
+        assert len(read_records(log.log_path)) == 100
+        log.add_event(GameEvent("after close"))
+        assert log.recent()[-1].name == "after close"
+
+    @pytest.mark.filterwarnings("ignore:Could not write the game log")
+    @pytest.mark.skipif(not os.path.exists("/dev/full"), reason="needs /dev/full to fail writes")
+    def test_write_error(self, tmp_path, monkeypatch):
+        """A full disk should stop the writer, later events should only be kept in memory."""
+        from pokemon_legacy.engine.game_log import game_log
+        from pokemon_legacy.engine.game_log.game_log import GameEvent, GameLog
+
+        monkeypatch.setattr(game_log, "open", lambda *args, **kwargs: open("/dev/full", "a"), raising=False)
+        log = GameLog(str(tmp_path))
+        log.add_event(GameEvent("startup complete"))
+        log.flush()
+
+        assert isinstance(log.write_error, OSError)
+        for idx in range(100):
+            log.add_event(GameEvent(f"step {idx}"))
+        assert log._queue.qsize() == 0
+        assert len(log) == 101
+
+        log.close()
+
+    def test_dump(self, log, tmp_path):
+        """The ring buffer should be dumped for crash reports."""
+        from pokemon_legacy.engine.game_log.game_log import GameEvent, GameEventType
+
+        log.add_event(GameEvent("battle started", GameEventType.game))
+        log.add_event(GameEvent("crashed", GameEventType.error))
+
+        assert len(read_records(log.dump(str(tmp_path / "crash.jsonl")))) == 2
+        records = read_records(log.dump(str(tmp_path / "errors.jsonl"), GameEventType.error))
+        assert [record["name"] for record in records] == ["crashed"]
+
+    def test_memory_only(self):
+        """A log without a directory should keep events in memory only."""
+        from pokemon_legacy.engine.game_log.game_log import GameEvent, GameLog
+
+        log = GameLog(None)
+        log.add_event(GameEvent("startup complete"))
+        log.flush()
+
+        assert log.log_path is None and len(log) == 1
@@ -0,0 +1 @@
+# General engine tests
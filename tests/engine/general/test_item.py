@@ -0,0 +1,72 @@
+"""
+Tests for items and the shared item icon cache.
+
+These tests verify:
+- Items are generated from case-insensitive names
+- Icons are decoded once and shared between instances
+- Items without a sprite have no image, unless one is assigned
+- Items of the same name are interchangeable
+"""
+import pytest
+
+
+@pytest.fixture
+def icons():
+    """Empty the shared icon cache."""
+    from pokemon_legacy.engine.general.item import item_icons
+    item_icons.clear()
+    yield item_icons
+    item_icons.clear()
+
+
+class TestItems:
+    """Test item generation and icons."""
+
+    def test_generate_item(self):
+        """Items should be found regardless of case."""
+        from pokemon_legacy.engine.general.item import ItemGenerator, MedicineItem
+
+        potion = ItemGenerator.generate_item("potion")
+
+        assert isinstance(potion, MedicineItem)
+        assert potion.name == "Potion"
+        assert ItemGenerator.generate_item("not an item") is None
+
+    def test_icons_are_shared(self, icons, monkeypatch):
+        """Each icon should be loaded once, the first time it is used."""
+        import pygame as pg
+        from pokemon_legacy.engine.general.item import MedicineItem
+
+        loads = []
+        load = pg.image.load
+        monkeypatch.setattr(pg.image, "load", lambda path: loads.append(path) or load(path))
+
+        potions = [MedicineItem("Potion") for _ in range(5)]
+        assert loads == []
+
+        images = {id(potion.image) for potion in potions}
+        assert len(images) == 1
+        assert len(loads) == 1
+        assert potions[0].image is not None
+
+    def test_missing_icon(self, icons):
+        """Items without a sprite should have no image unless one is assigned."""
+        import pygame as pg
+        from pokemon_legacy.engine.data.records import ItemRecord
+        from pokemon_legacy.engine.general.item import Item
+
+        item = Item(data=ItemRecord(item_id=None, name="CANCEL"), item_type=None)
+        assert item.image is None
+
+        image = pg.Surface((8, 8))
+        item.image = image
+        assert item.image is image
+
+    def test_item_equality(self):
+        """Items with the same name should compare equal."""
+        from pokemon_legacy.engine.general.item import MedicineItem, Pokeball
+
+        assert MedicineItem("Potion") == MedicineItem("Potion")
+        assert len({MedicineItem("Potion"), MedicineItem("Potion")}) == 1
+        assert MedicineItem("Potion") != MedicineItem("Antidote")
+        assert Pokeball("Poke Ball") != MedicineItem("Potion")
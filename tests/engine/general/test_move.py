@@ -0,0 +1,87 @@
+"""
+Tests for move templates.
+
+These tests verify:
+- Moves of the same name share a single template
+- Move instances only carry their template and remaining PP
+- Effect specs are parsed into typed effect records
+- Copies and pickles keep the shared template and the current PP
+"""
+import copy
+import pickle
+import random
+
+import pytest
+
+
+@pytest.fixture
+def move_module():
+    """Import the move module."""
+    from pokemon_legacy.engine.general import Move
+    return Move
+
+
+class TestMoveTemplates:
+    """Test the move template flyweights."""
+
+    def test_template_is_shared(self, move_module):
+        """Every instance of a move should reference the same template."""
+        tackle = move_module.getMove("Tackle")
+        other = move_module.getMove("Tackle", 3)
+
+        assert tackle.template is other.template
+        assert tackle.PP == tackle.maxPP == 35
+        assert other.PP == 3
+
+    def test_instance_state(self, move_module):
+        """Move instances should only hold the template and PP."""
+        move = move_module.getMove("Tackle")
+
+        assert not hasattr(move, "__dict__")
+        with pytest.raises(AttributeError):
+            move.power = 100
+
+        move.PP -= 1
+        assert move.PP == 34
+        assert move_module.getMove("Tackle").PP == 35
+
+    def test_template_fields(self, move_module):
+        """Templates should expose the move data."""
+        move = move_module.getMove("Growl")
+
+        assert move.type == "Normal"
+        assert move.category == "Status"
+        assert move.power is None
+        assert move.get_json() == {"name": "Growl", "pp": move.maxPP}
+
+    def test_stat_effect(self, move_module):
+        """Stat effects should be parsed into typed fields."""
+        effect = move_module.getMove("Growl").effect
+
+        assert effect.effect_type is move_module.EffectType.stat
+        assert (effect.chance, effect.stages, effect.stat, effect.target, effect.direction) == \
+            (100, 1, "Attack", "Foe", "Lower")
+
+        random.seed(0)
+        assert effect.getEffect() == (None, [1, "Attack", "Foe", "Lower"], 1, 0)
+
+    def test_effect_types(self, move_module):
+        """Condition, multiple hit and heal effects should be parsed from their specs."""
+        from_spec = move_module.MoveEffect.from_spec
+
+        burn = from_spec(("Condition", "Burn", "10"))
+        assert (burn.condition, burn.chance) == ("Burn", 10)
+
+        multiple = from_spec(("Multiple", "2", "5"))
+        assert 2 <= multiple.getEffect()[2] <= 5
+
+        assert from_spec(("Heal", "50")).getEffect() == (None, None, 1, 50)
+
+    def test_copy_and_pickle(self, move_module):
+        """Copies should share the template and keep the current PP."""
+        move = move_module.getMove("Tackle", 12)
+
+        for clone in (copy.deepcopy(move), pickle.loads(pickle.dumps(move))):
+            assert clone is not move
+            assert clone.template is move.template
+            assert clone.PP == 12
@@ -0,0 +1,109 @@
+"""
+Tests for the profiler.
+
+These tests verify:
+- cpu mode writes a pstats file and collapsed stacks sampled from the profiled code
+- Only the configured regions are profiled
+- alloc mode writes the memory allocated in the profiled code by stack
+- An unconfigured profiler does nothing
+"""
+import pstats
+import time
+
+import pytest
+
+
+@pytest.fixture
+def profiler():
+    """Create an unconfigured profiler."""
+    from pokemon_legacy.engine.general.profiler import Profiler
+    profiler = Profiler()
+    yield profiler
+    profiler.stop()
+
+
+def busy(seconds):
+    """Keep the CPU busy."""
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(range(100))
+    return total
+
+
+def idle(seconds):
+    """Wait without using the CPU."""
+    time.sleep(seconds)
+
+
+def read_collapsed(path):
+    """Read a collapsed stack file into a dict of stack to count."""
+    with open(path) as file:
+        return {stack: int(count) for stack, count in (line.rsplit(" ", 1) for line in file)}
+
+
+class TestProfiler:
+    """Test profiling the whole run and regions."""
+
+    def test_cpu(self, profiler, tmp_path):
+        """The whole run should be written as pstats and collapsed stacks."""
+        profiler.configure("cpu", out=str(tmp_path / "profile"), interval=0.001)
+        profiler.start()
+        busy(0.1)
+        pstats_path, collapsed_path = profiler.stop()
+
+        functions = {name for _, _, name in pstats.Stats(pstats_path).stats}
+        assert "busy" in functions
+
+        stacks = read_collapsed(collapsed_path)
+        assert sum(count for stack, count in stacks.items() if "busy (test_profiler.py" in stack) > 10
+        assert all(";" in stack for stack in stacks)
+
+    def test_regions(self, profiler, tmp_path):
+        """Only the configured regions should be profiled."""
+        profiler.configure("cpu", out=str(tmp_path / "profile"), regions=["battle"], interval=0.001)
+        profiler.start()
+
+        idle(0.05)
+        with profiler.region("map_transition"):
+            idle(0.05)
+        with profiler.region("battle"):
+            with profiler.region("battle"):
+                busy(0.05)
+        with profiler.region("battle", when=False):
+            idle(0.05)
+        pstats_path, collapsed_path = profiler.stop()
+
+        functions = {name for _, _, name in pstats.Stats(pstats_path).stats}
+        assert "busy" in functions and "idle" not in functions
+        assert not any("idle (" in stack for stack in read_collapsed(collapsed_path))
+
+    def test_alloc(self, profiler, tmp_path):
+        """Allocations kept from the profiled code should be written by stack."""
+        profiler.configure("alloc", out=str(tmp_path / "profile"), regions=["startup"])
+        profiler.start()
+
+        with profiler.region("startup"):
+            kept = [bytearray(1024) for _ in range(1000)]
+        collapsed_path, summary_path = profiler.stop()
+
+        stacks = read_collapsed(collapsed_path)
+        assert sum(stacks.values()) >= 1000 * 1024
+        assert any("test_profiler.py" in stack for stack in stacks)
+        with open(summary_path) as file:
+            assert "KiB allocated" in file.readline()
+        assert len(kept) == 1000
+
+    def test_unconfigured(self, profiler, tmp_path):
+        """An unconfigured profiler should not profile or write anything."""
+        profiler.start()
+        with profiler.region("battle"):
+            busy(0.01)
+
+        assert profiler.stop() == []
+        assert not list(tmp_path.iterdir())
+
+    def test_unknown_mode(self, profiler):
+        """Unknown modes should be rejected."""
+        with pytest.raises(ValueError):
+            profiler.configure("gpu")
@@ -0,0 +1,73 @@
+"""
+Tests for route encounter tables.
+
+These tests verify:
+- Routes are compiled once and shared
+- The encounter table depends on the time of day
+- Encounters honour the rarity weights and level ranges
+- Batch sampling returns species and levels from the table
+"""
+import random
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+MORNING = datetime(2024, 1, 1, 9)
+NIGHT = datetime(2024, 1, 1, 22)
+
+
+@pytest.fixture
+def route():
+    """Compile Route 202."""
+    from pokemon_legacy.engine.general.Route import Route
+    return Route.get("Route 202")
+
+
+class TestRoute:
+    """Test the compiled encounter tables."""
+
+    def test_routes_are_shared(self, route):
+        """Routes should only be compiled once."""
+        from pokemon_legacy.engine.general.Route import Route
+        assert Route.get("Route 202") is route
+
+    def test_time_of_day(self, route):
+        """Kricketot only appears in the morning and at night on Route 202."""
+        assert "Kricketot" in route.get_table(MORNING).pokemon
+        assert "Kricketot" not in route.get_table(datetime(2024, 1, 1, 14)).pokemon
+        assert "Kricketot" in route.get_table(NIGHT).pokemon
+
+    def test_rarity_weights(self, route):
+        """Common species should be encountered more often than uncommon ones."""
+        from pokemon_legacy.engine.general.Route import Rarity
+
+        table = route.get_table(MORNING)
+        assert table.rarities[-1] is Rarity.uncommon
+        assert table.probability("Starly") == pytest.approx(20 / 70)
+        assert table.probability("Kricketot") == pytest.approx(10 / 70)
+
+        rng = random.Random(0)
+        counts = {name: 0 for name in table.pokemon}
+        for _ in range(7000):
+            name, level = route.encounter(MORNING, rng)
+            counts[name] += 1
+
+        assert counts["Starly"] > 1.5 * counts["Kricketot"]
+
+    def test_levels_are_inclusive(self, route):
+        """Levels should cover the full range, including the maximum."""
+        rng = random.Random(0)
+        levels = {level for name, level in (route.encounter(MORNING, rng) for _ in range(500)) if name == "Bidoof"}
+
+        assert levels == {2, 3, 4}
+
+    def test_sample(self, route):
+        """Batch samples should match the table."""
+        table = route.get_table(NIGHT)
+        names, levels = route.sample(NIGHT, 1000, np.random.default_rng(0))
+
+        assert len(names) == len(levels) == 1000
+        assert set(names) == set(table.pokemon)
+        for name, (min_level, max_level) in zip(table.pokemon, table.levels):
+            assert np.all((levels[names == name] >= min_level) & (levels[names == name] <= max_level))
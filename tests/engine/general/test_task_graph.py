@@ -0,0 +1,109 @@
+"""
+Tests for the startup task graph.
+
+These tests verify:
+- Tasks run after their dependencies, background tasks on worker threads and the rest on the main thread
+- Independent background tasks run in parallel
+- Progress is reported on the main thread and reaches 1
+- Unknown dependencies, cycles and task errors are raised
+- The critical path follows the slowest chain of dependencies
+"""
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def graph():
+    """Create an empty task graph."""
+    from pokemon_legacy.engine.general.task_graph import TaskGraph
+    return TaskGraph(max_workers=4)
+
+
+class TestTaskGraph:
+    """Test the task graph."""
+
+    def test_dependency_order(self, graph):
+        """Tasks should only start once their dependencies have finished."""
+        order = []
+        main_thread = threading.current_thread().name
+
+        def task(name):
+            def run():
+                order.append(name)
+                return threading.current_thread().name
+            return run
+
+        graph.add("data", task("data"), background=True)
+        graph.add("sheets", task("sheets"), background=True)
+        graph.add("display", task("display"), deps=["data", "sheets"])
+        graph.add("menus", task("menus"), deps=["display"])
+
+        results = graph.run()
+
+        assert order.index("display") > max(order.index("data"), order.index("sheets"))
+        assert order[-1] == "menus"
+        assert results["display"] == results["menus"] == main_thread
+        assert results["data"] != main_thread
+
+    def test_parallel_background_tasks(self, graph):
+        """Independent background tasks should overlap."""
+        for name in ("a", "b", "c"):
+            graph.add(name, lambda: time.sleep(0.1), background=True)
+
+        graph.run()
+
+        assert graph.wall_time < 0.25
+
+    def test_progress(self, graph):
+        """Progress should be reported on the main thread, weighted by task."""
+        updates = []
+        graph.add("data", lambda: None, background=True, weight=3)
+        graph.add("display", lambda: None, deps=["data"])
+
+        graph.run(on_progress=lambda progress, task: updates.append(
+            (progress, task.name, threading.current_thread() is threading.main_thread())
+        ))
+
+        assert updates == [(0.75, "data", True), (1.0, "display", True)]
+
+    def test_invalid_graphs(self, graph):
+        """Unknown dependencies and cycles should be rejected before running."""
+        graph.add("a", lambda: None, deps=["b"])
+        with pytest.raises(ValueError):
+            graph.run()
+
+        graph.add("b", lambda: None, deps=["a"])
+        with pytest.raises(ValueError):
+            graph.run()
+
+        with pytest.raises(ValueError):
+            graph.add("a", lambda: None)
+
+    def test_task_error(self, graph):
+        """An error in a background task should be raised by run."""
+        ran = []
+
+        def fail():
+            raise OSError("missing file")
+
+        graph.add("load", fail, background=True)
+        graph.add("display", lambda: ran.append(True), deps=["load"])
+
+        with pytest.raises(OSError):
+            graph.run()
+        assert ran == []
+
+    def test_critical_path(self, graph):
+        """The critical path should follow the slowest dependency chain."""
+        graph.add("slow", lambda: time.sleep(0.08), background=True)
+        graph.add("fast", lambda: time.sleep(0.01), background=True)
+        graph.add("display", lambda: time.sleep(0.01), deps=["slow", "fast"])
+
+        graph.run()
+        duration, path = graph.critical_path()
+
+        assert path == ["slow", "display"]
+        assert 0.09 <= duration <= graph.wall_time
+        assert "critical path" in graph.report()
@@ -0,0 +1,123 @@
+"""
+Tests for the frame telemetry.
+
+These tests verify:
+- Timers record each call and summarise into rolling percentiles in milliseconds
+- Counters are totalled per frame, and frames record the time between them
+- Suspended blocks, e.g. waits on input, are not recorded as frame time
+- Only the most recent samples are kept
+- Disabled telemetry records nothing and adds next to no overhead
+- The summary is exported as JSON lines and the overlay is drawn
+"""
+import json
+import time
+
+import pygame as pg
+import pytest
+
+
+@pytest.fixture
+def telemetry():
+    """Create enabled telemetry."""
+    from pokemon_legacy.engine.general.telemetry import Telemetry
+    return Telemetry(enabled=True, window=100)
+
+
+class TestTelemetry:
+    """Test recording and reporting telemetry."""
+
+    def test_timers(self, telemetry):
+        """Timed functions and blocks should be recorded."""
+        @telemetry.timed("sleep")
+        def sleep(seconds):
+            time.sleep(seconds)
+            return seconds
+
+        assert sleep(0.01) == 0.01
+        with telemetry.timer("sleep"):
+            time.sleep(0.02)
+
+        stats = telemetry.summary()["sleep"]
+        assert stats["kind"] == "timer" and stats["count"] == 2
+        assert 10 <= stats["p50"] <= stats["p95"] <= stats["p99"] <= stats["max"]
+        assert stats["max"] >= 20
+
+    def test_counters_and_frames(self, telemetry):
+        """Counters should be totalled per frame."""
+        for loads in (0, 2, 3):
+            telemetry.count("assets.load", loads)
+            telemetry.frame()
+
+        summary = telemetry.summary()
+        assert summary["assets.load"]["count"] == 3
+        assert summary["assets.load"]["max"] == 3
+        assert summary["frame"]["count"] == 2
+
+    def test_suspend(self, telemetry):
+        """A suspended block should not be recorded as one long frame."""
+        telemetry.frame()
+        with telemetry.suspend():
+            time.sleep(0.05)
+            telemetry.frame()
+        telemetry.frame()
+
+        stats = telemetry.summary()["frame"]
+        assert stats["count"] == 1
+        assert stats["max"] < 50
+
+    def test_window(self):
+        """Percentiles should only cover the most recent samples."""
+        from pokemon_legacy.engine.general.telemetry import RollingStats
+
+        stats = RollingStats(window=10)
+        for value in range(100):
+            stats.add(value)
+
+        assert len(stats) == 10
+        assert stats.summary()["count"] == 100
+        assert stats.summary()["p50"] == pytest.approx(94.5)
+
+    def test_disabled(self):
+        """Disabled telemetry should record nothing and cost next to nothing."""
+        from pokemon_legacy.engine.general.telemetry import Telemetry
+
+        telemetry = Telemetry(enabled=False)
+
+        def plain(x):
+            return x
+
+        timed = telemetry.timed("plain")(plain)
+        with telemetry.timer("block"):
+            telemetry.count("counter")
+        telemetry.frame()
+        assert telemetry.summary() == {}
+
+        calls = 100_000
+        start = time.perf_counter()
+        for idx in range(calls):
+            timed(idx)
+        overhead = (time.perf_counter() - start) / calls
+        assert overhead < 2e-6
+
+    def test_export(self, telemetry, tmp_path):
+        """The summary should be appended to a JSON lines file."""
+        telemetry.record("map.render", 0.004)
+        telemetry.count("assets.load")
+        telemetry.frame()
+
+        path = telemetry.export(str(tmp_path / "telemetry.jsonl"))
+        with open(path) as file:
+            records = {record["name"]: record for record in map(json.loads, file)}
+
+        assert records["map.render"]["p99"] == pytest.approx(4.0)
+        assert records["assets.load"]["kind"] == "counter"
+
+    def test_overlay(self, telemetry):
+        """The overlay should be drawn in the corner of the surface."""
+        pg.init()
+        surface = pg.Surface((256, 192))
+        surface.fill((255, 255, 255))
+        telemetry.record("frame", 0.016)
+
+        telemetry.draw_overlay(surface)
+        assert surface.get_at((4, 4)) != pg.Color(255, 255, 255)
@@ -0,0 +1 @@
+# Graphics tests
@@ -0,0 +1,100 @@
+"""
+Tests for the lazily loaded asset service.
+
+These tests verify:
+- Assets are not loaded when they are registered
+- Each asset is loaded once and shared between users
+- Instances can override a lazy class attribute
+- Unknown assets and conflicting registrations raise errors
+"""
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def service():
+    """Create an empty asset service."""
+    from pokemon_legacy.engine.graphics.assets import AssetService
+    return AssetService()
+
+
+class TestAssetService:
+    """Test the asset service."""
+
+    def test_lazy_load(self, service):
+        """Assets should be loaded on first use only."""
+        calls = []
+        service.register("sheet", lambda name: calls.append(name) or [name], "sheet.png")
+
+        assert "sheet" in service
+        assert not service.is_loaded("sheet")
+        assert calls == []
+
+        sheet = service.get("sheet")
+        assert service.get("sheet") is sheet
+        assert calls == ["sheet.png"]
+        assert service.loaded() == ["sheet"]
+
+        service.unload("sheet")
+        assert service.get("sheet") is not sheet
+        assert len(calls) == 2
+
+    def test_concurrent_load(self, service):
+        """Concurrent requests should share a single load."""
+        calls = []
+        started = threading.Event()
+
+        def load():
+            calls.append(1)
+            started.wait(0.1)
+            return object()
+
+        service.register("slow", load)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(service.get("slow"))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        started.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len({id(result) for result in results}) == 1
+
+    def test_errors(self, service):
+        """Unknown names and conflicting loaders should raise."""
+        with pytest.raises(KeyError):
+            service.get("missing")
+
+        service.register("json", dict)
+        service.register("json", dict)
+        with pytest.raises(ValueError):
+            service.register("json", list)
+
+
+class TestLazyAsset:
+    """Test lazy class attributes."""
+
+    def test_class_attribute(self):
+        """Lazy attributes should load the shared asset and allow instance overrides."""
+        from pokemon_legacy.engine.graphics.assets import LazyAsset, assets
+
+        class Holder:
+            image = LazyAsset("tests/holder_image", lambda: ["image"])
+
+        assert not assets.is_loaded("tests/holder_image")
+        assert Holder.image is Holder().image is assets.get("tests/holder_image")
+
+        holder = Holder()
+        holder.image = ["scaled"]
+        assert holder.image == ["scaled"]
+        assert Holder.image == ["image"]
+
+    def test_poketech_images(self):
+        """The Poketech images should load on first access."""
+        import pygame as pg
+        from pokemon_legacy.engine.poketech.poketech import TeamDisplay
+
+        assert isinstance(TeamDisplay.hp_outline, pg.Surface)
+        assert TeamDisplay.hp_outline is TeamDisplay.hp_outline
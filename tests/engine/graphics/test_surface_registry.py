@@ -0,0 +1,107 @@
+"""
+Tests for the surface registry.
+
+These tests verify:
+- Tracked surfaces are recorded with their owner, subsystem, size and bytes, and dropped when freed
+- Owners are tagged by class and grouped into subsystems by module
+- Subsurfaces are counted with no bytes of their own
+- Screens and fonts register the surfaces they create
+- The report is grouped by subsystem, largest first, and subsystems over budget are found
+"""
+import gc
+import json
+
+import pygame as pg
+import pytest
+
+
+@pytest.fixture
+def registry():
+    """Create an empty surface registry."""
+    from pokemon_legacy.engine.graphics.surface_registry import SurfaceRegistry
+    return SurfaceRegistry()
+
+
+class TestSurfaceRegistry:
+    """Test tracking and reporting surfaces."""
+
+    def test_track(self, registry):
+        """Tracked surfaces should be recorded until they are freed."""
+        surface = registry.track(pg.Surface((10, 20), pg.SRCALPHA), "map", "maps")
+
+        assert surface in registry
+        record, = registry.records()
+        assert (record.owner, record.subsystem, record.size, record.nbytes) == ("map", "maps", (10, 20), 800)
+
+        del surface
+        gc.collect()
+        assert len(registry) == 0 and registry.records() == []
+
+    def test_owner_object(self, registry):
+        """Owners should be tagged by class, in the subsystem of their module."""
+        from pokemon_legacy.engine.graphics.surface_registry import subsystem_of
+
+        class Owner:
+            pass
+
+        Owner.__module__ = "pokemon_legacy.engine.battle.battle"
+        surface = registry.track(pg.Surface((4, 4)), Owner())
+        registry.track(surface, "again")
+
+        record, = registry.records()
+        assert (record.owner, record.subsystem) == ("Owner", "battle")
+        assert subsystem_of("pokemon_legacy.displays.menu.menu_display_team") == "menus"
+        assert subsystem_of("pokemon_legacy.engine.game_world.tiled_map") == "maps"
+        assert subsystem_of("somewhere.else") == "other"
+
+    def test_subsurfaces(self, registry):
+        """Subsurfaces should share the bytes of their parent."""
+        strip = registry.track(pg.Surface((30, 10), pg.SRCALPHA), "strip", "sprites")
+        frames = registry.track_all([strip.subsurface((x, 0, 10, 10)) for x in (0, 10, 20)], "frame", "sprites")
+
+        assert len(registry) == 4
+        assert registry.nbytes == 30 * 10 * 4
+        assert len(frames) == 3
+
+    def test_screens_and_fonts(self):
+        """Screens and fonts should register their surfaces."""
+        from pokemon_legacy.engine.graphics.font.font import Font
+        from pokemon_legacy.engine.graphics.screen_V2 import Screen
+        from pokemon_legacy.engine.graphics.surface_registry import surface_registry
+
+        pg.init()
+        screen = Screen((64, 32))
+        font = Font(1)
+
+        assert screen.base_surface in surface_registry and screen.sprite_surface in surface_registry
+        screen.refresh()
+        assert screen.surface in surface_registry
+        assert all(letter in surface_registry for letter in font.letters.values())
+        assert surface_registry.by_subsystem()["fonts"]["owners"]["Font"]["count"] >= len(font.letters)
+
+    def test_report(self, registry, tmp_path):
+        """The report should group surfaces by subsystem, largest first."""
+        from pokemon_legacy.engine.graphics.surface_registry import format_report
+
+        surfaces = [
+            registry.track(pg.Surface((100, 100), pg.SRCALPHA), "TiledMap2", "maps"),
+            registry.track(pg.Surface((100, 100), pg.SRCALPHA), "TiledMap2", "maps"),
+            registry.track(pg.Surface((10, 10), pg.SRCALPHA), "Font", "fonts"),
+        ]
+
+        usage = registry.by_subsystem()
+        assert list(usage) == ["maps", "fonts"]
+        assert usage["maps"] == {"count": 2, "bytes": 80000, "owners": {"TiledMap2": {"count": 2, "bytes": 80000}}}
+        assert registry.over_budget({"maps": 50000, "fonts": 50000}) == {"maps": 80000}
+
+        with open(registry.write(str(tmp_path / "surfaces.json"))) as file:
+            assert json.load(file) == usage
+        assert "TiledMap2" in format_report(usage).splitlines()[2]
+        assert len(surfaces) == 3
+
+    def test_disabled(self, registry):
+        """A disabled registry should not track surfaces."""
+        registry.enabled = False
+        surface = registry.track(pg.Surface((4, 4)), "map", "maps")
+
+        assert surface is not None and len(registry) == 0
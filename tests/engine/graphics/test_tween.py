@@ -0,0 +1,66 @@
+"""
+Tests for time-based tweens and the cached health/exp bar images.
+
+These tests verify:
+- Tweens interpolate on elapsed time and always finish on the end value
+- Zero length tweens complete immediately
+- Bar images are loaded once and shared between calls
+"""
+import time
+
+import pytest
+
+
+@pytest.fixture
+def tween_cls():
+    """Import the Tween class."""
+    from pokemon_legacy.engine.graphics.tween import Tween
+    return Tween
+
+
+class TestTween:
+    """Test the Tween helper."""
+
+    def test_value_follows_elapsed_time(self, tween_cls):
+        """The value should move from start towards end as time passes."""
+        tween = tween_cls(100, 0, 1000)
+        tween.start_time -= 0.5
+
+        assert tween.value == pytest.approx(50, abs=2)
+        assert not tween.done
+
+    def test_iteration_ends_on_final_value(self, tween_cls):
+        """Iterating should stop once the duration elapses, yielding the end value last."""
+        tween = tween_cls(0, 10, 20)
+        start = time.monotonic()
+        values = list(tween)
+
+        assert values[-1] == 10
+        assert all(a <= b for a, b in zip(values, values[1:]))
+        assert time.monotonic() - start >= 0.02
+
+    def test_zero_duration(self, tween_cls):
+        """A zero length tween is complete straight away."""
+        tween = tween_cls(5, 1, 0)
+
+        assert tween.done
+        assert list(tween) == [1]
+
+
+class TestBarSurfaces:
+    """Test the cached display bar images."""
+
+    def test_bar_surfaces_are_shared(self):
+        """The same colour should reuse the loaded image."""
+        from pokemon_legacy.engine.general.utils import get_bar_surface
+
+        assert get_bar_surface("HP", 0.9) is get_bar_surface("HP", 0.6)
+        assert get_bar_surface("HP", 0.9) is not get_bar_surface("HP", 0.1)
+        assert get_bar_surface("XP", 0.5) is get_bar_surface("exp", 0.1)
+
+    def test_create_display_bar_width(self):
+        """Bars are truncated relative to the maximum value."""
+        from pokemon_legacy.engine.general.utils import create_display_bar
+
+        assert create_display_bar(10, 20, "HP").get_width() == 24
+        assert create_display_bar(16, 16, "XP").get_width() == 64
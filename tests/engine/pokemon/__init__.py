@@ -0,0 +1 @@
+# Pokemon tests
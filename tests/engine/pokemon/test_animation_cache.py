@@ -0,0 +1,183 @@
+"""
+Tests for the species animation cache.
+
+These tests verify:
+- Decoded gif frames match the legacy crop and scale pipeline
+- Frame strips round trip the frames, store repeated frames once and are named by content
+- The loader decodes in the background, once per species, and skips species without animations
+- Failed decodes are retried, and generated Pokémon fall back to their still sprites
+- The animation LRU evicts the least recently used species once over its memory cap
+- Generated Pokémon share the cached animations instead of decoding them again
+"""
+import shutil
+
+import numpy as np
+import pygame as pg
+import pytest
+
+GIF = "assets/sprites/Pokemon/Gen IV/Bidoof/Front_Male.gif"
+
+
+@pytest.fixture
+def loader(tmp_path):
+    """Create an animation loader writing to a temporary directory."""
+    from pokemon_legacy.engine.pokemon.animation_cache import AnimationLoader
+    loader = AnimationLoader(strip_dir=str(tmp_path))
+    yield loader
+    loader.shutdown()
+
+
+def make_animations(*sizes):
+    """Create animations with one frame of each size."""
+    from pokemon_legacy.engine.general.Animations import Animations
+    return Animations(front=[pg.Surface(size, pg.SRCALPHA) for size in sizes], small=[])
+
+
+class TestFrameStrip:
+    """Test decoding gifs to frame strips."""
+
+    def test_decode_matches_legacy(self):
+        """Frames should be cropped and scaled exactly as the ImageEditor did."""
+        from PIL import Image
+        from pokemon_legacy.engine.general.Animations import decode_gif
+        from pokemon_legacy.engine.general.image_editor import ImageEditor
+
+        editor = ImageEditor()
+        frames = decode_gif(GIF)
+        with Image.open(GIF) as gif:
+            assert len(frames) == gif.n_frames
+            for idx, frame in enumerate(frames):
+                gif.seek(idx)
+                editor.loadData(np.asarray(gif.convert("RGBA")))
+                editor.crop_transparent_borders(overwrite=True)
+                editor.scaleImage((2, 2), overwrite=True)
+                assert np.array_equal(frame, editor.pixelData)
+
+    def test_round_trip(self, tmp_path):
+        """Loaded frames should match the decoded frames, with repeated frames stored once."""
+        from pokemon_legacy.engine.general.Animations import decode_gif
+        from pokemon_legacy.engine.pokemon.animation_cache import FrameStrip
+
+        strip = FrameStrip(GIF, strip_dir=str(tmp_path)).prepare()
+        frames = strip.load()
+        decoded = decode_gif(GIF)
+
+        assert len(frames) == len(decoded)
+        for surface, frame in zip(frames, decoded):
+            pixels = np.dstack([pg.surfarray.pixels3d(surface), pg.surfarray.pixels_alpha(surface)])
+            assert np.array_equal(pixels.transpose(1, 0, 2), frame)
+
+        distinct = {id(frame) for frame in frames}
+        assert len(distinct) < len(frames)
+
+    def test_named_by_content(self, tmp_path):
+        """A copy of a gif should reuse its strip, so nothing is decoded twice."""
+        from pokemon_legacy.engine.pokemon.animation_cache import FrameStrip
+
+        copy = tmp_path / "copy.gif"
+        shutil.copy(GIF, copy)
+        strip = FrameStrip(GIF, strip_dir=str(tmp_path)).prepare()
+
+        assert FrameStrip(str(copy), strip_dir=str(tmp_path)).exists()
+        assert FrameStrip(str(copy), strip_dir=str(tmp_path)).image_path == strip.image_path
+
+
+class TestAnimationLoader:
+    """Test decoding species on the worker pool."""
+
+    def test_prefetch(self, loader):
+        """Prefetched species should be decoded to disk in the background."""
+        futures = loader.prefetch(["Bidoof", "Starly"])
+        strips = [future.result(timeout=30) for future in futures]
+
+        assert all(strip["front"].exists() and strip["small"].exists() for strip in strips)
+        assert loader.request("Bidoof") is futures[0]
+
+    def test_load(self, loader):
+        """Loading a species should build its surfaces from the strips."""
+        animations = loader.load("Bidoof")
+
+        assert animations.front and animations.small
+        assert all(isinstance(frame, pg.Surface) for frame in animations.front)
+
+    def test_species_without_animations(self, loader):
+        """Species with only still sprites should have no animations."""
+        assert loader.load("Empoleon") is None
+
+    def test_failed_decode_retried(self, tmp_path):
+        """A failed decode should not be cached."""
+        from pokemon_legacy.engine.pokemon.animation_cache import AnimationLoader
+        from pokemon_legacy.engine.pokemon.pokemon_generator import PokemonGenerator
+
+        class FailingOnce(AnimationLoader):
+            failed = False
+
+            def _prepare(self, name):
+                if not self.failed:
+                    self.failed = True
+                    raise OSError("interrupted write")
+                return super()._prepare(name)
+
+        loader = FailingOnce(strip_dir=str(tmp_path))
+        try:
+            generator = PokemonGenerator(loader=loader)
+            with pytest.warns(UserWarning):
+                pokemon = generator.generate_pokemon("Bidoof", level=3)
+            assert pokemon.animation is None
+
+            assert generator.generate_pokemon("Bidoof", level=3).animation
+        finally:
+            loader.shutdown()
+
+
+class TestAnimationLRU:
+    """Test the memory cap of the loaded animations."""
+
+    def test_evicts_least_recently_used(self):
+        """Adding over the cap should evict the oldest unused species."""
+        from pokemon_legacy.engine.pokemon.animation_cache import AnimationLRU
+
+        lru = AnimationLRU(max_bytes=2 * 10 * 10 * 4)
+        lru["Bidoof"] = make_animations((10, 10))
+        lru["Starly"] = make_animations((10, 10))
+        assert lru.get("Bidoof") is not None
+
+        lru["Shinx"] = make_animations((10, 10))
+        assert "Starly" not in lru
+        assert "Bidoof" in lru and "Shinx" in lru
+        assert lru.nbytes == 2 * 10 * 10 * 4
+
+    def test_keeps_newest(self):
+        """An animation larger than the cap should still be held until replaced."""
+        from pokemon_legacy.engine.pokemon.animation_cache import AnimationLRU
+
+        lru = AnimationLRU(max_bytes=100)
+        lru["Bidoof"] = make_animations((10, 10))
+        lru["Starly"] = make_animations((20, 20))
+
+        assert list(lru._entries) == ["Starly"]
+        assert lru.nbytes == 20 * 20 * 4
+
+    def test_subsurfaces_counted_once(self):
+        """Frames cut from one strip should only count the strip."""
+        from pokemon_legacy.engine.general.Animations import Animations
+
+        strip = pg.Surface((30, 10), pg.SRCALPHA)
+        frames = [strip.subsurface((x, 0, 10, 10)) for x in (0, 10, 20)]
+        assert Animations(front=frames + frames, small=[]).nbytes == 30 * 10 * 4
+
+
+class TestPokemonGenerator:
+    """Test generating Pokémon with cached animations."""
+
+    def test_shares_animations(self, loader):
+        """Pokémon of the same species should share one set of frames."""
+        from pokemon_legacy.engine.pokemon.pokemon_generator import PokemonGenerator
+
+        generator = PokemonGenerator(loader=loader)
+        first = generator.generate_pokemon("Bidoof", level=3)
+        second = generator.generate_pokemon("Bidoof", level=4)
+
+        assert first.animation is second.animation
+        assert len(generator.animations) == 1
+        assert generator.animations.nbytes > 0
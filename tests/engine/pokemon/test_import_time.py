@@ -0,0 +1,54 @@
+"""
+Import time budget for the Pokémon module.
+
+These tests verify:
+- Importing pokemon_legacy.engine.pokemon.pokemon stays within its time budget, measured with -X importtime
+- The import does not pull in pandas, load any sprite sheets or read the game data
+"""
+import os
+import subprocess
+import sys
+
+SRC_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "..", "src")
+MODULE = "pokemon_legacy.engine.pokemon.pokemon"
+
+# cumulative import time in microseconds, including pygame, numpy and cv2
+IMPORT_BUDGET_US = 600_000
+
+CHECK_STATE = (
+    f"import {MODULE}; "
+    "from pokemon_legacy.engine.graphics.assets import assets; "
+    "from pokemon_legacy.engine.data.bundle import game_data; "
+    "print(assets.loaded(), game_data._tables is None)"
+)
+
+
+def run_import() -> tuple[str, dict[str, int]]:
+    """ Import the module in a fresh interpreter, returning its output and the cumulative import times """
+    env = dict(os.environ, PYTHONPATH=SRC_PATH, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHECK_STATE],
+        capture_output=True, text=True, env=env, check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = max(times.get(name.strip(), 0), int(cumulative))
+
+    return result.stdout.strip(), times
+
+
+class TestImportTime:
+    """Test the cost of importing the Pokémon module."""
+
+    def test_import_budget(self):
+        """The import should stay within budget without loading assets or data."""
+        output, times = run_import()
+
+        assert output == "[] True"
+        assert "pandas" not in times
+        assert times[MODULE] < IMPORT_BUDGET_US, f"importing {MODULE} took {times[MODULE] / 1000:.0f} ms"
@@ -0,0 +1,92 @@
+"""
+Tests for lazily loading Pokémon images.
+
+These tests verify:
+- Lazy Pokémon are created without images and load them when first drawn
+- Each of image, sprite and smallImage loads the surfaces
+- Released images are loaded again on next use
+- Teams and unpickled Pokémon do not load images up front
+- Team specs only create Pokémon when built, without modifying their data
+"""
+import pickle
+
+import pytest
+
+
+@pytest.fixture
+def lazy_pokemon():
+    """Create a Pokémon without loading its images."""
+    from pokemon_legacy.engine.pokemon.pokemon import Pokemon
+    return Pokemon("Piplup", level=5, lazy_load=True)
+
+
+class TestLazyPokemon:
+    """Test loading Pokémon images on first use."""
+
+    def test_created_without_images(self, lazy_pokemon):
+        """A lazy Pokémon should hold no surfaces until it is drawn."""
+        assert not lazy_pokemon.images_loaded
+        assert lazy_pokemon._sprite is None
+        assert lazy_pokemon._small_image is None
+
+        # data is available without loading images
+        assert lazy_pokemon.stats.health > 0
+        assert lazy_pokemon.moves
+
+    @pytest.mark.parametrize("attribute", ["image", "sprite", "smallImage"])
+    def test_loaded_on_access(self, lazy_pokemon, attribute):
+        """Drawing the Pokémon should load its images."""
+        assert getattr(lazy_pokemon, attribute) is not None
+        assert lazy_pokemon.images_loaded
+        assert lazy_pokemon._sprite is not None
+
+    def test_release_images(self, lazy_pokemon):
+        """Released images should be loaded again when needed."""
+        image = lazy_pokemon.image
+        lazy_pokemon.release_images()
+        assert not lazy_pokemon.images_loaded
+
+        assert lazy_pokemon.image is image
+        assert lazy_pokemon.images_loaded
+
+    def test_eager_by_default(self):
+        """Pokémon should still load their images up front unless asked not to."""
+        from pokemon_legacy.engine.pokemon.pokemon import Pokemon
+        assert Pokemon("Piplup", level=5).images_loaded
+
+
+class TestLazyCollections:
+    """Test building teams and loading saved Pokémon without images."""
+
+    def test_team(self):
+        """A lazy team should not load any images."""
+        from pokemon_legacy.engine.pokemon.team import Team
+
+        team = Team([{"name": "Piplup", "level": 5}, {"name": "Starly", "level": 3}], lazy_load=True)
+        assert len(team) == 2
+        assert not any(pk.images_loaded for pk in team)
+
+    def test_unpickle(self, lazy_pokemon):
+        """Unpickled Pokémon should load their images when drawn, not when loaded."""
+        lazy_pokemon.image
+        loaded = pickle.loads(pickle.dumps(lazy_pokemon))
+
+        assert not loaded.images_loaded
+        assert loaded.image.get_size() == lazy_pokemon.displayImage.get_size()
+
+    def test_team_spec(self):
+        """A team spec should hold data only and build a fresh lazy team each time."""
+        from pokemon_legacy.engine.pokemon.team import Team, TeamSpec
+
+        data = [{"name": "Piplup", "level": 5}, {"name": "Starly", "level": 3}]
+        spec = TeamSpec(data)
+        assert len(spec) == 2
+        assert "Piplup" in repr(spec)
+
+        team = spec.build()
+        assert isinstance(team, Team)
+        assert [pk.name for pk in team] == ["Piplup", "Starly"]
+        assert not any(pk.images_loaded for pk in team)
+
+        assert spec.build()[0] is not team[0]
+        assert data == [{"name": "Piplup", "level": 5}, {"name": "Starly", "level": 3}]
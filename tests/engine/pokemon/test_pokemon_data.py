@@ -0,0 +1,180 @@
+"""
+Tests for the compact Pokémon data model.
+
+These tests verify:
+- PokemonData is slotted and stores IVs / EVs as small arrays
+- The Pokemon view reads and writes its state through PokemonData
+- Save data round trips through PokemonData
+- Alternate forms sharing a local number keep their own species
+- Batch stat calculation and healing match the per-Pokémon versions
+- PokemonData is much smaller than a Pokemon view
+"""
+import random
+import tracemalloc
+
+import pytest
+
+MOVES = [{"name": "Tackle"}, {"name": "Growl"}]
+
+
+@pytest.fixture
+def data():
+    """Create the data of a single Pokémon."""
+    from pokemon_legacy.engine.pokemon.pokemon_data import PokemonData
+    random.seed(7)
+    return PokemonData.create("Turtwig", level=12, moves=MOVES)
+
+
+@pytest.fixture
+def box():
+    """Create the data of a box of Pokémon at different levels."""
+    from pokemon_legacy.engine.pokemon.pokemon_data import PokemonData
+    random.seed(11)
+    names = ["Turtwig", "Chimchar", "Piplup", "Starly", "Bidoof"]
+    return [
+        PokemonData.create(names[idx % len(names)], level=5 + idx, moves=MOVES, EVs=[idx, 2 * idx, 0, 4, 8, idx])
+        for idx in range(30)
+    ]
+
+
+class TestPokemonData:
+    """Test the data model on its own."""
+
+    def test_slotted(self, data):
+        """Pokémon data should not carry an instance dictionary."""
+        assert not hasattr(data, "__dict__")
+        assert data.ivs.typecode == "B" and len(data.ivs) == 6
+        assert data.evs.typecode == "H" and len(data.evs) == 6
+
+    def test_species_values(self, data):
+        """Species values should come from the records."""
+        from pokemon_legacy.engine.data.records import records
+
+        assert data.name == "Turtwig"
+        assert data.species is records.species["Turtwig"]
+        assert data.nature in records.natures
+        assert data.health == data.stats.health
+
+    def test_json_round_trip(self, data):
+        """Save data should recreate identical Pokémon data."""
+        from pokemon_legacy.engine.pokemon.pokemon_data import PokemonData
+
+        data.health -= 3
+        saved = data.get_json_data()
+        assert PokemonData.create(**saved).get_json_data() == saved
+
+    def test_level_up(self, data):
+        """Levelling up should update the stats and exp thresholds."""
+        health, level_up_exp = data.stats.health, data.level_up_exp
+        data.level_up()
+
+        assert data.level == 13
+        assert data.stats.health > health
+        assert data.level_exp == level_up_exp
+
+
+class TestPokemonView:
+    """Test the Pokemon view over its data."""
+
+    def test_reads_and_writes_data(self):
+        """Attributes of the view should be stored on the data."""
+        from pokemon_legacy.engine.pokemon.pokemon import Pokemon
+
+        pokemon = Pokemon("Piplup", level=5, moves=MOVES, lazy_load=True)
+        pokemon.health = 1
+        pokemon.EVs[0] += 4
+
+        assert pokemon.data.health == 1
+        assert pokemon.data.evs[0] == 4
+        assert pokemon.type1 == "Water"
+        assert pokemon.ability.name == pokemon.data.ability
+
+    def test_alternate_forms(self):
+        """Species that share a local number with an alternate form should keep their own species."""
+        from pokemon_legacy.engine.pokemon.pokemon import Pokemon
+        from pokemon_legacy.engine.pokemon.pokemon_data import PokemonData
+
+        for name, types in (("Geodude", ("Rock", "Ground")), ("Alakazam", ("Psychic", None)),
+                            ("Lucario", ("Fighting", "Steel"))):
+            pokemon = Pokemon(name, level=10, moves=MOVES, lazy_load=True)
+            assert pokemon.name == name
+            assert (pokemon.type1, pokemon.type2) == types
+            assert pokemon.get_json_data()["name"] == name
+            assert PokemonData.create(name, level=10, moves=MOVES).name == name
+
+        alolan = PokemonData.create("Alolan Geodude", level=10, moves=MOVES)
+        assert alolan.name == "Alolan Geodude"
+        assert alolan.species_id == PokemonData.create("Geodude", level=10, moves=MOVES).species_id
+
+    def test_from_data(self, data):
+        """A view created from data should share it."""
+        from pokemon_legacy.engine.pokemon.pokemon import Pokemon
+
+        pokemon = Pokemon.from_data(data, friendly=True)
+        assert pokemon.data is data
+        assert not pokemon.images_loaded
+
+        pokemon.restore()
+        assert data.health == data.stats.health
+        assert pokemon.get_json_data()["friendly"] is True
+
+
+class TestBatchOperations:
+    """Test operating on many Pokémon at once."""
+
+    def test_compute_stats(self, box):
+        """Batch stats should match the per-Pokémon calculation."""
+        from pokemon_legacy.engine.pokemon.pokemon_data import compute_stats
+
+        stats = compute_stats(box)
+        assert stats.shape == (len(box), 6)
+        for pk, row in zip(box, stats.tolist()):
+            assert row == pk.stats.get_values()
+
+    def test_update_stats(self, box):
+        """Batch updates should refresh each cached Stats."""
+        from pokemon_legacy.engine.pokemon.pokemon_data import update_stats
+
+        for pk in box:
+            pk.level += 1
+        update_stats(box)
+
+        for pk in box:
+            pk_stats = pk.stats.get_values()
+            pk.update_stats()
+            assert pk_stats == pk.stats.get_values()
+
+    def test_restore_all(self, box):
+        """Healing a box should restore health, status and PP."""
+        from pokemon_legacy.engine.pokemon.pokemon_data import StatusEffect, restore_all
+
+        for pk in box:
+            pk.health = 0
+            pk.status = StatusEffect.Burned
+            pk.moves[0].PP = 0
+
+        restore_all(box)
+        assert all(pk.health == pk.stats.health and pk.status is None for pk in box)
+        assert all(pk.moves[0].PP == pk.moves[0].maxPP for pk in box)
+
+
+class TestMemory:
+    """Test the memory footprint of the data model."""
+
+    def test_smaller_than_view(self):
+        """Boxed Pokémon data should be a fraction of the size of a Pokemon view."""
+        from pokemon_legacy.engine.pokemon.pokemon import Pokemon
+        from pokemon_legacy.engine.pokemon.pokemon_data import PokemonData
+
+        def measure(create):
+            create()
+            tracemalloc.start()
+            items = [create() for _ in range(100)]
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            return size / len(items)
+
+        data_size = measure(lambda: PokemonData.create("Bidoof", level=20, moves=MOVES))
+        view_size = measure(lambda: Pokemon("Bidoof", level=20, moves=MOVES, lazy_load=True))
+        assert data_size < 1024
+        assert data_size < view_size
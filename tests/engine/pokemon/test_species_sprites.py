@@ -0,0 +1,97 @@
+"""
+Tests for the sprites shared between Pokémon of the same species.
+
+These tests verify:
+- Pokémon of the same species share surfaces and masks instead of holding copies
+- Changing the opacity of one Pokémon copies its image and leaves the shared sprite untouched
+- Stat stage animations are built on first use and cached per species
+"""
+import pytest
+
+
+@pytest.fixture
+def pokemon_pair():
+    """Create two Pokémon of the same species, one on each side."""
+    from pokemon_legacy.engine.pokemon.pokemon import Pokemon
+    return Pokemon("Turtwig", level=5, shiny=False), Pokemon("Turtwig", level=7, shiny=False, friendly=True)
+
+
+@pytest.fixture
+def species_sprites():
+    """Return the shared Turtwig sprites."""
+    from pokemon_legacy.engine.data.records import records
+    from pokemon_legacy.engine.pokemon.species_sprites import SpeciesSprites
+    return SpeciesSprites.get(records.species["Turtwig"].local_id)
+
+
+class TestSharedSprites:
+    """Test sharing sprites between Pokémon."""
+
+    def test_same_species_shares_surfaces(self, pokemon_pair, species_sprites):
+        """Both Pokémon should hold the species surfaces, not copies."""
+        foe, friendly = pokemon_pair
+
+        for key in ("front", "back", "small"):
+            assert foe.images[key] is friendly.images[key]
+        assert foe.image is species_sprites.front
+        assert friendly.image is species_sprites.back
+        assert foe.sprite_mask is species_sprites.mask("front")
+        assert foe.sprite.images["front"] is friendly.sprite.images["front"]
+
+    def test_images_dict_is_per_instance(self, pokemon_pair):
+        """Replacing an image should only affect that Pokémon."""
+        foe, friendly = pokemon_pair
+        foe.image = foe.images["small"]
+
+        assert friendly.images["front"] is not foe.images["front"]
+
+    def test_opacity_copies_on_write(self, pokemon_pair, species_sprites):
+        """Fading one Pokémon should not fade the others."""
+        foe, friendly = pokemon_pair
+
+        foe.set_opacity(255)
+        assert foe.image is species_sprites.front
+
+        foe.set_opacity(0)
+        faded = foe.image
+        assert faded is not species_sprites.front
+        assert faded.get_alpha() == 0
+        assert species_sprites.front.get_alpha() == 255
+
+        foe.set_opacity(128)
+        assert foe.image is faded
+        assert faded.get_alpha() == 128
+
+    def test_alpha_is_read_only(self, species_sprites):
+        """The shared alpha mask should not be writable."""
+        alpha = species_sprites.alpha("front")
+        assert alpha.shape == species_sprites.front.get_size()[::-1]
+        with pytest.raises(ValueError):
+            alpha[0, 0] = 1
+
+
+class TestStatStageAnimations:
+    """Test the stat stage animation cache."""
+
+    def test_built_on_first_use(self):
+        """Creating a Pokémon should not build its stat stage animations."""
+        from pokemon_legacy.engine.data.records import records
+        from pokemon_legacy.engine.pokemon.pokemon import Pokemon
+        from pokemon_legacy.engine.pokemon.species_sprites import SpeciesSprites
+
+        SpeciesSprites.clear()
+        pokemon = Pokemon("Starly", level=5, shiny=False)
+        sprites = SpeciesSprites.get(records.species["Starly"].local_id, crop=False)
+        assert ("front", "raise") not in sprites._stat_animations
+
+        frames = pokemon.sprite.animations["stat_raise"]
+        assert frames
+        assert sprites._stat_animations[("front", "raise")] is frames
+
+    def test_cached_per_species(self, pokemon_pair):
+        """Pokémon of the same species on the same side should share frames."""
+        from pokemon_legacy.engine.pokemon.pokemon import Pokemon
+        foe, _ = pokemon_pair
+        other = Pokemon("Turtwig", level=9, shiny=False)
+
+        assert foe.sprite.animations["stat_lower"] is other.sprite.animations["stat_lower"]
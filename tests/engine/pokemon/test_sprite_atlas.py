@@ -0,0 +1,126 @@
+"""
+Tests for the pre-built Pokémon sprite atlas.
+
+These tests verify:
+- Atlas sprites match the images cut from the sprite sheets with cv2, cropped and uncropped
+- The atlas is keyed on the sheet content and rebuilt when it goes stale
+- Loading a built atlas does no cv2 work
+- Each request returns new surfaces
+"""
+import json
+
+import numpy as np
+import pygame as pg
+import pytest
+
+
+@pytest.fixture
+def atlas(tmp_path):
+    """Build an atlas into a temporary directory."""
+    from pokemon_legacy.engine.pokemon.sprite_atlas import SpriteAtlas
+    atlas = SpriteAtlas(atlas_dir=str(tmp_path))
+    atlas.build()
+    return atlas
+
+
+@pytest.fixture(scope="module")
+def sheets():
+    """Read the source sprite sheets."""
+    from pokemon_legacy.engine.graphics.assets import load_cv2_image
+    from pokemon_legacy.engine.pokemon.sprite_atlas import SMALL_SPRITE_SHEET, SPRITE_SHEET
+    return load_cv2_image(SPRITE_SHEET), load_cv2_image(SMALL_SPRITE_SHEET)
+
+
+def legacy_images(sheets, local_id, crop=False, shiny=False):
+    """Cut the sprites from the sheets the way Pokemon.get_images did before the atlas."""
+    from pokemon_legacy.engine.general.image_editor import ImageEditor
+    from pokemon_legacy.engine.pokemon.sprite_atlas import sheet_rects
+
+    rects = sheet_rects(local_id)
+    prefix = "shiny_" if shiny else ""
+    sprites, small_sprites = sheets
+    editor, images = ImageEditor(), {}
+    for key, variant, sheet in (
+            ("front", f"{prefix}front", sprites),
+            ("back", f"{prefix}back", sprites),
+            ("small", "small", small_sprites),
+    ):
+        x, y, w, h = rects[variant]
+        editor.loadData(sheet[y: y + h, x: x + w])
+        if crop and key != "small":
+            editor.crop_transparent_borders(overwrite=True)
+        editor.scaleImage((2, 2), overwrite=True)
+        images[key] = editor.createSurface()
+
+    return images
+
+
+def assert_same_pixels(surface, expected):
+    """Compare alpha everywhere and colour wherever the sprite is visible."""
+    assert surface.get_size() == expected.get_size()
+    alpha, expected_alpha = pg.surfarray.array_alpha(surface), pg.surfarray.array_alpha(expected)
+    assert np.array_equal(alpha, expected_alpha)
+
+    visible = expected_alpha > 0
+    assert np.array_equal(pg.surfarray.array3d(surface)[visible], pg.surfarray.array3d(expected)[visible])
+
+
+class TestSpriteAtlas:
+    """Test building and reading the sprite atlas."""
+
+    @pytest.mark.parametrize("local_id", [1, 25, 151])
+    @pytest.mark.parametrize("crop", [False, True])
+    @pytest.mark.parametrize("shiny", [False, True])
+    def test_matches_sprite_sheets(self, atlas, sheets, local_id, crop, shiny):
+        """Atlas sprites should be pixel identical to the sheet crops."""
+        images = atlas.get_images(local_id, crop=crop, shiny=shiny)
+        expected = legacy_images(sheets, local_id, crop=crop, shiny=shiny)
+
+        for key in ("front", "back", "small"):
+            assert_same_pixels(images[key], expected[key])
+
+    def test_rebuilds_when_stale(self, atlas, tmp_path):
+        """An index built from other sheets should be rebuilt on load."""
+        from pokemon_legacy.engine.pokemon.sprite_atlas import SpriteAtlas
+
+        assert atlas.is_current()
+        with open(atlas.index_path) as file:
+            index = json.load(file)
+        index["sheet_hash"] = "0" * 64
+        with open(atlas.index_path, "w") as file:
+            json.dump(index, file)
+
+        reloaded = SpriteAtlas(atlas_dir=str(tmp_path))
+        assert not reloaded.is_current()
+        assert (25, "front") in reloaded
+        assert reloaded.is_current()
+
+    def test_load_skips_cv2(self, atlas, tmp_path, monkeypatch):
+        """Reading sprites from a built atlas should not touch cv2."""
+        import cv2
+        from pokemon_legacy.engine.pokemon.sprite_atlas import SpriteAtlas
+
+        def fail(*args, **kwargs):
+            raise AssertionError("cv2 used when loading the atlas")
+
+        for name in ("imread", "resize", "findNonZero", "boundingRect"):
+            monkeypatch.setattr(cv2, name, fail)
+
+        reloaded = SpriteAtlas(atlas_dir=str(tmp_path))
+        images = reloaded.get_images(25, crop=True)
+        assert images["front"].get_width() > 0
+
+    def test_returns_new_surfaces(self, atlas):
+        """Drawing on a returned sprite should not change later requests."""
+        first = atlas.get(25, "front", crop=True)
+        first.fill((255, 0, 0, 255))
+
+        second = atlas.get(25, "front", crop=True)
+        assert second is not first
+        assert second.get_at((0, 0)) != pg.Color(255, 0, 0, 255)
+
+    def test_unsupported_scale(self, tmp_path):
+        """Only the scales the atlas is built for can be requested."""
+        from pokemon_legacy.engine.pokemon.sprite_atlas import SpriteAtlas
+        with pytest.raises(ValueError):
+            SpriteAtlas(scale=3, atlas_dir=str(tmp_path))